@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/crud_dispatch.py
+
+Benchmarks the CRUD dispatch hot path against synthetic in-process entity
+modules and compares the results with a JSON baseline.
+
+Usage: python benchmarks/crud_dispatch.py [--update-baseline]
+"""
+
+from argparse import ArgumentParser
+from os import makedirs, path, symlink
+from statistics import median
+from tempfile import TemporaryDirectory
+from timeit import Timer
+import json
+import platform
+import sys
+
+BASELINE_FILE_PATH = path.join(path.dirname(path.abspath(__file__)), "crud_dispatch_baseline.json")
+"""
+Default JSON baseline file path
+"""
+
+BENCHMARK_PACKAGE_NAME = "pas_crud_benchmark"
+"""
+Package name of the synthetic CRUD entity modules
+"""
+
+BENCHMARK_ENTITY_SOURCE = """
+from pas_crud_engine.instances import Abstract
+
+class Item(Abstract):
+    def get(self, _select_id = None, _selected_value = None, **kwargs):
+        return _select_id
+    #
+
+    def get_tags(self, _select_id = None, _selected_value = None, **kwargs):
+        return _selected_value
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        return { "id": _select_id }
+    #
+
+    def select_parts(self, _select_id = None, _selected_value = None, **kwargs):
+        return ( _selected_value, _select_id )
+    #
+#
+"""
+"""
+Source of the synthetic CRUD entity module
+"""
+
+DEFAULT_THRESHOLD = 0.25
+"""
+Default relative slowdown tolerated before a case is reported as regressed
+"""
+
+class _Callee(object):
+    """
+Callee providing "pre_*" and "post_*" methods for "CallContext".
+    """
+
+    def post_get(self, **kwargs): pass
+    def pre_get(self): pass
+#
+
+def init_benchmark_path(base_path, entity_sources = None):
+    """
+Writes the synthetic CRUD entity modules to the given directory and appends
+it to "sys.path".
+
+The engine package is linked into the same directory because the module
+loader resolves "crud" namespace lookups against the last matching
+"sys.path" entry.
+
+:param base_path: Temporary directory path
+:param entity_sources: Dict of entity module names and sources; None for
+                       the default "item" entity
+
+:since: v1.0.0
+    """
+
+    import pas_crud_engine
+
+    if (entity_sources is None): entity_sources = { "item": BENCHMARK_ENTITY_SOURCE }
+
+    instances_path = path.join(base_path, BENCHMARK_PACKAGE_NAME, "crud", "instances", "benchmark")
+    makedirs(instances_path)
+
+    for package_path in ( path.join(base_path, BENCHMARK_PACKAGE_NAME),
+                          path.join(base_path, BENCHMARK_PACKAGE_NAME, "crud"),
+                          path.join(base_path, BENCHMARK_PACKAGE_NAME, "crud", "instances"),
+                          instances_path
+                        ):
+        with open(path.join(package_path, "__init__.py"), "w"): pass
+    #
+
+    for module_name, source in entity_sources.items():
+        with open(path.join(instances_path, "{0}.py".format(module_name)), "w") as file_obj: file_obj.write(source)
+    #
+
+    symlink(path.dirname(path.abspath(pas_crud_engine.__file__)), path.join(base_path, "pas_crud_engine"))
+    sys.path.append(base_path)
+#
+
+def get_cases():
+    """
+Returns the benchmark cases.
+
+:return: (dict) Dict of case names and callables
+:since:  v1.0.0
+    """
+
+    # pylint: disable=import-outside-toplevel
+
+    from dpt_module_loader import NamedClassLoader
+    from pas_crud_engine import Instrumentation, Resource
+    from pas_crud_engine.access_controls.permissive_validator import PermissiveValidator
+    from pas_crud_engine.access_controls.rules_validator import RulesValidator
+    from pas_crud_engine.instances import FlatFilterParser
+    from pas_crud_engine.instances.filters import FilterOptimizer
+    from pas_crud_engine.protocol import CallContext
+
+    resource = Resource("benchmark/item/1")
+    route_cache = Resource.get_route_cache()
+
+    small_filter_string = json.dumps({ "id": 1, "name": "item" })
+    deep_filter = 1
+
+    for level in range(16): deep_filter = { "level{0:d}".format(level): deep_filter, "value{0:d}".format(level): level }
+    deep_filter_string = json.dumps(deep_filter)
+
+    large_or_filter = FlatFilterParser(json.dumps({ "id": list(range(100000, 0, -1)) })).filter
+
+    validator = PermissiveValidator()
+    validator.blacklisted_operations = [ "benchmark.item.operation_{0:d}".format(index) for index in range(10000) ]
+    rules_validator = RulesValidator([ { "pattern": "benchmark.entity_{0:d}.*.delete".format(index), "effect": "deny" } for index in range(1000) ]
+                                     + [ { "pattern": "benchmark.**", "effect": "allow" } ]
+                                    )
+
+    validated_instance = NamedClassLoader.get_class_in_namespace("crud", "instances.benchmark.Item")()
+
+    callee = _Callee()
+    reused_call_context = CallContext(callee, "get")
+    reused_call_context_without_hooks = CallContext(object(), "get")
+
+    def resource_construction_uncached():
+        route_cache.clear()
+        Resource("benchmark/item/1")
+    #
+
+    def filter_parser_cold(filter_string):
+        FlatFilterParser.invalidate_parsed_filters(filter_string)
+        return FlatFilterParser(filter_string).filter
+    #
+
+    filter_optimizer = FilterOptimizer(dict(( "level{0:d}".format(level), { "cardinality": 10 * (level + 1), "is_indexed": (level % 4 == 0) } )
+                                            for level in range(16)
+                                           ))
+
+    def filter_optimizer_cold(filter_string):
+        filter_optimizer.cache.clear()
+        return FlatFilterParser(filter_string).get_optimized_ast(filter_optimizer)
+    #
+
+    def filter_parser_normalized_hash_cold(filter_string):
+        FlatFilterParser.invalidate_parsed_filters(filter_string)
+        return FlatFilterParser(filter_string).normalized_hash
+    #
+
+    def call_context_with_callee():
+        with CallContext(callee, "get"): pass
+    #
+
+    def call_context_without_callee():
+        with CallContext(None, "get"): pass
+    #
+
+    def call_context_reused_with_callee():
+        with reused_call_context: pass
+    #
+
+    def call_context_reused_without_hooks():
+        with reused_call_context_without_hooks: pass
+    #
+
+    def resource_call_instrumented():
+        Instrumentation.enable()
+        try: resource.call("get")
+        finally: Instrumentation.disable()
+    #
+
+    return { "resource_construction_cached": lambda: Resource("benchmark/item/1"),
+             "resource_construction_uncached": resource_construction_uncached,
+             "resource_call": lambda: resource.call("get"),
+             "resource_call_getattr_proxy": lambda: resource.get(),
+             "resource_call_instrumented": resource_call_instrumented,
+             "call_stack_single_selector": lambda: Resource("benchmark/item/1").get(),
+             "call_stack_multi_selector": lambda: Resource("benchmark/item/1/parts/2/tags").get(),
+             "call_context_with_callee": call_context_with_callee,
+             "call_context_without_callee": call_context_without_callee,
+             "call_context_reused_with_callee": call_context_reused_with_callee,
+             "call_context_reused_without_hooks": call_context_reused_without_hooks,
+             "filter_parser_small_cold": lambda: filter_parser_cold(small_filter_string),
+             "filter_parser_small_cached": lambda: FlatFilterParser(small_filter_string).filter,
+             "filter_parser_deep_cold": lambda: filter_parser_cold(deep_filter_string),
+             "filter_parser_deep_cached": lambda: FlatFilterParser(deep_filter_string).filter,
+             "filter_parser_deep_normalized_hash_cold": lambda: filter_parser_normalized_hash_cold(deep_filter_string),
+             "filter_parser_deep_normalized_hash_cached": lambda: FlatFilterParser(deep_filter_string).normalized_hash,
+             "filter_optimizer_deep_cold": lambda: filter_optimizer_cold(deep_filter_string),
+             "filter_optimizer_deep_cached": lambda: FlatFilterParser(deep_filter_string).get_optimized_ast(filter_optimizer),
+             "filter_or_list_membership": lambda: 50000 in large_or_filter['id'],
+             "permissive_validator_large_blacklist": lambda: validator.validate(validated_instance, "benchmark.item.get"),
+             "rules_validator_many_rules": lambda: rules_validator.validate(validated_instance, "benchmark.item.get")
+           }
+#
+
+def get_regressions(results, baseline, threshold):
+    """
+Returns the cases slower than the baseline by more than the given
+threshold.
+
+:param results: Dict of case names and results
+:param baseline: Baseline data
+:param threshold: Relative slowdown tolerated
+
+:return: (list) List of tuples of case name, baseline and current
+         nanoseconds per call
+:since:  v1.0.0
+    """
+
+    _return = [ ]
+    baseline_cases = baseline.get("cases", { })
+
+    for name in sorted(results):
+        if (name in baseline_cases):
+            baseline_value = baseline_cases[name]['ns_per_call']
+            value = results[name]['ns_per_call']
+
+            if (value > baseline_value * (1 + baseline_cases[name].get("threshold", threshold))):
+                _return.append(( name, baseline_value, value ))
+            #
+        #
+    #
+
+    return _return
+#
+
+def run_case(_callable, repeat):
+    """
+Runs the given case and returns its timings. The number of calls per
+measurement is calibrated to take at least 0.2 seconds.
+
+:param _callable: Benchmarked callable
+:param repeat: Number of measurements
+
+:return: (dict) Case result
+:since:  v1.0.0
+    """
+
+    timer = Timer(_callable)
+    number, _ = timer.autorange()
+
+    timings = [ (duration * 1000000000 / number) for duration in timer.repeat(repeat, number) ]
+
+    return { "ns_per_call": round(min(timings), 1),
+             "median_ns_per_call": round(median(timings), 1),
+             "calls_per_measurement": number
+           }
+#
+
+def main():
+    """
+Runs the benchmark cases and compares them with the JSON baseline.
+
+:return: (int) Exit code
+:since:  v1.0.0
+    """
+
+    argument_parser = ArgumentParser(description = "Benchmarks the CRUD dispatch hot path")
+    argument_parser.add_argument("--baseline", default = BASELINE_FILE_PATH, help = "JSON baseline file path")
+    argument_parser.add_argument("--case", action = "append", dest = "cases", help = "Case to run; all if not given")
+    argument_parser.add_argument("--repeat", default = 5, type = int, help = "Number of measurements per case")
+    argument_parser.add_argument("--threshold", default = None, type = float, help = "Relative slowdown tolerated")
+    argument_parser.add_argument("--update-baseline", action = "store_true", help = "Write results as the new baseline")
+
+    args = argument_parser.parse_args()
+
+    baseline = { }
+
+    if (path.exists(args.baseline)):
+        with open(args.baseline, "r") as file_obj: baseline = json.load(file_obj)
+    #
+
+    threshold = (baseline.get("threshold", DEFAULT_THRESHOLD) if (args.threshold is None) else args.threshold)
+
+    with TemporaryDirectory() as base_path:
+        init_benchmark_path(base_path)
+        cases = get_cases()
+
+        if (args.cases is not None):
+            unknown_cases = [ name for name in args.cases if name not in cases ]
+            if (len(unknown_cases) > 0): argument_parser.error("Unknown cases: {0}".format(", ".join(unknown_cases)))
+
+            cases = dict(( name, cases[name] ) for name in args.cases)
+        #
+
+        results = { }
+
+        for name in cases:
+            results[name] = run_case(cases[name], args.repeat)
+            print("{0:<40} {1:>12.1f} ns/call".format(name, results[name]['ns_per_call']))
+        #
+    #
+
+    if (args.update_baseline):
+        baseline = { "python": platform.python_version(),
+                     "platform": platform.platform(),
+                     "threshold": threshold,
+                     "cases": dict(( name, { "ns_per_call": results[name]['ns_per_call'] } ) for name in sorted(results))
+                   }
+
+        with open(args.baseline, "w") as file_obj:
+            json.dump(baseline, file_obj, indent = 4, sort_keys = True)
+            file_obj.write("\n")
+        #
+
+        _return = 0
+    else:
+        regressions = get_regressions(results, baseline, threshold)
+
+        for name, baseline_value, value in regressions:
+            print("Regression: {0} {1:.1f} ns/call (baseline {2:.1f} ns/call)".format(name, value, baseline_value))
+        #
+
+        _return = (1 if (len(regressions) > 0) else 0)
+    #
+
+    return _return
+#
+
+if (__name__ == "__main__"): sys.exit(main())
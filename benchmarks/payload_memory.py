@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/payload_memory.py
+
+Measures the peak memory growth of passing a large file as "create" payload
+to a CRUD entity instance supporting "zero_copy_payloads". The file is
+mapped into memory and passed as a view; the peak anonymous resident set
+size is expected to stay flat regardless of the payload size.
+
+Usage: python benchmarks/payload_memory.py [--size MIB] [--compare-bytes]
+"""
+
+from argparse import ArgumentParser
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter
+import resource
+import sys
+
+from crud_dispatch import init_benchmark_path
+
+BLOB_ENTITY_SOURCE = """
+from zlib import crc32
+
+from pas_crud_engine.instances import Abstract
+
+class Blob(Abstract):
+    def __init__(self):
+        Abstract.__init__(self)
+        self.supported_features['zero_copy_payloads'] = True
+    #
+
+    def create(self, _select_id = None, _selected_value = None, data = None, **kwargs):
+        checksum = 0
+
+        for offset in range(0, len(data), 1048576): checksum = crc32(data[offset:offset + 1048576], checksum)
+
+        return ( checksum, type(data).__name__ )
+    #
+#
+"""
+"""
+Source of the synthetic CRUD entity module consuming payloads in chunks
+"""
+
+DEFAULT_MAX_GROWTH_MIB = 64
+"""
+Default peak anonymous memory growth in MiB tolerated for mapped payloads
+"""
+
+def get_anonymous_rss():
+    """
+Returns the anonymous resident set size of this process. The maximum
+resident set size is returned if "/proc" is not available.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+    """
+
+    _return = None
+
+    if (path.exists("/proc/self/status")):
+        with open("/proc/self/status", "r") as file_obj:
+            for line in file_obj:
+                if (line.startswith("RssAnon:")):
+                    _return = int(line.split()[1]) * 1024
+                    break
+                #
+            #
+        #
+    #
+
+    if (_return is None): _return = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if (sys.platform == "darwin") else 1024)
+
+    return _return
+#
+
+def run_case(_callable):
+    """
+Runs the given case while sampling the anonymous resident set size.
+
+:param _callable: Benchmarked callable creating and passing the payload
+
+:return: (dict) Case result
+:since:  v1.0.0
+    """
+
+    baseline = get_anonymous_rss()
+    peak = [ baseline ]
+    is_finished = Event()
+
+    def sample():
+        while (not is_finished.wait(0.005)): peak[0] = max(peak[0], get_anonymous_rss())
+    #
+
+    sampler = Thread(target = sample, daemon = True)
+    sampler.start()
+
+    started = perf_counter()
+
+    try: result = _callable()
+    finally:
+        is_finished.set()
+        sampler.join()
+    #
+
+    return { "seconds": perf_counter() - started,
+             "peak_growth": max(peak[0], get_anonymous_rss()) - baseline,
+             "result": result
+           }
+#
+
+def main():
+    """
+Runs the payload memory cases.
+
+:return: (int) Exit code
+:since:  v1.0.0
+    """
+
+    argument_parser = ArgumentParser(description = "Measures the peak memory growth of large CRUD payloads")
+    argument_parser.add_argument("--compare-bytes", action = "store_true", help = "Also pass the file read into a bytes copy")
+    argument_parser.add_argument("--max-growth", default = DEFAULT_MAX_GROWTH_MIB, type = int, help = "Peak growth in MiB tolerated for mapped payloads")
+    argument_parser.add_argument("--size", default = 1024, type = int, help = "Payload size in MiB")
+
+    args = argument_parser.parse_args()
+
+    with TemporaryDirectory() as base_path:
+        init_benchmark_path(base_path, { "blob": BLOB_ENTITY_SOURCE })
+
+        # pylint: disable=import-outside-toplevel
+
+        from pas_crud_engine import Resource
+
+        payload_file_path = path.join(base_path, "payload.bin")
+
+        with open(payload_file_path, "wb") as file_obj: file_obj.truncate(args.size * 1048576)
+
+        blob = Resource("benchmark/blob")
+
+        def read_bytes_payload():
+            with open(payload_file_path, "rb") as file_obj: return blob.create(data = file_obj.read())
+        #
+
+        cases = { "mapped_file_zero_copy": lambda: blob.create(data = Resource.map_file_payload(payload_file_path)) }
+        if (args.compare_bytes): cases['read_bytes_copy'] = read_bytes_payload
+
+        results = { }
+
+        for name in cases:
+            results[name] = run_case(cases[name])
+
+            print("{0:<40} {1:>10.1f} MiB peak growth {2:>8.2f} s ({3})".format(name,
+                                                                              results[name]['peak_growth'] / 1048576,
+                                                                              results[name]['seconds'],
+                                                                              results[name]['result'][1]
+                                                                             ))
+        #
+    #
+
+    _return = 0
+
+    if (results['mapped_file_zero_copy']['peak_growth'] > args.max_growth * 1048576):
+        print("Regression: mapped payload peak growth exceeds {0:d} MiB".format(args.max_growth))
+        _return = 1
+    #
+
+    return _return
+#
+
+if (__name__ == "__main__"): sys.exit(main())
@@ -17,10 +17,16 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from .access_denied_exception import AccessDeniedException
-from .input_validation_exception import InputValidationException
-from .nothing_matched_exception import NothingMatchedException
-from .operation_failed_exception import OperationFailedException
-from .operation_not_supported_exception import OperationNotSupportedException
-from .resource import Resource
-from .update_conflict_exception import UpdateConflictException
+from .lazy_module_attributes import LazyModuleAttributes as _LazyModuleAttributes
+
+_LazyModuleAttributes.install(globals(),
+                              { "AccessDeniedException": "access_denied_exception",
+                                "InputValidationException": "input_validation_exception",
+                                "Instrumentation": "instrumentation",
+                                "NothingMatchedException": "nothing_matched_exception",
+                                "OperationFailedException": "operation_failed_exception",
+                                "OperationNotSupportedException": "operation_not_supported_exception",
+                                "Resource": "resource",
+                                "UpdateConflictException": "update_conflict_exception"
+                              }
+                             )
@@ -17,5 +17,12 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from .abstract import Abstract
-from .permissive_validator import PermissiveValidator
+from ..lazy_module_attributes import LazyModuleAttributes as _LazyModuleAttributes
+
+_LazyModuleAttributes.install(globals(),
+                              { "Abstract": "abstract",
+                                "CachingValidator": "caching_validator",
+                                "PermissiveValidator": "permissive_validator",
+                                "RulesValidator": "rules_validator"
+                              }
+                             )
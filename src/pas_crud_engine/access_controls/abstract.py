@@ -17,9 +17,13 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from functools import wraps
+
 from dpt_runtime.not_implemented_exception import NotImplementedException
 from dpt_runtime.supports_mixin import SupportsMixin
 
+from ..instrumentation import Instrumentation
+
 class Abstract(SupportsMixin):
     """
 "Abstract" provides common methods for the "AccessControlValidator"
@@ -55,4 +59,33 @@ instance specific data given.
 
         raise NotImplementedException()
     #
+
+    @staticmethod
+    def measure_validation(_callable):
+        """
+Records calls of the wrapped "validate()" method if instrumentation is
+enabled.
+
+:param _callable: Wrapped code
+
+:return: (object) Proxy method
+:since:  v1.0.0
+    """
+
+        @wraps(_callable)
+        def proxymethod(self, crud_instance, operation, **kwargs):
+            return (_callable(self, crud_instance, operation, **kwargs)
+                    if (not Instrumentation.is_enabled()) else
+                    Instrumentation.call(Instrumentation.get_class_entity_names(crud_instance.__class__) + ( operation, "access_control" ),
+                                         _callable,
+                                         self,
+                                         crud_instance,
+                                         operation,
+                                         **kwargs
+                                        )
+                   )
+        #
+
+        return proxymethod
+    #
 #
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.type_exception import TypeException
+
+from ..access_denied_exception import AccessDeniedException
+from ..lru_cache import LruCache
+from .abstract import Abstract
+
+class CachingValidator(Abstract):
+    """
+The "CachingValidator" memoises the allow or deny decisions of the wrapped
+validator per principal, CRUD entity class and operation. Only validators
+with decisions independent of CRUD entity instance specific data should be
+wrapped. Calls are recorded by the wrapped validator only if a decision is
+not cached.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    ALL = object()
+    """
+Matches all values if given to "revoke()"
+    """
+
+    __slots__ = [ "_decisions", "_principal_callback", "_validator" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, validator, principal_callback, max_size = 4096, ttl = 60):
+        """
+Constructor __init__(CachingValidator)
+
+:param validator: Wrapped validator
+:param principal_callback: Python callable called with the CRUD entity
+                           instance and keyword arguments returning the
+                           hashable principal the decision applies to
+:param max_size: Maximum number of decisions cached
+:param ttl: Time to live of decisions in seconds; None if decisions should
+            only expire if revoked
+
+:since: v1.0.0
+        """
+
+        if (not isinstance(validator, Abstract)): raise TypeException("Validator given is invalid")
+        if (not callable(principal_callback)): raise TypeException("Principal callback given is invalid")
+
+        Abstract.__init__(self)
+
+        self._decisions = LruCache(max_size, ttl)
+        """
+Cached decisions as denial messages; None if access was allowed
+        """
+        self._principal_callback = principal_callback
+        """
+Python callable returning the principal
+        """
+        self._validator = validator
+        """
+Wrapped validator
+        """
+
+        self.supported_features['decision_caching'] = True
+    #
+
+    @property
+    def statistics(self):
+        """
+Returns the decision cache statistics.
+
+:return: (dict) Decision cache statistics
+:since:  v1.0.0
+        """
+
+        return self._decisions.statistics
+    #
+
+    @property
+    def validator(self):
+        """
+Returns the wrapped validator.
+
+:return: (object) Wrapped validator
+:since:  v1.0.0
+        """
+
+        return self._validator
+    #
+
+    def clear(self):
+        """
+Removes all cached decisions.
+
+:since: v1.0.0
+        """
+
+        self._decisions.clear()
+    #
+
+    def revoke(self, principal = ALL, instance_class = ALL, operation = ALL):
+        """
+Removes cached decisions matching the given principal, CRUD entity class
+and operation.
+
+:param principal: Principal; "ALL" for all principals
+:param instance_class: CRUD entity class; "ALL" for all classes
+:param operation: CRUD operation including module and instance name; "ALL"
+                  for all operations
+
+:return: (int) Number of decisions removed
+:since:  v1.0.0
+        """
+
+        criteria = tuple(( index, value )
+                         for index, value in enumerate(( principal, instance_class, operation ))
+                         if value is not CachingValidator.ALL
+                        )
+
+        return self._decisions.remove_matching(lambda key: all((key[index] == value) for index, value in criteria))
+    #
+
+    def validate(self, crud_instance, operation, **kwargs):
+        """
+Validate access permissions for the requested operation and CRUD entity
+instance specific data given.
+
+:param crud_instance: CRUD entity instance
+:param operation: CRUD operation requested including module and instance
+       name
+
+:since: v1.0.0
+        """
+
+        key = ( self._principal_callback(crud_instance, **kwargs), crud_instance.__class__, operation )
+
+        decision = self._decisions.get(key, CachingValidator.ALL)
+
+        if (decision is CachingValidator.ALL):
+            try:
+                self._validator.validate(crud_instance, operation, **kwargs)
+                decision = None
+            except AccessDeniedException as handled_exception:
+                self._decisions.set(key, (handled_exception.args[0] if (len(handled_exception.args) > 0) else "Element operation denied access"))
+                raise
+            #
+
+            self._decisions.set(key, decision)
+        elif (decision is not None): raise AccessDeniedException(decision)
+    #
+#
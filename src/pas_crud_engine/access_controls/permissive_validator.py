@@ -17,6 +17,8 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+import re
+
 from dpt_runtime.type_exception import TypeException
 
 from .abstract import Abstract
@@ -25,7 +27,8 @@ from ..access_denied_exception import AccessDeniedException
 class PermissiveValidator(Abstract):
     """
 The "PermissiveValidator" allows access as long as the requested operation
-is not blacklisted.
+is not blacklisted. Blacklisted operations may contain "*" wildcards
+matching any sequence of characters, e.g. "shop.order.*".
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -36,7 +39,7 @@ is not blacklisted.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "_blacklisted_operations" ]
+    __slots__ = [ "_blacklisted_operation_pattern", "_blacklisted_operation_set", "_blacklisted_operations" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -51,7 +54,15 @@ Constructor __init__(PermissiveValidator)
 
         Abstract.__init__(self)
 
-        self._blacklisted_operations = [ ]
+        self._blacklisted_operation_pattern = None
+        """
+Compiled pattern of blacklisted operations containing wildcards
+        """
+        self._blacklisted_operation_set = frozenset()
+        """
+Blacklisted operations without wildcards
+        """
+        self._blacklisted_operations = ( )
         """
 Blacklisted operations which will cause an "AccessDeniedException".
         """
@@ -62,31 +73,43 @@ Blacklisted operations which will cause an "AccessDeniedException".
     @property
     def blacklisted_operations(self):
         """
-Returns a list of blacklisted operations which will cause an
-"AccessDeniedException".
+Returns a copy of the list of blacklisted operations which will cause an
+"AccessDeniedException". Blacklisted operations are compiled on assignment;
+changes to the list returned have no effect until it is set again.
 
-:return: (List) Blacklisted operations
+:return: (list) Blacklisted operations
 :since:  v1.0.0
         """
 
-        return self._blacklisted_operations
+        return list(self._blacklisted_operations)
     #
 
     @blacklisted_operations.setter
     def blacklisted_operations(self, operations):
         """
 Sets the list of blacklisted operations which will cause an
-"AccessDeniedException".
+"AccessDeniedException". The list given is copied.
 
 :param operations: List of blacklisted operations
 
 :since: v1.0.0
         """
 
-        if (not isinstance(operations, list)): raise TypeException("List of blacklisted operations given is invalid")
+        if (not isinstance(operations, ( list, tuple ))): raise TypeException("List of blacklisted operations given is invalid")
+        operations = tuple(operations)
+
+        wildcard_operations = [ operation for operation in operations if "*" in operation ]
+
+        self._blacklisted_operation_pattern = (None
+                                               if (len(wildcard_operations) < 1) else
+                                               re.compile("|".join(re.escape(operation).replace("\\*", ".*") for operation in wildcard_operations))
+                                              )
+
+        self._blacklisted_operation_set = frozenset(operation for operation in operations if "*" not in operation)
         self._blacklisted_operations = operations
     #
 
+    @Abstract.measure_validation
     def validate(self, crud_instance, operation, **kwargs):
         """
 Validate access permissions for the requested operation and CRUD entity
@@ -99,6 +122,10 @@ instance specific data given.
 :since: v1.0.0
         """
 
-        if (operation in self._blacklisted_operations): raise AccessDeniedException("Operation '{0}' is blacklisted".format(operation))
+        if (operation in self._blacklisted_operation_set
+            or (self._blacklisted_operation_pattern is not None
+                and self._blacklisted_operation_pattern.fullmatch(operation) is not None
+               )
+           ): raise AccessDeniedException("Operation '{0}' is blacklisted".format(operation))
     #
 #
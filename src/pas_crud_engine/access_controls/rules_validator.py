@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.type_exception import TypeException
+from dpt_runtime.value_exception import ValueException
+from dpt_threading.thread_lock import ThreadLock
+
+from ..access_denied_exception import AccessDeniedException
+from .abstract import Abstract
+
+class RulesValidator(Abstract):
+    """
+The "RulesValidator" allows or denies access based on operation rules.
+Rules are given as dicts with a "pattern" of dot separated operation
+elements, an "effect" of "allow" or "deny" and an optional integer
+"priority". The pattern element "*" matches exactly one element and "**"
+matches any number of elements, e.g. "shop.order.*.delete".
+
+Rules are compiled into a trie once. The matching rule with the highest
+priority wins; "deny" wins against "allow" rules of the same priority.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    EFFECT_ALLOW = "allow"
+    """
+Rule effect allowing access
+    """
+    EFFECT_DENY = "deny"
+    """
+Rule effect denying access
+    """
+
+    __slots__ = [ "_compiled_rules", "_hits_lock", "_is_default_allowed" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, rules = None, is_default_allowed = False):
+        """
+Constructor __init__(RulesValidator)
+
+:param rules: List of rule dicts
+:param is_default_allowed: True to allow operations not matching any rule
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self._compiled_rules = None
+        """
+Tuple of trie root node, rules and hit counters replaced as a whole
+        """
+        self._hits_lock = ThreadLock()
+        """
+Thread safety lock for hit counters
+        """
+        self._is_default_allowed = is_default_allowed
+        """
+True to allow operations not matching any rule
+        """
+
+        self.rules = ([ ] if (rules is None) else rules)
+
+        self.supported_features['rules'] = True
+    #
+
+    @property
+    def rules(self):
+        """
+Returns the list of rule dicts compiled.
+
+:return: (list) List of rule dicts
+:since:  v1.0.0
+        """
+
+        return [ RulesValidator._get_rule_dict(compiled_rule) for compiled_rule in self._compiled_rules[1] ]
+    #
+
+    @rules.setter
+    def rules(self, rules):
+        """
+Compiles and sets the list of rule dicts. The compiled rule set is replaced
+atomically and hit counters are reset.
+
+:param rules: List of rule dicts
+
+:since: v1.0.0
+        """
+
+        self._compiled_rules = RulesValidator._compile_rules(rules)
+    #
+
+    @property
+    def statistics(self):
+        """
+Returns the hit counters of the rules compiled and the number of operations
+not matching any rule.
+
+:return: (dict) Rule statistics
+:since:  v1.0.0
+        """
+
+        compiled_rules = self._compiled_rules
+        rules = [ RulesValidator._get_rule_dict(compiled_rule) for compiled_rule in compiled_rules[1] ]
+
+        with self._hits_lock: hits = list(compiled_rules[2])
+
+        for index, rule in enumerate(rules): rule['hits'] = hits[index]
+
+        return { "rules": rules, "unmatched": hits[-1] }
+    #
+
+    def get_matching_rule(self, operation):
+        """
+Returns the rule deciding access for the given operation.
+
+:param operation: CRUD operation including module and instance name
+
+:return: (dict) Rule dict; None if no rule matches
+:since:  v1.0.0
+        """
+
+        compiled_rules = self._compiled_rules
+        rule_index = RulesValidator._get_matching_rule_index(compiled_rules, operation)
+
+        return (None if (rule_index is None) else RulesValidator._get_rule_dict(compiled_rules[1][rule_index]))
+    #
+
+    @Abstract.measure_validation
+    def validate(self, crud_instance, operation, **kwargs):
+        """
+Validate access permissions for the requested operation and CRUD entity
+instance specific data given.
+
+:param crud_instance: CRUD entity instance
+:param operation: CRUD operation requested including module and instance
+       name
+
+:since: v1.0.0
+        """
+
+        compiled_rules = self._compiled_rules
+        rule_index = RulesValidator._get_matching_rule_index(compiled_rules, operation)
+
+        with self._hits_lock: compiled_rules[2][-1 if (rule_index is None) else rule_index] += 1
+
+        if (rule_index is None):
+            if (not self._is_default_allowed): raise AccessDeniedException("Operation '{0}' is not allowed by any rule".format(operation))
+        elif (compiled_rules[1][rule_index][1]):
+            raise AccessDeniedException("Operation '{0}' is denied by rule '{1}'".format(operation, compiled_rules[1][rule_index][0]))
+        #
+    #
+
+    @staticmethod
+    def _compile_rules(rules):
+        """
+Compiles the given list of rule dicts into a trie. Each trie node is a list
+of child nodes by pattern element, the index of the preferred rule ending
+at the node, a flag set for "**" nodes and the list of nodes reachable
+without reading an element.
+
+:param rules: List of rule dicts
+
+:return: (tuple) Tuple of trie root node, rules and hit counters
+:since:  v1.0.0
+        """
+
+        if (not isinstance(rules, list)): raise TypeException("List of rules given is invalid")
+
+        root = [ { }, None, False, [ ] ]
+        compiled_rules = [ ]
+
+        for rule in rules:
+            if (not isinstance(rule, dict) or type(rule.get("pattern")) is not str): raise TypeException("Rule given is invalid")
+
+            effect = rule.get("effect", RulesValidator.EFFECT_DENY)
+            priority = rule.get("priority", 0)
+
+            if (effect not in ( RulesValidator.EFFECT_ALLOW, RulesValidator.EFFECT_DENY )): raise ValueException("Rule effect given is invalid")
+            if (type(priority) is not int): raise ValueException("Rule priority given is invalid")
+
+            compiled_rule = ( rule['pattern'], (effect == RulesValidator.EFFECT_DENY), priority )
+            node = root
+
+            for element in compiled_rule[0].split("."):
+                if (element not in node[0]): node[0][element] = [ { }, None, (element == "**"), [ ] ]
+                node = node[0][element]
+            #
+
+            if (node[1] is None
+                or compiled_rule[2:0:-1] > compiled_rules[node[1]][2:0:-1]
+               ): node[1] = len(compiled_rules)
+
+            compiled_rules.append(compiled_rule)
+        #
+
+        RulesValidator._init_trie_node_closures(root)
+
+        return ( root, tuple(compiled_rules), [ 0 ] * (len(compiled_rules) + 1) )
+    #
+
+    @staticmethod
+    def _get_matching_rule_index(compiled_rules, operation):
+        """
+Returns the index of the preferred rule matching the given operation. The
+trie is traversed once for all nodes reachable with the operation elements
+read so far.
+
+:param compiled_rules: Tuple of trie root node, rules and hit counters
+:param operation: CRUD operation including module and instance name
+
+:return: (int) Rule index; None if no rule matches
+:since:  v1.0.0
+        """
+
+        _return = None
+        nodes = compiled_rules[0][3]
+
+        for element in operation.split("."):
+            next_nodes = [ ]
+
+            for node in nodes:
+                if (node[2]): next_nodes.append(node)
+
+                child_node = node[0].get(element)
+                if (child_node is not None): next_nodes += child_node[3]
+
+                child_node = node[0].get("*")
+                if (child_node is not None): next_nodes += child_node[3]
+            #
+
+            if (len(next_nodes) < 1): break
+
+            nodes = (next_nodes
+                     if (len(next_nodes) < 2) else
+                     list({ id(node): node for node in next_nodes }.values())
+                    )
+        else:
+            rules = compiled_rules[1]
+
+            for node in nodes:
+                if (node[1] is not None
+                    and (_return is None or rules[node[1]][2:0:-1] > rules[_return][2:0:-1])
+                   ): _return = node[1]
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_rule_dict(compiled_rule):
+        """
+Returns the rule dict for the given compiled rule.
+
+:param compiled_rule: Tuple of pattern, deny flag and priority
+
+:return: (dict) Rule dict
+:since:  v1.0.0
+        """
+
+        return { "pattern": compiled_rule[0],
+                 "effect": (RulesValidator.EFFECT_DENY if (compiled_rule[1]) else RulesValidator.EFFECT_ALLOW),
+                 "priority": compiled_rule[2]
+               }
+    #
+
+    @staticmethod
+    def _init_trie_node_closures(node):
+        """
+Sets the list of trie nodes reachable without reading an element for the
+given node and its children. These are the node itself and its chain of
+"**" child nodes.
+
+:param node: Trie node
+
+:since: v1.0.0
+        """
+
+        closure_node = node
+
+        while (closure_node is not None):
+            node[3].append(closure_node)
+            closure_node = closure_node[0].get("**")
+        #
+
+        for child_node in node[0].values(): RulesValidator._init_trie_node_closures(child_node)
+    #
+#
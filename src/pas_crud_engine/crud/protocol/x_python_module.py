@@ -17,14 +17,27 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from copy import deepcopy
+from functools import partial
+from inspect import isasyncgenfunction, isawaitable, iscoroutinefunction, isgenerator, isgeneratorfunction
+from mmap import mmap
 import re
+import sys
+
+try: from collections.abc import AsyncIterator, Iterator
+except ImportError: from collections import AsyncIterator, Iterator
 
 from dpt_module_loader import NamedClassLoader
 from dpt_runtime.input_filter import InputFilter
+from dpt_threading.thread_lock import ThreadLock
 
-from ...instances import Abstract as AbstractInstance
+from ...input_validation_exception import InputValidationException
+from ...instances import Abstract as AbstractInstance, BackendResourceContext
+from ...instrumentation import Instrumentation
+from ...lru_cache import LruCache
+from ...operation_failed_exception import OperationFailedException
 from ...operation_not_supported_exception import OperationNotSupportedException
-from ...protocol import Abstract, CallContext
+from ...protocol import Abstract, AsyncCallContext, CallContext
 
 class XPythonModule(Abstract):
     """
@@ -39,31 +52,118 @@ class XPythonModule(Abstract):
              Mozilla Public License, v. 2.0
     """
 
+    CACHED_OPERATIONS = ( "get", )
+    """
+Read operations with results cached for CRUD entity instances supporting
+"result_caching" if all methods called are declared with
+"declare_principal_independent_result"
+    """
+    INVALIDATING_OPERATIONS = ( "create", "delete", "update", "upsert" )
+    """
+Write operations invalidating cached results of the same entity path
+    """
+    RESULT_MISSING = object()
+    """
+Sentinel for results not cached
+    """
     RE_NON_WORD_CHARS = re.compile("\\W+")
     """
 RegExp to find non-word characters
     """
+    RE_SELECTOR_PLACEHOLDER = re.compile("^\\{(\\w+)\\}$")
+    """
+RegExp to find operation selector placeholders
+    """
+
+    ZERO_COPY_PAYLOAD_TYPES = ( bytes, bytearray, memoryview, mmap )
+    """
+Binary payload types passed as "memoryview" instances to CRUD entity
+instances supporting "zero_copy_payloads"
+    """
 
-    __slots__ = [ "_instance", "operation_selector_list" ]
+    __slots__ = [ "_call_contexts",
+                  "_call_stack_selectors",
+                  "_call_stacks",
+                  "_instance",
+                  "_instance_pool",
+                  "_operation_selector_shape",
+                  "_selector_placeholders",
+                  "operation_selector_list"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _call_stack_plan_cache = LruCache(max_size = 4096)
+    """
+Cache of resolved call stack plans
+    """
+    _instance_class_selectors_cache = LruCache(max_size = 512)
+    """
+Cache of selector names potentially matching methods of CRUD entity classes
+    """
+    _result_cache = LruCache(max_size = 4096, ttl = 60)
+    """
+Cache of read operation results
+    """
+    _result_cache_index_lock = ThreadLock()
+    """
+Lock used for the result cache indices
+    """
+    _result_cache_keys = set()
+    """
+Result cache keys indexed
+    """
+    _result_cache_path_keys = { }
+    """
+Result cache keys indexed by CRUD entity class and entity path
+    """
+    _result_cache_subtree_keys = { }
+    """
+Result cache keys indexed by CRUD entity class and each entity path prefix
+    """
 
-    def __init__(self, crud_url_elements):
+    def __init__(self, crud_url_elements, route = None):
         """
 Constructor __init__(XPythonModule)
 
 :param crud_url_elements: CRUD URL elements
+:param route: Route returned by "compile_route()"
 
 :since: v1.0.0
         """
 
-        Abstract.__init__(self, crud_url_elements)
+        Abstract.__init__(self, crud_url_elements, route)
 
+        self._call_contexts = { }
+        """
+Call contexts reused per CRUD entity method and metric key
+        """
+        self._call_stack_selectors = [ ]
+        """
+Operation selectors the resolved call stacks are valid for
+        """
+        self._call_stacks = { }
+        """
+Resolved call stacks reused per operation
+        """
         self._instance = None
         """
 Underlying CRUD instance
+        """
+        self._instance_pool = None
+        """
+Instance pool the underlying CRUD instance has been checked out from
+        """
+        self._operation_selector_shape = None
+        """
+Operation selectors with IDs replaced by None used to look up call stack
+plans
+        """
+        self._selector_placeholders = None
+        """
+Placeholder names aligned with the operation selectors; None if the
+resource is not a template
         """
         self.operation_selector_list = [ ]
         """
@@ -71,20 +171,16 @@ List of path elements for the operation name executed
         """
 
         self.supported_features['access_control_validator'] = True
+        self.supported_features['async_calls'] = True
+        self.supported_features['batch_calls'] = True
+        self.supported_features['resource_templates'] = True
+        self.supported_features['streaming_calls'] = True
 
-        path = (crud_url_elements.path[1:] if (crud_url_elements.path[:1] == "/") else crud_url_elements.path)
-        path_elements = path.split("/")
-
-        module_name = re.sub("\\W+", "_", path_elements.pop(0))
-
-        instance_name = InputFilter.filter_control_chars(path_elements.pop(0).replace("-", "_"))
-        instance_class_name = "".join([ word.capitalize() for word in instance_name.split("_") ])
-
-        self._init_crud_instance(module_name, instance_class_name)
+        if (route is None): route = self.__class__.compile_route(crud_url_elements)
+        instance_class, operation_selectors, self._operation_selector_shape, self._selector_placeholders = route
 
-        if (len(path_elements) > 0):
-            for selector in path_elements: self.operation_selector_list.append(InputFilter.filter_control_chars(selector))
-        #
+        self._init_crud_instance(instance_class)
+        self.operation_selector_list.extend(operation_selectors)
     #
 
     @property
@@ -112,6 +208,16 @@ Sets the access control validator used for local CRUD entity instances.
         self._instance.access_control = validator
     #
 
+    def __del__(self):
+        """
+python.org: Called when the instance is about to be destroyed.
+
+:since: v1.0.0
+        """
+
+        self.release()
+    #
+
     def __getattr__(self, name):
         """
 python.org: Called when an attribute lookup has not found the attribute in
@@ -127,141 +233,1143 @@ the class tree for self).
         return self._get_call_stack_method(name)
     #
 
-    def _get_call_stack(self, operation):
+    async def acall(self, operation, **kwargs):
         """
-Returns the list of methods to be called in sequence for the operation
-requested.
+Executes the given operation asynchronously. Coroutine methods of the CRUD
+entity instance are awaited directly while synchronous ones are called in
+the configured executor.
 
 :param operation: CRUD operation
 
-:return: (list) List of methods to be called
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        call_stack = self._get_call_stack(operation)
+
+        if (self._instance.is_supported("result_caching")):
+            result_cache_key = self._get_result_cache_key(call_stack, operation, kwargs)
+            cached_result = self._get_cached_result(result_cache_key)
+
+            if (cached_result is XPythonModule.RESULT_MISSING):
+                _return = await self._execute_call_stack_async(call_stack, kwargs, operation)
+                self._update_result_cache(operation, result_cache_key, kwargs, _return)
+            else: _return = await self._execute_cached_call_stack_async(call_stack, kwargs, operation, cached_result)
+        else: _return = await self._execute_call_stack_async(call_stack, kwargs, operation)
+
+        return _return
+    #
+
+    def aiterate(self, operation, **kwargs):
+        """
+Returns an asynchronous iterator for the items returned or yielded by the
+given operation. Asynchronous generator methods of the CRUD entity instance
+are iterated directly.
+
+:param operation: CRUD operation
+
+:return: (object) Asynchronous iterator
+:since:  v1.0.0
+        """
+
+        return self._aiterate_call_stack(self._get_call_stack(operation), kwargs, operation)
+    #
+
+    async def _aiterate_call_stack(self, call_stack, kwargs, operation = None):
+        """
+Executes the given call stack asynchronously and iterates the items
+returned or yielded by its last method.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+
+:since: v1.0.0
+        """
+
+        call_definition = call_stack[-1]
+        method = call_definition['method']
+
+        async with BackendResourceContext(self._instance.get_backend_pool()):
+            updated_kwargs = self._get_filtered_call_kwargs(kwargs)
+            updated_kwargs['_select_id'] = self._get_select_id(call_definition, kwargs)
+            updated_kwargs['_selected_value'] = await self._execute_call_stack_async(call_stack[:-1], kwargs, operation)
+
+            async with self._get_call_context(call_definition, self._get_instrumentation_key(call_stack, operation), AsyncCallContext):
+                if (isasyncgenfunction(method) or isgeneratorfunction(method)): result = method(**updated_kwargs)
+                elif (iscoroutinefunction(method)): result = await method(**updated_kwargs)
+                else: result = await self.__class__.call_in_executor(method, **updated_kwargs)
+
+                async for item in self.__class__.aiterate_result(result): yield item
+            #
+        #
+    #
+
+    def call_many(self, operation, kwargs_list):
+        """
+Executes the given operation for each keyword arguments dictionary given.
+The last method of the call stack is called once for all items if the CRUD
+entity instance supports "batch_operations" and implements a method with
+the suffix "_many". Preceding selector methods are called once for all
+items without operation specific keyword arguments in this case. Resource
+templates are always executed per item as selector IDs may differ.
+
+:param operation: CRUD operation
+:param kwargs_list: List of keyword arguments dictionaries
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        call_stack = self._get_call_stack(operation)
+        call_definition = call_stack[-1]
+
+        batch_method = (getattr(self._instance, "{0}_many".format(call_definition['method_name']), None)
+                        if (self._selector_placeholders is None and self._instance.is_supported("batch_operations")) else
+                        None
+                       )
+
+        with BackendResourceContext(self._instance.get_backend_pool()):
+            if (batch_method is None):
+                results = [ ]
+
+                for kwargs in kwargs_list:
+                    try: results.append(self._execute_call_stack(call_stack, kwargs, operation))
+                    except Exception as handled_exception: results.append(handled_exception)
+                #
+            else:
+                call_contexts = [ ]
+
+                try:
+                    selected_value = self._execute_call_stack(call_stack[:-1], { }, operation)
+                    instrumentation_key = self._get_instrumentation_key(call_stack, operation)
+
+                    call_context = self._get_call_context(call_definition, instrumentation_key)
+
+                    for _ in kwargs_list:
+                        call_context.__enter__()
+                        call_contexts.append(call_context)
+                    #
+
+                    batch_kwargs = { "_select_id": call_definition['select_id'], "_selected_value": selected_value }
+                    batch_kwargs_list = [ self._get_filtered_call_kwargs(kwargs) for kwargs in kwargs_list ]
+
+                    results = (batch_method(batch_kwargs_list, **batch_kwargs)
+                               if (instrumentation_key is None) else
+                               Instrumentation.call(instrumentation_key + ( "{0}_many".format(call_definition['method_name']), ), batch_method, batch_kwargs_list, **batch_kwargs)
+                              )
+
+                    if (len(results) != len(kwargs_list)): raise OperationFailedException("Batch operation returned an unexpected number of results")
+                except Exception as handled_exception: results = [ handled_exception for _ in kwargs_list ]
+
+                for call_context, result in zip(call_contexts, results):
+                    if (isinstance(result, Exception)): call_context.__exit__(type(result), result, result.__traceback__)
+                    else: call_context.__exit__(None, None, None)
+                #
+            #
+        #
+
+        for kwargs, result in zip(kwargs_list, results):
+            if (not isinstance(result, Exception)): self._update_result_cache(operation, None, kwargs, result)
+        #
+
+        return [ ({ "operation": operation, "result": None, "exception": result }
+                  if (isinstance(result, Exception)) else
+                  { "operation": operation, "result": result, "exception": None }
+                 )
+                 for result in results
+               ]
+    #
+
+    @classmethod
+    def _compile_call_stack_plan(cls, method_provider, operation, operation_selector_shape):
+        """
+Resolves the methods to be called in sequence for the operation and
+operation selector shape given.
+
+:param cls: Python class
+:param method_provider: CRUD entity class; the CRUD entity instance if it
+                        provides methods dynamically
+:param operation: CRUD operation
+:param operation_selector_shape: Operation selectors with IDs replaced by
+       None
+
+:return: (tuple) Tuples of method name and index of the operation selector
+         used as ID (None if not applicable)
 :since:  v1.0.0
         """
 
         _return = [ ]
-        operation = operation.lower()
 
-        if (len(self.operation_selector_list) < 1):
-            _return.append({ "method": self._get_crud_instance_method(operation),
-                             "method_name": operation,
-                             "select_id": None
-                           })
+        if (len(operation_selector_shape) < 1): _return.append(( operation, None ))
         else:
-            operation_selector_list = self.operation_selector_list.copy()
+            index = len(operation_selector_shape)
+
+            while (index > 0):
+                index -= 1
 
-            while (len(operation_selector_list) > 0):
-                operation_id_or_selector = operation_selector_list.pop()
-                method_name = "{0}_{1}".format(operation, operation_id_or_selector)
+                select_id_index = index
+                method_name = "{0}_{1}".format(operation, operation_selector_shape[index])
 
-                if (hasattr(self._instance, method_name)): operation_id_or_selector = None
-                elif (len(operation_selector_list) > 0):
-                    operation_selector = XPythonModule.RE_NON_WORD_CHARS.sub("_", operation_selector_list.pop())
-                    method_name = "{0}_{1}".format(operation, operation_selector)
+                if (operation_selector_shape[index] is not None and hasattr(method_provider, method_name)): select_id_index = None
+                elif (index > 0):
+                    index -= 1
+                    operation_selector = operation_selector_shape[index]
 
-                    if (not hasattr(self._instance, method_name)): raise OperationNotSupportedException("Can't find match for operation call stack '{0}'".format(operation))
+                    if (operation_selector is not None):
+                        operation_selector = cls.RE_NON_WORD_CHARS.sub("_", operation_selector)
+                        method_name = "{0}_{1}".format(operation, operation_selector)
+                    #
+
+                    if (operation_selector is None or (not hasattr(method_provider, method_name))):
+                        raise OperationNotSupportedException("Can't find match for operation call stack '{0}'".format(operation))
+                    #
                 else: method_name = operation
 
-                _return.insert(0,
-                               { "method": self._get_crud_instance_method(method_name),
-                                 "method_name": method_name,
-                                 "select_id": operation_id_or_selector
-                               }
-                              )
+                _return.insert(0, ( method_name, select_id_index ))
 
                 operation = "select"
             #
         #
 
-        if (self._instance.is_supported("call_stack_optimization")): _return = self._instance.optimize_call_stack(_return)
-        return _return
+        for method_name, _ in _return:
+            if (getattr(method_provider, method_name, None) is None): raise OperationNotSupportedException("Operation '{0}' is not supported".format(method_name))
+        #
+
+        return tuple(_return)
     #
 
-    def _get_call_stack_method(self, operation):
+    @classmethod
+    def compile_route(cls, crud_url_elements):
         """
-Returns a callable for the generated stack of methods to be called for the
-URL resource requested.
+Returns the CRUD entity class, the tuple of operation selectors, its shape
+and the names of selector placeholders like "{id}" for the CRUD URL
+elements given.
 
-:param operation: CRUD operation
+:param cls: Python class
+:param crud_url_elements: CRUD URL elements
 
-:return: (object) Python callable for the URL resource requested
+:return: (tuple) CRUD entity class, operation selectors, selector shape and
+         placeholder names aligned with the selectors (None if the CRUD URL
+         is not a template)
 :since:  v1.0.0
         """
 
-        call_stack = self._get_call_stack(operation)
+        path = (crud_url_elements.path[1:] if (crud_url_elements.path[:1] == "/") else crud_url_elements.path)
+        path_elements = path.split("/")
+
+        module_name = XPythonModule.RE_NON_WORD_CHARS.sub("_", path_elements.pop(0))
+
+        instance_name = InputFilter.filter_control_chars(path_elements.pop(0).replace("-", "_"))
+        instance_class_name = "".join([ word.capitalize() for word in instance_name.split("_") ])
+
+        instance_class = NamedClassLoader.get_class_in_namespace("crud", "instances.{0}.{1}".format(module_name, instance_class_name))
 
-        def proxymethod(*_, **kwargs):
-            updated_kwargs = kwargs.copy()
+        if (not (isinstance(instance_class, type) and issubclass(instance_class, AbstractInstance))): raise OperationNotSupportedException("CRUD entity '{0}.{1}' is not supported".format(module_name, instance_class_name))
 
-            for key in updated_kwargs:
-                if (key[:1] == "_"): del(updated_kwargs[key])
+        operation_selectors = tuple(InputFilter.filter_control_chars(selector) for selector in path_elements)
+        operation_selector_shape = cls._get_operation_selector_shape(instance_class, operation_selectors)
+
+        selector_placeholders = tuple((None if (re_result is None) else re_result.group(1))
+                                      for re_result in (cls.RE_SELECTOR_PLACEHOLDER.match(selector) for selector in operation_selectors)
+                                     )
+
+        if (selector_placeholders.count(None) == len(selector_placeholders)): selector_placeholders = None
+        else:
+            operation_selector_shape = tuple((None if (placeholder is not None) else selector)
+                                             for selector, placeholder in zip(operation_selector_shape, selector_placeholders)
+                                            )
+        #
+
+        return ( instance_class, operation_selectors, operation_selector_shape, selector_placeholders )
+    #
+
+    def _execute_cached_call_stack(self, call_stack, kwargs, operation, cached_result):
+        """
+Returns a copy of the cached result for the given call stack. The "pre" and
+"post" methods of the callee are called for each method of the call stack
+as if it had been executed and access is validated by the CRUD entity
+instance.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+:param cached_result: Cached result
+
+:return: (mixed) Copy of the cached result
+:since:  v1.0.0
+        """
+
+        instrumentation_key = self._get_instrumentation_key(call_stack, operation)
+
+        for call_definition in call_stack:
+            with self._get_call_context(call_definition, instrumentation_key):
+                if (call_definition is call_stack[-1]):
+                    self._instance.validate_cached_result_access(call_definition['method_name'], **self._get_filtered_call_kwargs(kwargs))
+                #
             #
+        #
 
-            is_first_call = True
-            _return = None
+        return deepcopy(cached_result)
+    #
+
+    async def _execute_cached_call_stack_async(self, call_stack, kwargs, operation, cached_result):
+        """
+Returns a copy of the cached result for the given call stack
+asynchronously. The "pre" and "post" methods of the callee are called for
+each method of the call stack as if it had been executed and access is
+validated by the CRUD entity instance.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+:param cached_result: Cached result
 
-            for call_definition in call_stack:
-                updated_kwargs['_select_id'] = call_definition['select_id']
-                updated_kwargs['_selected_value'] = (None if (is_first_call) else _return)
+:return: (mixed) Copy of the cached result
+:since:  v1.0.0
+        """
 
-                with CallContext(self.context_manager_callee, call_definition['method_name']):
-                    _return = call_definition['method'](**updated_kwargs)
+        instrumentation_key = self._get_instrumentation_key(call_stack, operation)
+
+        for call_definition in call_stack:
+            async with self._get_call_context(call_definition, instrumentation_key, AsyncCallContext):
+                if (call_definition is call_stack[-1]):
+                    self._instance.validate_cached_result_access(call_definition['method_name'], **self._get_filtered_call_kwargs(kwargs))
                 #
+            #
+        #
+
+        return deepcopy(cached_result)
+    #
+
+    def _execute_call_stack(self, call_stack, kwargs, operation = None):
+        """
+Executes the given call stack with the keyword arguments given. A backend
+resource is acquired for the whole call stack if the CRUD entity class
+registered a backend pool.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+
+:return: (mixed) Return value of the last method called
+:since:  v1.0.0
+        """
+
+        backend_pool = self._instance.get_backend_pool()
+
+        if (backend_pool is None): _return = self._execute_call_stack_methods(call_stack, kwargs, operation)
+        else:
+            with BackendResourceContext(backend_pool): _return = self._execute_call_stack_methods(call_stack, kwargs, operation)
+        #
+
+        return _return
+    #
+
+    async def _execute_call_stack_async(self, call_stack, kwargs, operation = None):
+        """
+Executes the given call stack asynchronously with the keyword arguments
+given. A backend resource is acquired for the whole call stack if the CRUD
+entity class registered a backend pool.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+
+:return: (mixed) Return value of the last method called
+:since:  v1.0.0
+        """
+
+        backend_pool = self._instance.get_backend_pool()
+
+        if (backend_pool is None): _return = await self._execute_call_stack_methods_async(call_stack, kwargs, operation)
+        else:
+            async with BackendResourceContext(backend_pool): _return = await self._execute_call_stack_methods_async(call_stack, kwargs, operation)
+        #
+
+        return _return
+    #
+
+    def _execute_call_stack_methods(self, call_stack, kwargs, operation):
+        """
+Calls the methods of the given call stack in sequence.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
 
-                is_first_call = False
+:return: (mixed) Return value of the last method called
+:since:  v1.0.0
+        """
+
+        instrumentation_key = self._get_instrumentation_key(call_stack, operation)
+        updated_kwargs = self._get_filtered_call_kwargs(kwargs)
+
+        is_first_call = True
+        _return = None
+
+        for call_definition in call_stack:
+            updated_kwargs['_select_id'] = self._get_select_id(call_definition, kwargs)
+            updated_kwargs['_selected_value'] = (None if (is_first_call) else _return)
+
+            with self._get_call_context(call_definition, instrumentation_key):
+                _return = (call_definition['method'](**updated_kwargs)
+                           if (instrumentation_key is None) else
+                           Instrumentation.call(instrumentation_key + ( call_definition['method_name'], ), call_definition['method'], **updated_kwargs)
+                          )
             #
 
-            return _return
+            is_first_call = False
         #
 
-        return proxymethod
+        return _return
     #
 
-    def _get_crud_instance_method(self, name):
+    async def _execute_call_stack_methods_async(self, call_stack, kwargs, operation):
         """
-Returns the matching method of the underlying CRUD entity instance.
+Calls the methods of the given call stack asynchronously in sequence.
 
-:param name: CRUD entity instance method name
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
 
-:return: (object) CRUD entity instance method
+:return: (mixed) Return value of the last method called
 :since:  v1.0.0
         """
 
-        _return = getattr(self._instance, name, None)
-        if (_return is None): raise OperationNotSupportedException("Operation '{0}' is not supported".format(name))
+        instrumentation_key = self._get_instrumentation_key(call_stack, operation)
+        updated_kwargs = self._get_filtered_call_kwargs(kwargs)
+
+        is_first_call = True
+        _return = None
+
+        for call_definition in call_stack:
+            updated_kwargs['_select_id'] = self._get_select_id(call_definition, kwargs)
+            updated_kwargs['_selected_value'] = (None if (is_first_call) else _return)
+
+            async with self._get_call_context(call_definition, instrumentation_key, AsyncCallContext):
+                _callable = (call_definition['method']
+                             if (iscoroutinefunction(call_definition['method'])) else
+                             partial(self.__class__.call_in_executor, call_definition['method'])
+                            )
+
+                _return = await (_callable(**updated_kwargs)
+                                 if (instrumentation_key is None) else
+                                 Instrumentation.acall(instrumentation_key + ( call_definition['method_name'], ), _callable, **updated_kwargs)
+                                )
+            #
+
+            is_first_call = False
+        #
 
         return _return
     #
 
-    def _init_crud_instance(self, module_name, instance_class_name):
+    def _execute_operation(self, call_stack, kwargs, operation):
         """
-Initializes the underlying CRUD entity instance for the URL resource
-requested.
+Executes the given call stack for the operation requested. Results of read
+operations are cached and write operations invalidate cached results if
+the CRUD entity instance supports "result_caching".
 
-:param module_name: CRUD entity module name
-:param instance_class_name: CRUD entity class name
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation
 
-:since: v1.0.0
+:return: (mixed) Return value of the last method called
+:since:  v1.0.0
         """
 
-        crud_instance = NamedClassLoader.get_instance_in_namespace("crud", "instances.{0}.{1}".format(module_name, instance_class_name))
-        if (not isinstance(crud_instance, AbstractInstance)): raise OperationNotSupportedException()
+        if (self._instance.is_supported("result_caching")):
+            result_cache_key = self._get_result_cache_key(call_stack, operation, kwargs)
+            cached_result = self._get_cached_result(result_cache_key)
 
-        self._instance = crud_instance
+            if (cached_result is XPythonModule.RESULT_MISSING):
+                _return = self._execute_call_stack(call_stack, kwargs, operation)
+                self._update_result_cache(operation, result_cache_key, kwargs, _return)
+            else: _return = self._execute_cached_call_stack(call_stack, kwargs, operation, cached_result)
+        else: _return = self._execute_call_stack(call_stack, kwargs, operation)
+
+        return _return
     #
 
-    def is_supported(self, feature):
+    def _get_cached_result(self, result_cache_key):
         """
-Returns true if the feature requested is supported by this instance.
+Returns the cached result for the key given. Cached results must not be
+returned to callers directly but only as copies.
 
-:param feature: Feature name string
+:param result_cache_key: Result cache key; None if not cacheable
 
-:return: (bool) True if supported
+:return: (mixed) Cached result; "RESULT_MISSING" if not cached
 :since:  v1.0.0
         """
 
-        return (Abstract.is_supported(self, feature)
-                if (feature in self.supported_features) else
-                self._instance.is_supported(feature)
+        return (XPythonModule.RESULT_MISSING
+                if (result_cache_key is None) else
+                self.__class__._result_cache.get(result_cache_key, XPythonModule.RESULT_MISSING)
                )
     #
+
+    def _get_call_context(self, call_definition, instrumentation_key, context_class = CallContext):
+        """
+Returns the call context for the given CRUD entity method. Call contexts
+are reused as long as the callee instance is not changed.
+
+:param call_definition: Call definition dict of the method
+:param instrumentation_key: Metric key tuple; None if not recorded
+:param context_class: Call context class
+
+:return: (object) Call context instance
+:since:  v1.0.0
+        """
+
+        cache_key = ( call_definition['method_name'], instrumentation_key, context_class )
+        _return = self._call_contexts.get(cache_key)
+
+        if (_return is None or _return.callee_instance is not self.context_manager_callee):
+            _return = context_class(self.context_manager_callee, call_definition['method_name'], instrumentation_key)
+            self._call_contexts[cache_key] = _return
+        #
+
+        return _return
+    #
+
+    def _get_call_stack(self, operation):
+        """
+Returns the list of methods to be called in sequence for the operation
+requested. Call stacks are resolved once per protocol instance and
+operation. They are resolved again if the operation selectors have been
+changed.
+
+:param operation: CRUD operation
+
+:return: (list) List of methods to be called
+:since:  v1.0.0
+        """
+
+        if (self._call_stack_selectors != self.operation_selector_list):
+            self._call_stacks.clear()
+            self._call_stack_selectors = self.operation_selector_list.copy()
+        #
+
+        _return = self._call_stacks.get(operation)
+
+        if (_return is None):
+            _return = (Instrumentation.call(Instrumentation.get_class_entity_names(self._instance.__class__) + ( operation, "call_stack" ),
+                                            self._resolve_call_stack,
+                                            operation
+                                           )
+                       if (Instrumentation.is_enabled()) else
+                       self._resolve_call_stack(operation)
+                      )
+
+            self._call_stacks[operation] = _return
+        #
+
+        return _return
+    #
+
+    def _get_call_stack_method(self, operation):
+        """
+Returns a callable for the generated stack of methods to be called for the
+URL resource requested.
+
+:param operation: CRUD operation
+
+:return: (object) Python callable for the URL resource requested
+:since:  v1.0.0
+        """
+
+        call_stack = self._get_call_stack(operation)
+
+        def proxymethod(*_, **kwargs): return self._execute_operation(call_stack, kwargs, operation)
+        return proxymethod
+    #
+
+    def _get_call_stack_plan(self, operation):
+        """
+Returns the cached call stack plan for the operation requested. Plans of
+CRUD entity instances providing methods dynamically are resolved for the
+instance and not cached.
+
+:param operation: Lower case CRUD operation
+
+:return: (tuple) Tuples of method name and index of the operation selector
+         used as ID (None if not applicable)
+:since:  v1.0.0
+        """
+
+        if (self._is_instance_providing_methods_dynamically()):
+            return self.__class__._compile_call_stack_plan(self._instance,
+                                                           operation,
+                                                           tuple((None if (self._get_selector_placeholder(index) is not None) else selector)
+                                                                 for index, selector in enumerate(self.operation_selector_list)
+                                                                )
+                                                          )
+        #
+
+        instance_class = self._instance.__class__
+        key = ( instance_class, operation, self._operation_selector_shape )
+
+        _return = self.__class__._call_stack_plan_cache.get(key)
+
+        if (_return is None):
+            _return = self.__class__._compile_call_stack_plan(instance_class, operation, self._operation_selector_shape)
+            self.__class__._call_stack_plan_cache.set(key, _return)
+        #
+
+        return _return
+    #
+
+    def _get_crud_instance_method(self, name):
+        """
+Returns the matching method of the underlying CRUD entity instance.
+
+:param name: CRUD entity instance method name
+
+:return: (object) CRUD entity instance method
+:since:  v1.0.0
+        """
+
+        _return = getattr(self._instance, name, None)
+        if (_return is None): raise OperationNotSupportedException("Operation '{0}' is not supported".format(name))
+
+        return _return
+    #
+
+    def _get_filtered_call_kwargs(self, kwargs):
+        """
+Returns a copy of the keyword arguments given without internal ones
+starting with an underscore and without selector placeholder values.
+Binary payloads are passed as read-only "memoryview" instances if the CRUD
+entity instance supports "zero_copy_payloads".
+
+:param kwargs: Keyword arguments
+
+:return: (dict) Filtered keyword arguments
+:since:  v1.0.0
+        """
+
+        _return = (dict(( key, kwargs[key] ) for key in kwargs if (key[:1] != "_"))
+                   if (self._selector_placeholders is None) else
+                   dict(( key, kwargs[key] ) for key in kwargs if (key[:1] != "_" and key not in self._selector_placeholders))
+                  )
+
+        if (len(_return) > 0 and self._instance.is_supported("zero_copy_payloads")):
+            for key, value in _return.items():
+                if (isinstance(value, XPythonModule.ZERO_COPY_PAYLOAD_TYPES)): _return[key] = memoryview(value).toreadonly()
+            #
+        #
+
+        return _return
+    #
+
+    def _get_instrumentation_key(self, call_stack, operation):
+        """
+Returns the metric key prefix of module, instance and operation if
+instrumentation is enabled.
+
+:param call_stack: List of methods to be called
+:param operation: CRUD operation; None to use the last method name
+
+:return: (tuple) Metric key prefix; None if instrumentation is disabled
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (Instrumentation.is_enabled()):
+            if (operation is None and len(call_stack) > 0): operation = call_stack[-1]['method_name']
+            _return = Instrumentation.get_class_entity_names(self._instance.__class__) + ( operation, )
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_operation_selector_shape(cls, instance_class, operation_selectors):
+        """
+Returns the operation selectors given with all values replaced by None that
+can not be part of a method name of the CRUD entity class. Call stack plans
+are shared between all operation selectors of the same shape.
+
+:param cls: Python class
+:param instance_class: CRUD entity class
+:param operation_selectors: Operation selectors
+
+:return: (tuple) Operation selector shape
+:since:  v1.0.0
+        """
+
+        # Instances resolving attributes dynamically may match any selector
+        if (getattr(instance_class, "__getattr__", None) is not None): return operation_selectors
+
+        selectors = cls._instance_class_selectors_cache.get(instance_class)
+
+        if (selectors is None):
+            selectors = set()
+
+            for name in dir(instance_class):
+                position = name.find("_")
+
+                while (position > -1):
+                    selectors.add(name[position + 1:])
+                    position = name.find("_", position + 1)
+                #
+            #
+
+            selectors = frozenset(selectors)
+            cls._instance_class_selectors_cache.set(instance_class, selectors)
+        #
+
+        return tuple((selector
+                      if (selector in selectors or cls.RE_NON_WORD_CHARS.sub("_", selector) in selectors) else
+                      None
+                     )
+                     for selector in operation_selectors
+                    )
+    #
+
+    def _get_result_cache_key(self, call_stack, operation, kwargs):
+        """
+Returns the result cache key for the given read operation if the CRUD
+entity instance supports "result_caching" and all methods of the call
+stack are declared to return principal independent results.
+
+:param call_stack: List of methods to be called
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (tuple) Result cache key; None if not cacheable
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (operation is not None
+            and operation.lower() in self.__class__.CACHED_OPERATIONS
+            and self._instance.is_supported("result_caching")
+            and all(getattr(call_definition['method'], "is_result_principal_independent", False) for call_definition in call_stack)
+           ):
+            entity_path = self._get_result_cache_entity_path(kwargs)
+
+            if (entity_path is not None):
+                _return = ( self._instance.__class__,
+                            entity_path,
+                            operation.lower(),
+                            tuple(sorted(self._instance._get_filtered_kwargs(self._get_filtered_call_kwargs(kwargs)).items()))
+                          )
+
+                try: hash(_return)
+                except TypeError: _return = None
+            #
+        #
+
+        return _return
+    #
+
+    def _get_result_cache_entity_path(self, kwargs):
+        """
+Returns the operation selectors with placeholders of resource templates
+replaced by the keyword argument values given.
+
+:param kwargs: Keyword arguments
+
+:return: (tuple) Entity path; None if a placeholder value is missing
+:since:  v1.0.0
+        """
+
+        _return = tuple(self.operation_selector_list)
+
+        if (self._selector_placeholders is not None):
+            if (len([ placeholder for placeholder in self._selector_placeholders if placeholder is not None and placeholder not in kwargs ]) > 0): _return = None
+            else:
+                _return = tuple((selector if (placeholder is None) else kwargs[placeholder])
+                                for selector, placeholder in zip(_return, self._selector_placeholders)
+                               )
+            #
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def get_call_stack_plan_cache(cls):
+        """
+Returns the cache of resolved call stack plans. It may be used to read its
+statistics or to change its limits.
+
+:param cls: Python class
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return cls._call_stack_plan_cache
+    #
+
+    @classmethod
+    def get_result_cache(cls):
+        """
+Returns the cache of read operation results. It may be used to read its
+statistics or to change its limits and time to live.
+
+:param cls: Python class
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return cls._result_cache
+    #
+
+    def _get_select_id(self, call_definition, kwargs):
+        """
+Returns the ID to be selected for the given call definition. Placeholders
+of resource templates are replaced with the keyword argument of the same
+name.
+
+:param call_definition: Call stack entry
+:param kwargs: Keyword arguments
+
+:return: (mixed) ID to be selected; None if not applicable
+:since:  v1.0.0
+        """
+
+        select_id_key = call_definition.get("select_id_key")
+
+        if (select_id_key is None): _return = call_definition['select_id']
+        elif (select_id_key in kwargs): _return = kwargs[select_id_key]
+        else: raise InputValidationException("Value for the selector placeholder '{0}' is missing".format(select_id_key))
+
+        return _return
+    #
+
+    def _get_selector_placeholder(self, index):
+        """
+Returns the placeholder name of the operation selector at the index given.
+
+:param index: Operation selector index
+
+:return: (str) Placeholder name; None if the selector is not a placeholder
+:since:  v1.0.0
+        """
+
+        return (None if (self._selector_placeholders is None) else self._selector_placeholders[index])
+    #
+
+    def _init_crud_instance(self, instance_class):
+        """
+Initializes the underlying CRUD entity instance for the URL resource
+requested. Instances of classes with instance pooling enabled are checked
+out from the pool of the class.
+
+:param instance_class: CRUD entity class
+
+:since: v1.0.0
+        """
+
+        instance_pool = instance_class.get_instance_pool()
+
+        if (instance_pool is None): self._instance = instance_class()
+        else:
+            self._instance = instance_pool.checkout()
+            self._instance_pool = instance_pool
+        #
+    #
+
+    @classmethod
+    def _index_cached_result(cls, result_cache_key):
+        """
+Adds the result cache key given to the indices used for invalidation.
+Entries of results already evicted are dropped if the number of keys
+indexed exceeds twice the result cache size.
+
+:param cls: Python class
+:param result_cache_key: Result cache key
+
+:since: v1.0.0
+        """
+
+        with cls._result_cache_index_lock:
+            if (result_cache_key not in cls._result_cache_keys):
+                if (len(cls._result_cache_keys) >= 2 * cls._result_cache.max_size):
+                    for key in [ key for key in cls._result_cache_keys if key not in cls._result_cache ]: cls._unindex_cached_result(key)
+                #
+
+                instance_class = result_cache_key[0]
+                entity_path = tuple(str(selector) for selector in result_cache_key[1])
+
+                cls._result_cache_keys.add(result_cache_key)
+                cls._result_cache_path_keys.setdefault(( instance_class, entity_path ), set()).add(result_cache_key)
+
+                for length in range(1 + len(entity_path)):
+                    cls._result_cache_subtree_keys.setdefault(( instance_class, entity_path[:length] ), set()).add(result_cache_key)
+                #
+            #
+        #
+    #
+
+    def _invalidate_cached_results(self, kwargs):
+        """
+Removes cached results of the CRUD entity class for the entity path, all
+paths below it and all paths it is below of. Selector values are compared
+as strings as they are given in CRUD URLs.
+
+:param kwargs: Keyword arguments
+
+:since: v1.0.0
+        """
+
+        self.__class__._remove_cached_results(self._instance.__class__, self._get_result_cache_entity_path(kwargs))
+    #
+
+    def invalidate_cached_results(self, operation, kwargs):
+        """
+Invalidates cached results after the given operation has been executed
+outside of this protocol instance, e.g. in a worker process.
+
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:since: v1.0.0
+        """
+
+        self._update_result_cache(operation, None, kwargs, None)
+    #
+
+    def _is_instance_providing_methods_dynamically(self):
+        """
+Returns true if the CRUD entity instance may provide methods not defined
+by its class, i.e. with "__getattr__()" or callable instance attributes.
+
+:return: (bool) True if methods are provided dynamically
+:since:  v1.0.0
+        """
+
+        instance_dict = getattr(self._instance, "__dict__", None)
+
+        return (getattr(self._instance.__class__, "__getattr__", None) is not None
+                or (isinstance(instance_dict, dict) and any(callable(value) for value in instance_dict.values()))
+               )
+    #
+
+    @classmethod
+    def is_route_valid(cls, route):
+        """
+Returns false if the CRUD entity module of the route given has been
+reloaded. Cached call stack plans and results of the outdated CRUD entity
+class are invalidated in this case.
+
+:param cls: Python class
+:param route: Route returned by "compile_route()"
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        instance_class = route[0]
+        instance_module = sys.modules.get(instance_class.__module__)
+
+        _return = (getattr(instance_module, instance_class.__name__, None) is instance_class)
+
+        if (not _return):
+            cls._call_stack_plan_cache.remove_matching(lambda key: key[0] is instance_class)
+            cls._instance_class_selectors_cache.remove(instance_class)
+            cls._remove_cached_results(instance_class, None)
+        #
+
+        return _return
+    #
+
+    def iterate(self, operation, **kwargs):
+        """
+Returns an iterator for the items returned or yielded by the given
+operation. Results of generator methods are streamed without being
+materialized.
+
+:param operation: CRUD operation
+
+:return: (object) Iterator
+:since:  v1.0.0
+        """
+
+        return self._iterate_call_stack(self._get_call_stack(operation), kwargs, operation)
+    #
+
+    def _iterate_call_stack(self, call_stack, kwargs, operation = None):
+        """
+Executes the given call stack and iterates the items returned or yielded by
+its last method.
+
+:param call_stack: List of methods to be called
+:param kwargs: Keyword arguments
+:param operation: CRUD operation used for instrumentation
+
+:since: v1.0.0
+        """
+
+        call_definition = call_stack[-1]
+
+        with BackendResourceContext(self._instance.get_backend_pool()):
+            updated_kwargs = self._get_filtered_call_kwargs(kwargs)
+            updated_kwargs['_select_id'] = self._get_select_id(call_definition, kwargs)
+            updated_kwargs['_selected_value'] = self._execute_call_stack(call_stack[:-1], kwargs, operation)
+
+            with self._get_call_context(call_definition, self._get_instrumentation_key(call_stack, operation)):
+                yield from self.__class__.iterate_result(call_definition['method'](**updated_kwargs))
+            #
+        #
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (Abstract.is_supported(self, feature)
+                if (feature in self.supported_features) else
+                self._instance.is_supported(feature)
+               )
+    #
+
+    def release(self):
+        """
+Returns a pooled CRUD entity instance to its instance pool. The instance
+must not be used afterwards.
+
+:since: v1.0.0
+        """
+
+        instance_pool = self._instance_pool
+
+        if (instance_pool is not None):
+            instance = self._instance
+
+            self._instance = None
+            self._instance_pool = None
+            self._call_stacks.clear()
+
+            instance_pool.checkin(instance)
+        #
+    #
+
+    @classmethod
+    def _remove_cached_results(cls, instance_class, entity_path):
+        """
+Removes cached results of the CRUD entity class given for the entity path,
+all paths below it and all paths it is below of.
+
+:param cls: Python class
+:param instance_class: CRUD entity class
+:param entity_path: Entity path; None to remove all results of the class
+
+:since: v1.0.0
+        """
+
+        entity_path = (( ) if (entity_path is None) else tuple(str(selector) for selector in entity_path))
+
+        with cls._result_cache_index_lock:
+            result_cache_keys = set(cls._result_cache_subtree_keys.get(( instance_class, entity_path ), ( )))
+
+            for length in range(len(entity_path)):
+                result_cache_keys.update(cls._result_cache_path_keys.get(( instance_class, entity_path[:length] ), ( )))
+            #
+
+            for result_cache_key in result_cache_keys:
+                cls._unindex_cached_result(result_cache_key)
+                cls._result_cache.remove(result_cache_key)
+            #
+        #
+    #
+
+    def _resolve_call_stack(self, operation):
+        """
+Resolves the list of methods to be called in sequence for the operation
+requested.
+
+:param operation: CRUD operation
+
+:return: (list) List of methods to be called
+:since:  v1.0.0
+        """
+
+        _return = [ { "method": self._get_crud_instance_method(method_name),
+                      "method_name": method_name,
+                      "select_id": (None if (select_id_index is None or self._get_selector_placeholder(select_id_index) is not None) else self.operation_selector_list[select_id_index]),
+                      "select_id_key": (None if (select_id_index is None) else self._get_selector_placeholder(select_id_index))
+                    }
+                    for method_name, select_id_index in self._get_call_stack_plan(operation.lower())
+                  ]
+
+        if (self._instance.is_supported("call_stack_optimization")): _return = self._instance.optimize_call_stack(_return)
+        return _return
+    #
+
+    @classmethod
+    def _unindex_cached_result(cls, result_cache_key):
+        """
+Removes the result cache key given from the indices used for invalidation.
+The index lock must be held by the caller.
+
+:param cls: Python class
+:param result_cache_key: Result cache key
+
+:since: v1.0.0
+        """
+
+        instance_class = result_cache_key[0]
+        entity_path = tuple(str(selector) for selector in result_cache_key[1])
+
+        cls._result_cache_keys.discard(result_cache_key)
+
+        for index, index_key in ( [ ( cls._result_cache_path_keys, ( instance_class, entity_path ) ) ]
+                                  + [ ( cls._result_cache_subtree_keys, ( instance_class, entity_path[:length] ) )
+                                      for length in range(1 + len(entity_path))
+                                    ]
+                                ):
+            keys = index.get(index_key)
+
+            if (keys is not None):
+                keys.discard(result_cache_key)
+                if (len(keys) < 1): del(index[index_key])
+            #
+        #
+    #
+
+    def _update_result_cache(self, operation, result_cache_key, kwargs, result):
+        """
+Caches a copy of the result of a read operation or invalidates cached
+results after a successful write operation. Generators, iterators,
+awaitables and results that can not be copied are not cached.
+
+:param operation: CRUD operation
+:param result_cache_key: Result cache key; None if not cacheable
+:param kwargs: Keyword arguments
+:param result: Operation result
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (result_cache_key is not None):
+            if (not (isgenerator(result) or isawaitable(result) or isinstance(result, ( AsyncIterator, Iterator )))):
+                try:
+                    self.__class__._result_cache.set(result_cache_key, deepcopy(result))
+                    self.__class__._index_cached_result(result_cache_key)
+                except Exception: pass
+            #
+        elif (operation is not None
+              and operation.lower() in self.__class__.INVALIDATING_OPERATIONS
+              and self._instance.is_supported("result_caching")
+             ): self._invalidate_cached_results(kwargs)
+    #
 #
@@ -17,6 +17,17 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from .abstract import Abstract
-from .abstract_filter_parser import AbstractFilterParser
-from .flat_filter_parser import FlatFilterParser
+from ..lazy_module_attributes import LazyModuleAttributes as _LazyModuleAttributes
+
+_LazyModuleAttributes.install(globals(),
+                              { "Abstract": "abstract",
+                                "AbstractFilterParser": "abstract_filter_parser",
+                                "BackendPool": "backend_pool",
+                                "BackendResourceContext": "backend_resource_context",
+                                "ColumnarStore": "columnar_store",
+                                "FlatFilterParser": "flat_filter_parser",
+                                "InstancePool": "instance_pool",
+                                "ScalarOrList": "scalar_or_list",
+                                "StreamingFilterDecoder": "streaming_filter_decoder"
+                              }
+                             )
@@ -18,18 +18,22 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 """
 
 from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
 
 from dpt_runtime.io_exception import IOException
 from dpt_runtime.not_implemented_exception import NotImplementedException
 from dpt_runtime.operation_not_supported_exception import OperationNotSupportedException as _OperationNotSupportedException
 from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_runtime.type_exception import TypeException
+from dpt_threading.thread_lock import ThreadLock
 
 from ..access_controls.abstract import Abstract as AbstractAccessControlValidator
 from ..access_denied_exception import AccessDeniedException
 from ..input_validation_exception import InputValidationException
+from ..instrumentation import Instrumentation
 from ..operation_failed_exception import OperationFailedException
 from ..operation_not_supported_exception import OperationNotSupportedException
+from .backend_resource_context import BackendResourceContext
 
 class Abstract(SupportsMixin):
     """
@@ -44,6 +48,15 @@ class Abstract(SupportsMixin):
              Mozilla Public License, v. 2.0
     """
 
+    INSTANCE_POOL_IDLE_TIMEOUT = None
+    """
+Seconds after which idle pooled instances are evicted; None to keep them
+    """
+    INSTANCE_POOL_SIZE = 0
+    """
+Maximum number of idle instances kept for reuse; 0 to disable instance
+pooling
+    """
     UNDERSCORE_ATTRIBUTE_KEYS = [ ]
     """
 List of attribute names for this CRUD entity instance which start with an underscore.
@@ -54,6 +67,26 @@ List of attribute names for this CRUD entity instance which start with an unders
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _backend_pool = None
+    """
+"BackendPool" instance registered for this CRUD entity class
+    """
+    _columnar_store = None
+    """
+"ColumnarStore" instance registered for this CRUD entity class
+    """
+    _filter_optimizer = None
+    """
+"FilterOptimizer" instance registered for this CRUD entity class
+    """
+    _instance_pool = None
+    """
+"InstancePool" instance of this CRUD entity class
+    """
+    _instance_pool_lock = ThreadLock()
+    """
+Thread safety lock for instance pool creation
+    """
 
     def __init__(self):
         """
@@ -70,6 +103,10 @@ The "AccessControlValidator" instance to be called.
         """
 
         self.supported_features['access_control_validation'] = self._supports_access_control_validation
+        self.supported_features['backend_pooling'] = self._supports_backend_pooling
+        self.supported_features['columnar_filtering'] = self._supports_columnar_filtering
+        self.supported_features['filter_optimization'] = self._supports_filter_optimization
+        self.supported_features['instance_pooling'] = (self.__class__.INSTANCE_POOL_SIZE > 0)
     #
 
     @property
@@ -100,6 +137,19 @@ Sets the "AccessControlValidator" instance to be called.
         self._access_control_instance = validator
     #
 
+    @property
+    def backend_resource(self):
+        """
+Returns the backend resource acquired from the registered "BackendPool"
+for the call stack currently executed.
+
+:return: (mixed) Backend resource; None if not acquired
+:since:  v1.0.0
+        """
+
+        return BackendResourceContext.get_resource(self.__class__._backend_pool)
+    #
+
     def _supports_access_control_validation(self):
         """
 Returns false if no access control validation is supported.
@@ -111,6 +161,39 @@ Returns false if no access control validation is supported.
         return (self.access_control is not None)
     #
 
+    def _supports_backend_pooling(self):
+        """
+Returns false if no backend pool is registered for this class.
+
+:return: (bool) True if backend pooling is supported
+:since:  v1.0.0
+        """
+
+        return (self.__class__._backend_pool is not None)
+    #
+
+    def _supports_columnar_filtering(self):
+        """
+Returns false if no columnar store is registered for this class.
+
+:return: (bool) True if columnar filtering is supported
+:since:  v1.0.0
+        """
+
+        return (self.__class__._columnar_store is not None)
+    #
+
+    def _supports_filter_optimization(self):
+        """
+Returns false if no filter optimizer is registered for this class.
+
+:return: (bool) True if filter optimization is supported
+:since:  v1.0.0
+        """
+
+        return (self.__class__._filter_optimizer is not None)
+    #
+
     @classmethod
     def _get_filtered_kwargs(cls, kwargs):
         """
@@ -126,6 +209,159 @@ Returns all kwargs after filtering keys and their values.
         return dict(( key, kwargs[key] ) for key in kwargs if (key[:1] != "_" and key not in cls.UNDERSCORE_ATTRIBUTE_KEYS))
     #
 
+    @classmethod
+    def get_backend_pool(cls):
+        """
+Returns the "BackendPool" instance registered for this class.
+
+:param cls: Python class
+
+:return: (object) BackendPool instance; None if not registered
+:since:  v1.0.0
+        """
+
+        return cls._backend_pool
+    #
+
+    @classmethod
+    def get_columnar_store(cls):
+        """
+Returns the "ColumnarStore" instance registered for this class.
+
+:param cls: Python class
+
+:return: (object) ColumnarStore instance; None if not registered
+:since:  v1.0.0
+        """
+
+        return cls._columnar_store
+    #
+
+    @classmethod
+    def get_filter_optimizer(cls):
+        """
+Returns the "FilterOptimizer" instance registered for this class.
+
+:param cls: Python class
+
+:return: (object) FilterOptimizer instance; None if not registered
+:since:  v1.0.0
+        """
+
+        return cls._filter_optimizer
+    #
+
+    @classmethod
+    def get_instance_pool(cls):
+        """
+Returns the "InstancePool" instance of this class if instance pooling is
+enabled with "INSTANCE_POOL_SIZE".
+
+:param cls: Python class
+
+:return: (object) InstancePool instance; None if not enabled
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (cls.INSTANCE_POOL_SIZE > 0):
+            _return = cls.__dict__.get("_instance_pool")
+
+            if (_return is None):
+                with cls._instance_pool_lock:
+                    # Thread safety
+                    _return = cls.__dict__.get("_instance_pool")
+
+                    if (_return is None):
+                        from .instance_pool import InstancePool
+
+                        _return = InstancePool(cls, cls.INSTANCE_POOL_SIZE, cls.INSTANCE_POOL_IDLE_TIMEOUT)
+                        cls._instance_pool = _return
+                    #
+                #
+            #
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def register_backend_pool(cls, backend_pool):
+        """
+Registers the "BackendPool" instance providing backend resources for this
+class. A resource is acquired for each call stack executed and shared by
+all of its methods through "backend_resource".
+
+:param cls: Python class
+:param backend_pool: BackendPool instance; None to unregister
+
+:since: v1.0.0
+        """
+
+        if (backend_pool is not None):
+            from .backend_pool import BackendPool
+
+            if (not isinstance(backend_pool, BackendPool)): raise TypeException("Backend pool given is invalid")
+        #
+
+        cls._backend_pool = backend_pool
+    #
+
+    @classmethod
+    def register_columnar_store(cls, store):
+        """
+Registers the "ColumnarStore" instance holding the data of this class.
+Filters may be evaluated against it with "ColumnarStore.filter()".
+
+:param cls: Python class
+:param store: ColumnarStore instance; None to unregister
+
+:since: v1.0.0
+        """
+
+        if (store is not None):
+            from .columnar_store import ColumnarStore
+
+            if (not isinstance(store, ColumnarStore)): raise TypeException("Columnar store given is invalid")
+        #
+
+        cls._columnar_store = store
+    #
+
+    @classmethod
+    def register_filter_optimizer(cls, optimizer):
+        """
+Registers the "FilterOptimizer" instance holding the field statistics of
+this class. Filters may be compiled with it using
+"AbstractFilterParser.compile()".
+
+:param cls: Python class
+:param optimizer: FilterOptimizer instance; None to unregister
+
+:since: v1.0.0
+        """
+
+        if (optimizer is not None):
+            from .filters.filter_optimizer import FilterOptimizer
+
+            if (not isinstance(optimizer, FilterOptimizer)): raise TypeException("Filter optimizer given is invalid")
+        #
+
+        cls._filter_optimizer = optimizer
+    #
+
+    def reset_pooled_instance(self):
+        """
+Resets the state of this instance before it is returned to its instance
+pool. Subclasses holding request specific state should extend it.
+
+:since: v1.0.0
+        """
+
+        self._access_control_instance = None
+    #
+
     @staticmethod
     def restrict_to_access_control_validated_execution(_callable):
         """
@@ -137,12 +373,21 @@ Restricts access to the callable to valid users.
 :since:  v1.0.0
     """
 
-        @wraps(_callable)
-        def proxymethod(self, *args, **kwargs):
-            if (not self.is_supported("access_control_validation")): raise AccessDeniedException()
-            return _callable(self, *args, **kwargs)
+        if (iscoroutinefunction(_callable)):
+            @wraps(_callable)
+            async def proxymethod(self, *args, **kwargs):
+                if (not self.is_supported("access_control_validation")): raise AccessDeniedException()
+                return await _callable(self, *args, **kwargs)
+            #
+        else:
+            @wraps(_callable)
+            def proxymethod(self, *args, **kwargs):
+                if (not self.is_supported("access_control_validation")): raise AccessDeniedException()
+                return _callable(self, *args, **kwargs)
+            #
         #
 
+        proxymethod.is_access_control_restricted = True
         return proxymethod
     #
 
@@ -157,17 +402,95 @@ Catch certain exceptions and wrap them in CRUD defined ones.
 :since:  v1.0.0
     """
 
-        @wraps(_callable)
-        def proxymethod(self, *args, **kwargs):
-            try: return _callable(self, *args, **kwargs)
-            except ( OperationFailedException, OperationNotSupportedException ): raise
-            except NotImplementedException as handled_exception: raise OperationNotSupportedException(_exception = handled_exception)
-            except _OperationNotSupportedException as handled_exception: raise OperationNotSupportedException(_exception = handled_exception)
-            except IOException as handled_exception: raise OperationFailedException(_exception = handled_exception)
-            except TypeError as handled_exception: raise InputValidationException(_exception = handled_exception)
-            except ValueError as handled_exception: raise InputValidationException(_exception = handled_exception)
+        if (isasyncgenfunction(_callable)):
+            @wraps(_callable)
+            async def proxymethod(self, *args, **kwargs):
+                try:
+                    async for item in _callable(self, *args, **kwargs): yield item
+                except Exception as handled_exception: raise Abstract._get_wrapped_exception(handled_exception)
+            #
+        elif (iscoroutinefunction(_callable)):
+            @wraps(_callable)
+            async def proxymethod(self, *args, **kwargs):
+                try: return await _callable(self, *args, **kwargs)
+                except Exception as handled_exception: raise Abstract._get_wrapped_exception(handled_exception)
+            #
+        elif (isgeneratorfunction(_callable)):
+            @wraps(_callable)
+            def proxymethod(self, *args, **kwargs):
+                try: return (yield from _callable(self, *args, **kwargs))
+                except Exception as handled_exception: raise Abstract._get_wrapped_exception(handled_exception)
+            #
+        else:
+            @wraps(_callable)
+            def proxymethod(self, *args, **kwargs):
+                try: return _callable(self, *args, **kwargs)
+                except Exception as handled_exception: raise Abstract._get_wrapped_exception(handled_exception)
+            #
         #
 
         return proxymethod
     #
+
+    @staticmethod
+    def declare_principal_independent_result(_callable):
+        """
+Declares that the result of the callable is the same for all principals
+and that access is not validated inside of it. Results of call stacks
+consisting of such methods only are cached for CRUD entity instances
+supporting "result_caching".
+
+:param _callable: Wrapped code
+
+:return: (object) Callable given
+:since:  v1.0.0
+    """
+
+        _callable.is_result_principal_independent = True
+        return _callable
+    #
+
+    @staticmethod
+    def _get_wrapped_exception(exception):
+        """
+Returns the CRUD defined exception matching the exception given.
+
+:param exception: Exception caught
+
+:return: (object) Exception to be raised
+:since:  v1.0.0
+        """
+
+        _return = exception
+
+        if (isinstance(exception, ( OperationFailedException, OperationNotSupportedException ))): pass
+        elif (isinstance(exception, ( NotImplementedException, _OperationNotSupportedException ))): _return = OperationNotSupportedException(_exception = exception)
+        elif (isinstance(exception, IOException)): _return = OperationFailedException(_exception = exception)
+        elif (isinstance(exception, ( TypeError, ValueError ))): _return = InputValidationException(_exception = exception)
+
+        return _return
+    #
+
+    def validate_cached_result_access(self, method_name, **kwargs):
+        """
+Validates access to a cached result of the given method before it is
+returned without calling the method again.
+
+:param method_name: CRUD entity instance method name
+:param kwargs: Keyword arguments of the method call
+
+:since: v1.0.0
+        """
+
+        _callable = getattr(self.__class__, method_name, None)
+
+        if (getattr(_callable, "is_access_control_restricted", False)
+            and (not self.is_supported("access_control_validation"))
+           ): raise AccessDeniedException()
+
+        if (self.access_control is not None):
+            module_name, instance_name = Instrumentation.get_class_entity_names(self.__class__)
+            self.access_control.validate(self, "{0}.{1}.{2}".format(module_name, instance_name, method_name), **kwargs)
+        #
+    #
 #
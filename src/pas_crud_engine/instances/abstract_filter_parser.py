@@ -17,13 +17,22 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+import marshal
+
+from array import array
+from hashlib import blake2b
+from types import MappingProxyType
+
 from dpt_json import JsonResource
 from dpt_runtime.binary import Binary
 from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_threading.thread_lock import ThreadLock
 
+from .filters import AndNode, ComparisonNode, InNode, OrNode, RangeNode
+from ..lru_cache import LruCache
 from ..input_validation_exception import InputValidationException
 from ..operation_not_supported_exception import OperationNotSupportedException
+from .streaming_filter_decoder import StreamingFilterDecoder
 
 class AbstractFilterParser(SupportsMixin):
     """
@@ -39,26 +48,62 @@ CRUD instance specific condition definition.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "_blacklisted_keys", "_filter", "_lock", "_raw_filter_string" ] + SupportsMixin._mixin_slots_
+    NORMALIZED_HASH_DIGEST_SIZE = 16
+    """
+Size in bytes of the canonical filter hash
+    """
+
+    __slots__ = [ "_ast", "_blacklisted_keys", "_filter", "_lock", "_normalized_ast", "_raw_filter_data", "_raw_filter_string" ] + SupportsMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _IMMUTABLE_CONTAINER_TYPES = frozenset(( dict, list, MappingProxyType, tuple ))
+    """
+Container types of parse results copied by "_get_mutable_data()"
+    """
+    _MARSHAL_SCALAR_TYPES = frozenset(( bool, float, int, str, type(None) ))
+    """
+Scalar types of parse results serialized with "marshal"
+    """
+    _parsed_filter_cache = LruCache(max_size = 1024)
+    """
+Process-wide cache of immutable parsed filter representations
+    """
 
     def __init__(self, filter_string):
         """
 Constructor __init__(AbstractFilterParser)
 
-:param filter_string: Raw JSON filter definition
+:param filter_string: Raw JSON filter definition. File-like objects and
+                      iterables of binary or string chunks are decoded
+                      incrementally; lists of numbers are represented as
+                      "array" instances and results are not cached in this
+                      case.
 
 :since: v1.0.0
         """
 
-        filter_string = Binary.str(filter_string)
-        if (not isinstance(filter_string, str)): raise InputValidationException("Filter given is invalid")
+        raw_filter_data = None
+
+        if (hasattr(filter_string, "read") or (hasattr(filter_string, "__iter__") and (not isinstance(filter_string, ( str, bytes, bytearray ))))):
+            raw_filter_data = StreamingFilterDecoder.decode(filter_string)
+            if (raw_filter_data is not None and type(raw_filter_data) not in ( dict, list, array )): raise InputValidationException("Filter definition given is invalid")
+
+            filter_string = ("" if (raw_filter_data is None) else None)
+        else:
+            filter_string = Binary.str(filter_string)
+            if (not isinstance(filter_string, str)): raise InputValidationException("Filter given is invalid")
+
+            filter_string = filter_string.strip()
+        #
 
         SupportsMixin.__init__(self)
 
+        self._ast = None
+        """
+Filter AST representation
+        """
         self._blacklisted_keys = [ ]
         """
 List of keys marked as blacklisted
@@ -71,19 +116,53 @@ Parser specific filter representation
         """
 Thread safety lock
         """
-        self._raw_filter_string = filter_string.strip()
+        self._normalized_ast = None
         """
-Raw JSON filter definition
+Canonical filter AST representation
         """
+        self._raw_filter_data = raw_filter_data
+        """
+Incrementally decoded filter definition; None if not streamed
+        """
+        self._raw_filter_string = filter_string
+        """
+Raw JSON filter definition; None if streamed
+        """
+
+        self.supported_features['parsed_filter_caching'] = (filter_string is not None)
 
-        if (len(self._raw_filter_string) < 1): self._set_empty_filter()
+        if (filter_string == ""): self._set_empty_filter()
+    #
+
+    @property
+    def ast(self):
+        """
+Returns the immutable filter AST for the raw filter string given. Lists
+of scalar values are represented as "InNode" instances and dictionaries
+containing the comparison operator keys "=", "!=", "<", "<=", ">" and ">="
+define comparisons and ranges for the field. Other dictionaries define
+conditions for nested fields separated by ".".
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        if (self._ast is None):
+            self._ast = (AndNode(( ))
+                         if (self._raw_filter_string == "") else
+                         self._get_cached_parse_result("ast", lambda: self._get_ast_node(None, self._get_raw_filter_data()))
+                        )
+        #
+
+        return self._ast
     #
 
     @property
     def filter(self):
         """
 Returns the parser specific filter representation for the raw filter string
-given.
+given. Representations cached are immutable and each parser instance
+returns its own copy with dictionaries and lists.
 
 :return: (mixed) Parser specific filter representation
 :since:  v1.0.0
@@ -93,6 +172,43 @@ given.
         return self._filter
     #
 
+    @property
+    def normalized_ast(self):
+        """
+Returns the canonical form of the filter AST. Children of "and" and "or"
+nodes are flattened, deduplicated and sorted, "InNode" values are
+deduplicated and sorted and "or" concatenated values of the same field are
+combined. Semantically identical filters therefore result in equal nodes.
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        if (self._normalized_ast is None):
+            self._normalized_ast = self._get_cached_parse_result("normalized_ast", lambda: self._get_normalized_node(self.ast))
+        #
+
+        return self._normalized_ast
+    #
+
+    @property
+    def normalized_hash(self):
+        """
+Returns a stable hash of the canonical filter AST. It is identical across
+processes and may be used as a key to share results and query plans of
+equivalent filters.
+
+:return: (str) Hex encoded hash value
+:since:  v1.0.0
+        """
+
+        return self._get_cached_parse_result("normalized_hash",
+                                             lambda: blake2b(self._get_node_sort_key(self.normalized_ast).encode("utf-8"),
+                                                             digest_size = self.__class__.NORMALIZED_HASH_DIGEST_SIZE
+                                                            ).hexdigest()
+                                            )
+    #
+
     def add_blacklisted_key(self, key):
         """
 Adds the given key to the filter blacklist.
@@ -110,6 +226,426 @@ Adds the given key to the filter blacklist.
         #
     #
 
+    def compile(self, backend, optimizer = None):
+        """
+Returns the backend specific form of the filter AST. Compiled forms are
+cached by the backend given.
+
+:param backend: Filter backend instance
+:param optimizer: FilterOptimizer instance to optimize the canonical filter
+                  AST with; None to compile the filter AST as given
+
+:return: (mixed) Backend specific form
+:since:  v1.0.0
+        """
+
+        return backend.compile(self.ast if (optimizer is None) else self.get_optimized_ast(optimizer))
+    #
+
+    def _get_ast_and_node(self, field, filter_data):
+        """
+Returns the filter AST node for the given dictionary representing an "and"
+concatenated filter definition.
+
+:param field: Field name; None for the top-level
+:param filter_data: "and" concatenated dictionary
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        children = [ ]
+        comparisons = { }
+
+        for key in filter_data:
+            if (key in self._blacklisted_keys): continue
+
+            if (field is not None and key in ComparisonNode.OPERATORS):
+                if (type(filter_data[key]) in ( dict, list )): raise InputValidationException("Filter comparison value given is invalid")
+                comparisons[key] = filter_data[key]
+            else:
+                children.append(self._get_ast_node((key if (field is None) else "{0}.{1}".format(field, key)),
+                                                   filter_data[key]
+                                                  )
+                               )
+            #
+        #
+
+        if (len(comparisons) > 0): children += self._get_ast_comparison_nodes(field, comparisons)
+
+        return (children[0] if (len(children) == 1) else AndNode(children))
+    #
+
+    @staticmethod
+    def _get_ast_comparison_nodes(field, comparisons):
+        """
+Returns the filter AST nodes for the given comparisons of a field. Lower
+and upper bounds are combined to a "RangeNode".
+
+:param field: Field name
+:param comparisons: Dictionary of comparison operators and values
+
+:return: (list) Filter AST nodes
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        lower_operator = (">=" if (">=" in comparisons) else (">" if (">" in comparisons) else None))
+        upper_operator = ("<=" if ("<=" in comparisons) else ("<" if ("<" in comparisons) else None))
+
+        is_range = (lower_operator is not None and upper_operator is not None)
+
+        if (is_range):
+            _return.append(RangeNode(field,
+                                     comparisons[lower_operator],
+                                     comparisons[upper_operator],
+                                     (lower_operator == ">="),
+                                     (upper_operator == "<=")
+                                    )
+                          )
+        #
+
+        for operator in comparisons:
+            if ((not is_range) or operator not in ( lower_operator, upper_operator )):
+                _return.append(ComparisonNode(field, operator, comparisons[operator]))
+            #
+        #
+
+        return _return
+    #
+
+    def _get_ast_node(self, field, filter_data):
+        """
+Returns the filter AST node for the given filter data representing an value
+or sub-condition.
+
+:param field: Field name; None for the top-level
+:param filter_data: Filter data
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        filter_data_type = type(filter_data)
+
+        if (filter_data_type is dict): _return = self._get_ast_and_node(field, filter_data)
+        elif (filter_data_type is list or filter_data_type is array): _return = self._get_ast_or_node(field, filter_data)
+        elif (field is None): raise InputValidationException("Filter definition given is invalid")
+        else: _return = ComparisonNode(field, "=", filter_data)
+
+        return _return
+    #
+
+    def _get_ast_or_node(self, field, filter_list):
+        """
+Returns the filter AST node for the given list representing an "or"
+concatenated filter definition.
+
+:param field: Field name; None for the top-level
+:param filter_list: "or" concatenated list
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        if (field is not None and all(type(filter_data) not in ( dict, list ) for filter_data in filter_list)):
+            _return = InNode(field, filter_list)
+        else:
+            children = [ self._get_ast_node(field, filter_data) for filter_data in filter_list ]
+            _return = (children[0] if (len(children) == 1) else OrNode(children))
+        #
+
+        return _return
+    #
+
+    def _get_cached_mutable_parse_result(self, result_type, parser):
+        """
+Returns a mutable copy of the cached parse result of the given type. Parse
+results are cached marshal serialized if supported to be copied efficiently
+and as immutable data otherwise.
+
+:param result_type: Parse result type
+:param parser: Python callable returning the parse result
+
+:return: (mixed) Parse result
+:since:  v1.0.0
+        """
+
+        if (not self.is_supported("parsed_filter_caching")): return parser()
+
+        key = ( self.__class__, result_type, self._raw_filter_string, frozenset(self._blacklisted_keys) )
+        cached_data = AbstractFilterParser._parsed_filter_cache.get(key)
+
+        if (cached_data is None):
+            _return = parser()
+
+            cached_data = (marshal.dumps(_return)
+                           if (self._is_marshal_supported_data(_return)) else
+                           self._get_immutable_data(_return)
+                          )
+
+            AbstractFilterParser._parsed_filter_cache.set(key, cached_data)
+        elif (type(cached_data) is bytes): _return = marshal.loads(cached_data)
+        else: _return = self._get_mutable_data(cached_data)
+
+        return _return
+    #
+
+    def _get_cached_parse_result(self, result_type, parser):
+        """
+Returns the cached parse result of the given type for the raw filter string
+and the blacklisted keys of this instance. The parser is called and its
+immutable result cached if no entry is cached.
+
+:param result_type: Parse result type
+:param parser: Python callable returning the parse result
+
+:return: (mixed) Parse result
+:since:  v1.0.0
+        """
+
+        if (not self.is_supported("parsed_filter_caching")): return parser()
+
+        key = ( self.__class__, result_type, self._raw_filter_string, frozenset(self._blacklisted_keys) )
+        _return = AbstractFilterParser._parsed_filter_cache.get(key)
+
+        if (_return is None):
+            _return = self._get_immutable_data(parser())
+            AbstractFilterParser._parsed_filter_cache.set(key, _return)
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_immutable_data(cls, data):
+        """
+Returns an immutable representation of the given parse result that can be
+shared between instances. Dictionaries are returned as read-only mappings
+and lists as tuples.
+
+:param cls: Python class
+:param data: Parse result
+
+:return: (mixed) Immutable parse result
+:since:  v1.0.0
+        """
+
+        data_type = type(data)
+
+        if (data_type is dict): _return = MappingProxyType(dict(( key, cls._get_immutable_data(data[key]) ) for key in data))
+        elif (data_type is list): _return = tuple(cls._get_immutable_data(value) for value in data)
+        else: _return = data
+
+        return _return
+    #
+
+    @classmethod
+    def _get_merged_or_children(cls, children):
+        """
+Returns the given normalized children of an "or" node with all "InNode"
+instances and "=" comparisons of the same field combined.
+
+:param cls: Python class
+:param children: Normalized child nodes
+
+:return: (list) Child nodes
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+        field_values = { }
+
+        for child in children:
+            child_type = type(child)
+
+            if (child_type is InNode): field_values.setdefault(child.field, [ ]).extend(child.values)
+            elif (child_type is ComparisonNode and child.operator == "="): field_values.setdefault(child.field, [ ]).append(child.value)
+            else: _return.append(child)
+        #
+
+        for field in field_values: _return.append(cls._get_normalized_node(InNode(field, field_values[field])))
+
+        return _return
+    #
+
+    @classmethod
+    def _get_mutable_data(cls, data):
+        """
+Returns a copy of the given immutable parse result with read-only mappings
+converted back to dictionaries and tuples to lists.
+
+:param cls: Python class
+:param data: Immutable parse result
+
+:return: (mixed) Parse result
+:since:  v1.0.0
+        """
+
+        data_type = type(data)
+        container_types = AbstractFilterParser._IMMUTABLE_CONTAINER_TYPES
+
+        if (data_type is MappingProxyType or data_type is dict):
+            _return = { key: (cls._get_mutable_data(value) if (type(value) in container_types) else value) for key, value in data.items() }
+        elif (data_type is tuple or data_type is list):
+            _return = [ (cls._get_mutable_data(value) if (type(value) in container_types) else value) for value in data ]
+        else: _return = data
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_node_sort_key(node):
+        """
+Returns the string representation of the given node structure used to sort
+nodes canonically.
+
+:param node: Filter AST node
+
+:return: (str) Sort key
+:since:  v1.0.0
+        """
+
+        return repr(node.key)
+    #
+
+    @classmethod
+    def _get_normalized_node(cls, node):
+        """
+Returns the canonical form of the given filter AST node.
+
+:param cls: Python class
+:param node: Filter AST node
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        node_type = type(node)
+
+        if (node_type is AndNode or node_type is OrNode):
+            children = { }
+
+            for child in node.children:
+                child = cls._get_normalized_node(child)
+
+                for flattened_child in (child.children if (type(child) is node_type) else ( child, )):
+                    children[cls._get_node_sort_key(flattened_child)] = flattened_child
+                #
+            #
+
+            if (node_type is OrNode):
+                children = dict(( cls._get_node_sort_key(child), child ) for child in cls._get_merged_or_children(children.values()))
+            #
+
+            _return = (children.popitem()[1]
+                       if (len(children) == 1) else
+                       node_type(children[key] for key in sorted(children))
+                      )
+        elif (node_type is InNode):
+            values = dict(( InNode._get_value_key(value), value ) for value in node.values)
+
+            _return = (ComparisonNode(node.field, "=", values.popitem()[1])
+                       if (len(values) == 1) else
+                       InNode(node.field, ( values[key] for key in sorted(values) ))
+                      )
+        else: _return = node
+
+        return _return
+    #
+
+    def get_optimized_ast(self, optimizer):
+        """
+Returns the canonical filter AST optimized with the given filter optimizer.
+
+:param optimizer: FilterOptimizer instance
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        return optimizer.optimize(self.normalized_ast)
+    #
+
+    @staticmethod
+    def get_parsed_filter_cache():
+        """
+Returns the process-wide cache of parsed filter representations. It may be
+used to read its statistics or to change its limits.
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return AbstractFilterParser._parsed_filter_cache
+    #
+
+    def _get_raw_filter_data(self):
+        """
+Returns the decoded top-level raw JSON filter definition.
+
+:return: (mixed) Decoded JSON filter definition
+:since:  v1.0.0
+        """
+
+        if (self._raw_filter_string is None): return self._raw_filter_data
+
+        if (self._raw_filter_string[:1] not in ( "[", "{" ) or self._raw_filter_string[-1:] not in ( "]", "}" )):
+            raise InputValidationException("Filter definition given is invalid")
+        #
+
+        _return = JsonResource.json_to_data(self._raw_filter_string)
+        if (_return is None): raise InputValidationException("Failed to parse filter definition given")
+
+        return _return
+    #
+
+    @staticmethod
+    def invalidate_parsed_filters(filter_string = None):
+        """
+Removes cached parsed filter representations.
+
+:param filter_string: Raw JSON filter definition to invalidate; None to
+                      invalidate all cached representations
+
+:return: (int) Number of cache entries removed
+:since:  v1.0.0
+        """
+
+        if (filter_string is None):
+            _return = len(AbstractFilterParser._parsed_filter_cache)
+            AbstractFilterParser._parsed_filter_cache.clear()
+        else:
+            filter_string = Binary.str(filter_string).strip()
+            _return = AbstractFilterParser._parsed_filter_cache.remove_matching(lambda key: key[2] == filter_string)
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _is_marshal_supported_data(cls, data):
+        """
+Checks if the given parse result only contains dictionaries, lists and
+scalar types restored unchanged by "marshal".
+
+:param cls: Python class
+:param data: Parse result
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        data_type = type(data)
+
+        if (data_type is dict): _return = all(( cls._is_marshal_supported_data(key) and cls._is_marshal_supported_data(data[key]) ) for key in data)
+        elif (data_type is list): _return = all(cls._is_marshal_supported_data(value) for value in data)
+        else: _return = (data_type in AbstractFilterParser._MARSHAL_SCALAR_TYPES)
+
+        return _return
+    #
+
     def _parse(self, key, filter_data):
         """
 Parses the given filter data representing an value or sub-condition.
@@ -127,7 +663,7 @@ Parses the given filter data representing an value or sub-condition.
             filter_data_type = type(filter_data)
 
             if (filter_data_type is dict): _return = self._parse_and_concatenation(filter_data)
-            elif (filter_data_type is list): _return = self._parse_or_concatenation(key, filter_data)
+            elif (filter_data_type is list or filter_data_type is array): _return = self._parse_or_concatenation(key, filter_data)
             else: _return = filter_data
         #
 
@@ -153,7 +689,7 @@ definition.
 Parses the given list representing an "or" concatenated filter definition.
 
 :param key: Key of filter level being parsed
-:param filter_list: "or" concatenated list
+:param filter_list: "or" concatenated list or "array" of numbers
 
 :return: (mixed) Parser specific filter representation
 :since:  v1.0.0
@@ -162,6 +698,20 @@ Parses the given list representing an "or" concatenated filter definition.
         raise OperationNotSupportedException()
     #
 
+    def _parse_raw_filter_data(self):
+        """
+Parses the decoded top-level raw JSON filter definition.
+
+:return: (mixed) Parser specific filter representation
+:since:  v1.0.0
+        """
+
+        _return = self._parse(None, self._get_raw_filter_data())
+        if (_return is None): raise InputValidationException("Failed to parse filter definition given")
+
+        return _return
+    #
+
     def _parse_raw_filter_string(self):
         """
 Parses the top-level raw JSON filter definition.
@@ -169,14 +719,7 @@ Parses the top-level raw JSON filter definition.
 :since:  v1.0.0
         """
 
-        if (self._filter is None):
-            if (self._raw_filter_string[:1] not in ( "[", "{" ) or self._raw_filter_string[-1:] not in ( "]", "}" )):
-                raise InputValidationException("Filter definition given is invalid")
-            #
-
-            self._filter = self._parse(None, JsonResource.json_to_data(self._raw_filter_string))
-            if (self._filter is None): raise InputValidationException("Failed to parse filter definition given")
-        #
+        if (self._filter is None): self._filter = self._get_cached_mutable_parse_result("filter", self._parse_raw_filter_data)
     #
 
     def remove_blacklisted_key(self, key):
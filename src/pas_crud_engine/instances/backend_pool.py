@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=broad-except
+
+from asyncio import get_running_loop, wait_for, TimeoutError as AsyncTimeoutError
+from collections import deque
+from threading import Condition
+from time import monotonic
+
+from dpt_runtime.exception_log_trap import ExceptionLogTrap
+from dpt_runtime.value_exception import ValueException
+
+from ..operation_failed_exception import OperationFailedException
+from ..protocol.abstract import Abstract as AbstractProtocol
+
+class BackendPool(object):
+    """
+"BackendPool" manages backend resources like database connections shared
+by CRUD entity instances. Resources are created with the factory given,
+verified with an optional health check before reuse and disposed with the
+optional dispose callable or their "close()" method.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_acquire_timeout",
+                  "_async_waiters",
+                  "_condition",
+                  "_dispose",
+                  "_factory",
+                  "_health_check",
+                  "_idle_resources",
+                  "_max_size",
+                  "_min_size",
+                  "_size",
+                  "_statistics"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, factory, min_size = 0, max_size = 8, health_check = None, acquire_timeout = None, dispose = None):
+        """
+Constructor __init__(BackendPool)
+
+:param factory: Callable returning a new backend resource
+:param min_size: Number of resources created on first use and kept
+:param max_size: Maximum number of resources
+:param health_check: Callable returning false for resources not to be
+                     reused; None to skip checks
+:param acquire_timeout: Seconds to wait for a resource; None to wait
+                        indefinitely
+:param dispose: Callable disposing a resource; None to call "close()" if
+                defined
+
+:since: v1.0.0
+        """
+
+        if (not callable(factory)): raise ValueException("Backend resource factory given is invalid")
+        if (type(max_size) is not int or max_size < 1): raise ValueException("Maximum pool size given is invalid")
+        if (type(min_size) is not int or min_size < 0 or min_size > max_size): raise ValueException("Minimum pool size given is invalid")
+        if (acquire_timeout is not None and (type(acquire_timeout) not in ( int, float ) or acquire_timeout < 0)): raise ValueException("Acquire timeout given is invalid")
+
+        self._acquire_timeout = acquire_timeout
+        """
+Seconds to wait for a resource
+        """
+        self._async_waiters = deque()
+        """
+Futures of asynchronous callers waiting for released resources
+        """
+        self._condition = Condition()
+        """
+Condition used to wait for released resources
+        """
+        self._dispose = dispose
+        """
+Callable disposing a resource
+        """
+        self._factory = factory
+        """
+Callable returning a new backend resource
+        """
+        self._health_check = health_check
+        """
+Callable returning false for resources not to be reused
+        """
+        self._idle_resources = None
+        """
+Idle resources; None until first used
+        """
+        self._max_size = max_size
+        """
+Maximum number of resources
+        """
+        self._min_size = min_size
+        """
+Number of resources created on first use
+        """
+        self._size = 0
+        """
+Number of resources created and not disposed
+        """
+        self._statistics = { "created": 0,
+                             "acquired": 0,
+                             "waits": 0,
+                             "timeouts": 0,
+                             "health_check_failures": 0,
+                             "disposed": 0
+                           }
+        """
+Pool counters
+        """
+    #
+
+    @property
+    def statistics(self):
+        """
+Returns the pool statistics.
+
+:return: (dict) Pool statistics
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            _return = self._statistics.copy()
+            idle_count = (0 if (self._idle_resources is None) else len(self._idle_resources))
+
+            _return.update({ "size": self._size,
+                             "idle": idle_count,
+                             "in_use": self._size - idle_count,
+                             "min_size": self._min_size,
+                             "max_size": self._max_size
+                           })
+        #
+
+        return _return
+    #
+
+    def acquire(self, timeout = None):
+        """
+Returns an idle backend resource or a new one. Waits for a resource to be
+released if the maximum pool size is reached.
+
+:param timeout: Seconds to wait; None for the pool default
+
+:return: (mixed) Backend resource
+:since:  v1.0.0
+        """
+
+        if (timeout is None): timeout = self._acquire_timeout
+        deadline = (None if (timeout is None) else monotonic() + timeout)
+
+        _return = None
+        is_acquired = False
+
+        while (not is_acquired):
+            _return = self._get_idle_resource_or_reserve(deadline)
+
+            if (_return is None):
+                _return = self._create()
+                is_acquired = True
+            elif (self._is_healthy(_return)): is_acquired = True
+            else:
+                with self._condition: self._statistics['health_check_failures'] += 1
+                self._dispose_resource(_return)
+            #
+        #
+
+        with self._condition: self._statistics['acquired'] += 1
+        return _return
+    #
+
+    async def aacquire(self, timeout = None):
+        """
+Returns a backend resource for asynchronous callers. Waiting for a released
+resource does not block the event loop or an executor thread. Resources
+are created and checked in the configured executor as this may block.
+
+:param timeout: Seconds to wait; None for the pool default
+
+:return: (mixed) Backend resource
+:since:  v1.0.0
+        """
+
+        if (timeout is None): timeout = self._acquire_timeout
+        deadline = (None if (timeout is None) else monotonic() + timeout)
+
+        if (self._idle_resources is None): await AbstractProtocol.call_in_executor(self._init_idle_resources)
+
+        _return = None
+        is_acquired = False
+
+        while (not is_acquired):
+            _return = await self._aget_idle_resource_or_reserve(deadline)
+
+            if (_return is None):
+                _return = await AbstractProtocol.call_in_executor(self._create)
+                is_acquired = True
+            elif (self._health_check is None or await AbstractProtocol.call_in_executor(self._is_healthy, _return)): is_acquired = True
+            else:
+                with self._condition: self._statistics['health_check_failures'] += 1
+                await AbstractProtocol.call_in_executor(self._dispose_resource, _return)
+            #
+        #
+
+        with self._condition: self._statistics['acquired'] += 1
+        return _return
+    #
+
+    async def _aget_idle_resource_or_reserve(self, deadline):
+        """
+Returns an idle resource or reserves a slot for a new one if the maximum
+pool size is not reached yet. Asynchronous callers wait for a future
+resolved by the thread releasing a resource.
+
+:param deadline: Monotonic time to give up waiting; None to wait
+                 indefinitely
+
+:return: (mixed) Idle backend resource; None if a slot has been reserved
+:since:  v1.0.0
+        """
+
+        loop = get_running_loop()
+
+        _return = None
+        is_available = False
+        is_waiting = False
+
+        while (not is_available):
+            waiter = None
+
+            with self._condition:
+                if (len(self._idle_resources) > 0):
+                    _return = self._idle_resources.pop()
+                    is_available = True
+                elif (self._size < self._max_size):
+                    self._size += 1
+                    is_available = True
+                else:
+                    if (not is_waiting):
+                        self._statistics['waits'] += 1
+                        is_waiting = True
+                    #
+
+                    remaining = (None if (deadline is None) else deadline - monotonic())
+
+                    if (remaining is not None and remaining <= 0):
+                        self._statistics['timeouts'] += 1
+                        raise OperationFailedException("Timed out waiting for a backend resource")
+                    #
+
+                    waiter = loop.create_future()
+                    self._async_waiters.append(( loop, waiter ))
+                #
+            #
+
+            if (waiter is not None):
+                try: await (waiter if (remaining is None) else wait_for(waiter, remaining))
+                except AsyncTimeoutError: self._remove_async_waiter(loop, waiter)
+                except BaseException:
+                    self._remove_async_waiter(loop, waiter)
+                    raise
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def close(self):
+        """
+Disposes all idle resources.
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            idle_resources = ([ ] if (self._idle_resources is None) else list(self._idle_resources))
+            if (self._idle_resources is not None): self._idle_resources.clear()
+        #
+
+        for resource in idle_resources: self._dispose_resource(resource)
+    #
+
+    def _create(self):
+        """
+Creates a new resource for a reserved slot.
+
+:return: (mixed) Backend resource
+:since:  v1.0.0
+        """
+
+        try: _return = self._factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._notify_waiters()
+            #
+
+            raise
+        #
+
+        with self._condition: self._statistics['created'] += 1
+        return _return
+    #
+
+    def _dispose_resource(self, resource):
+        """
+Disposes the given resource and frees its slot.
+
+:param resource: Backend resource
+
+:since: v1.0.0
+        """
+
+        with ExceptionLogTrap("pas_crud_engine"):
+            if (self._dispose is not None): self._dispose(resource)
+            else:
+                _callable = getattr(resource, "close", None)
+                if (callable(_callable)): _callable()
+            #
+        #
+
+        with self._condition:
+            self._size -= 1
+            self._statistics['disposed'] += 1
+
+            self._notify_waiters()
+        #
+    #
+
+    def _get_idle_resource_or_reserve(self, deadline):
+        """
+Returns an idle resource or reserves a slot for a new one if the maximum
+pool size is not reached yet.
+
+:param deadline: Monotonic time to give up waiting; None to wait
+                 indefinitely
+
+:return: (mixed) Idle backend resource; None if a slot has been reserved
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            if (self._idle_resources is None): self._init_idle_resources()
+
+            is_waiting = False
+
+            while (len(self._idle_resources) < 1 and self._size >= self._max_size):
+                if (not is_waiting):
+                    self._statistics['waits'] += 1
+                    is_waiting = True
+                #
+
+                remaining = (None if (deadline is None) else deadline - monotonic())
+
+                if (remaining is not None and remaining <= 0):
+                    self._statistics['timeouts'] += 1
+                    raise OperationFailedException("Timed out waiting for a backend resource")
+                #
+
+                self._condition.wait(remaining)
+            #
+
+            if (len(self._idle_resources) > 0): _return = self._idle_resources.pop()
+            else:
+                self._size += 1
+                _return = None
+            #
+        #
+
+        return _return
+    #
+
+    def _init_idle_resources(self):
+        """
+Creates the minimum number of resources on first use.
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            if (self._idle_resources is None):
+                self._idle_resources = deque()
+
+                while (self._size < self._min_size):
+                    self._idle_resources.append(self._factory())
+
+                    self._size += 1
+                    self._statistics['created'] += 1
+                #
+            #
+        #
+    #
+
+    def _is_healthy(self, resource):
+        """
+Returns true if the given idle resource passes the health check.
+
+:param resource: Backend resource
+
+:return: (bool) True if healthy
+:since:  v1.0.0
+        """
+
+        _return = True
+
+        if (self._health_check is not None):
+            try: _return = bool(self._health_check(resource))
+            except Exception: _return = False
+        #
+
+        return _return
+    #
+
+    def _notify_async_waiter(self):
+        """
+Wakes the longest waiting asynchronous caller. The condition lock must be
+held by the caller.
+
+:since: v1.0.0
+        """
+
+        while (len(self._async_waiters) > 0):
+            loop, waiter = self._async_waiters.popleft()
+
+            try:
+                loop.call_soon_threadsafe(self._resolve_async_waiter, waiter)
+                break
+            except RuntimeError: pass
+        #
+    #
+
+    def _notify_waiters(self):
+        """
+Wakes one synchronous and one asynchronous caller waiting for a resource.
+The condition lock must be held by the caller.
+
+:since: v1.0.0
+        """
+
+        self._condition.notify()
+        self._notify_async_waiter()
+    #
+
+    def release(self, resource, is_broken = False):
+        """
+Returns the given resource to the pool.
+
+:param resource: Backend resource acquired before
+:param is_broken: True to dispose the resource instead of reusing it
+
+:since: v1.0.0
+        """
+
+        if (is_broken): self._dispose_resource(resource)
+        else:
+            with self._condition:
+                self._idle_resources.append(resource)
+                self._notify_waiters()
+            #
+        #
+    #
+
+    def _remove_async_waiter(self, loop, waiter):
+        """
+Removes the given future of an asynchronous caller giving up waiting. The
+wake-up is passed on to the next caller if the future has already been
+resolved.
+
+:param loop: Event loop of the waiting caller
+:param waiter: Future of the waiting caller
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            if (( loop, waiter ) in self._async_waiters): self._async_waiters.remove(( loop, waiter ))
+            elif (waiter.done() and (not waiter.cancelled())): self._notify_async_waiter()
+        #
+    #
+
+    def _resolve_async_waiter(self, waiter):
+        """
+Resolves the given future of an asynchronous caller in its event loop.
+The next caller is woken instead if it is already done, e.g. because it
+timed out.
+
+:param waiter: Future of the waiting caller
+
+:since: v1.0.0
+        """
+
+        if (waiter.done()):
+            with self._condition: self._notify_async_waiter()
+        else: waiter.set_result(None)
+    #
+#
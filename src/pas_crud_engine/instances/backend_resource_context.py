@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from contextvars import ContextVar
+
+class BackendResourceContext(object):
+    """
+"BackendResourceContext" implements a context manager acquiring a backend
+resource from a "BackendPool" for the current execution context. Nested
+contexts for the same pool share the resource acquired first.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "backend_pool", "_resource", "_token" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _resources = ContextVar("pas_crud_engine_backend_resources", default = None)
+    """
+Context variable holding a dict of backend pools and acquired resources
+    """
+
+    def __init__(self, backend_pool):
+        """
+Constructor __init__(BackendResourceContext)
+
+:param backend_pool: BackendPool instance; None for a context without
+                     backend resource
+
+:since: v1.0.0
+        """
+
+        self.backend_pool = backend_pool
+        """
+BackendPool instance
+        """
+        self._resource = None
+        """
+Backend resource acquired by this context
+        """
+        self._token = None
+        """
+Context variable token to restore the previous state
+        """
+    #
+
+    def __enter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:return: (mixed) Backend resource; None without backend pool
+:since:  v1.0.0
+        """
+
+        _return = self.__class__.get_resource(self.backend_pool)
+
+        if (_return is None and self.backend_pool is not None):
+            _return = self.backend_pool.acquire()
+            self._set_resource(_return)
+        #
+
+        return _return
+    #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+:since:  v1.0.0
+        """
+
+        self._release_resource()
+        return False
+    #
+
+    async def __aenter__(self):
+        """
+python.org: Semantically similar to __enter__(), the only difference being
+that it must return an awaitable.
+
+:return: (mixed) Backend resource; None without backend pool
+:since:  v1.0.0
+        """
+
+        _return = self.__class__.get_resource(self.backend_pool)
+
+        if (_return is None and self.backend_pool is not None):
+            _return = await self.backend_pool.aacquire()
+            self._set_resource(_return)
+        #
+
+        return _return
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Semantically similar to __exit__(), the only difference being
+that it must return an awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  v1.0.0
+        """
+
+        self._release_resource()
+        return False
+    #
+
+    def _release_resource(self):
+        """
+Restores the previous context state and releases the backend resource
+acquired by this context.
+
+:since: v1.0.0
+        """
+
+        if (self._token is not None):
+            try: self.__class__._resources.reset(self._token)
+            except ValueError:
+                # Generators may be closed in a different context
+                resources = (self.__class__._resources.get() or { }).copy()
+                resources.pop(self.backend_pool, None)
+
+                self.__class__._resources.set(resources)
+            #
+
+            resource = self._resource
+
+            self._resource = None
+            self._token = None
+
+            self.backend_pool.release(resource)
+        #
+    #
+
+    def _set_resource(self, resource):
+        """
+Sets the given backend resource for the current execution context.
+
+:param resource: Backend resource
+
+:since: v1.0.0
+        """
+
+        resources = (self.__class__._resources.get() or { }).copy()
+        resources[self.backend_pool] = resource
+
+        self._resource = resource
+        self._token = self.__class__._resources.set(resources)
+    #
+
+    @staticmethod
+    def get_resource(backend_pool):
+        """
+Returns the backend resource acquired from the given pool for the current
+execution context.
+
+:param backend_pool: BackendPool instance
+
+:return: (mixed) Backend resource; None if not acquired
+:since:  v1.0.0
+        """
+
+        resources = BackendResourceContext._resources.get()
+        return (None if (resources is None or backend_pool is None) else resources.get(backend_pool))
+    #
+#
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+try: import numpy
+except ImportError: numpy = None
+
+from dpt_runtime.type_exception import TypeException
+from dpt_runtime.value_exception import ValueException
+
+from .abstract_filter_parser import AbstractFilterParser
+from .filters.abstract_node import AbstractNode
+from .filters.columnar_backend import ColumnarBackend
+
+class ColumnarStore(object):
+    """
+"ColumnarStore" holds entity data as columns of equal length. Filters are
+evaluated on whole columns at once instead of row by row. NumPy is used if
+available.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_columns", "_row_count" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _backend = ColumnarBackend()
+    """
+Columnar backend shared by all stores
+    """
+
+    def __init__(self, columns):
+        """
+Constructor __init__(ColumnarStore)
+
+:param columns: Dict of field names and column data (NumPy arrays, "array"
+                buffers or sequences)
+
+:since: v1.0.0
+        """
+
+        if (not isinstance(columns, dict)): raise TypeException("Columns given are invalid")
+
+        self._columns = { }
+        """
+Dict of field names and column data
+        """
+        self._row_count = None
+        """
+Number of rows
+        """
+
+        for field in columns:
+            column = columns[field]
+            if (not hasattr(column, "__getitem__")): column = list(column)
+
+            if (self._row_count is None): self._row_count = len(column)
+            elif (len(column) != self._row_count): raise ValueException("Column '{0}' length differs from the number of rows".format(field))
+
+            self._columns[field] = column
+        #
+
+        if (self._row_count is None): self._row_count = 0
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of rows
+:since:  v1.0.0
+        """
+
+        return self._row_count
+    #
+
+    @property
+    def columns(self):
+        """
+Returns the dict of field names and column data.
+
+:return: (dict) Columns
+:since:  v1.0.0
+        """
+
+        return self._columns
+    #
+
+    @property
+    def row_count(self):
+        """
+Returns the number of rows.
+
+:return: (int) Number of rows
+:since:  v1.0.0
+        """
+
+        return self._row_count
+    #
+
+    def filter(self, _filter):
+        """
+Returns the boolean mask of rows matching the filter given.
+
+:param _filter: Filter parser instance or filter AST node
+
+:return: (object) NumPy boolean array; list of booleans without NumPy
+:since:  v1.0.0
+        """
+
+        if (isinstance(_filter, AbstractFilterParser)): _filter = _filter.ast
+        if (not isinstance(_filter, AbstractNode)): raise TypeException("Filter given is invalid")
+
+        get_mask = self.__class__._backend.compile(_filter)
+        return get_mask(self._columns, self._row_count)
+    #
+
+    def get_column(self, field):
+        """
+Returns the column data for the field given.
+
+:param field: Field name
+
+:return: (mixed) Column data; None if not defined
+:since:  v1.0.0
+        """
+
+        return self._columns.get(field)
+    #
+
+    def get_matching_indices(self, _filter):
+        """
+Returns the row indices matching the filter given.
+
+:param _filter: Filter parser instance or filter AST node
+
+:return: (object) NumPy integer array; list of integers without NumPy
+:since:  v1.0.0
+        """
+
+        mask = self.filter(_filter)
+
+        return (list(index for index, value in enumerate(mask) if value)
+                if (numpy is None) else
+                numpy.flatnonzero(mask)
+               )
+    #
+
+    def iterate_rows(self, _filter = None, fields = None):
+        """
+Yields rows matching the filter given as dicts.
+
+:param _filter: Filter parser instance or filter AST node; None for all
+                rows
+:param fields: List of fields to return; None for all
+
+:return: (object) Generator of dicts
+:since:  v1.0.0
+        """
+
+        if (fields is None): fields = list(self._columns.keys())
+        columns = [ ( field, self._columns[field] ) for field in fields if field in self._columns ]
+
+        indices = (range(self._row_count) if (_filter is None) else self.get_matching_indices(_filter))
+
+        for index in indices:
+            yield dict(( field, column[index] ) for field, column in columns)
+        #
+    #
+#
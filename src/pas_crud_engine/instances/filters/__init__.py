@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from ...lazy_module_attributes import LazyModuleAttributes as _LazyModuleAttributes
+
+_LazyModuleAttributes.install(globals(),
+                              { "AbstractBackend": "abstract_backend",
+                                "AbstractNode": "abstract_node",
+                                "AndNode": "and_node",
+                                "ColumnarBackend": "columnar_backend",
+                                "ComparisonNode": "comparison_node",
+                                "FilterOptimizer": "filter_optimizer",
+                                "InNode": "in_node",
+                                "OrNode": "or_node",
+                                "PredicateBackend": "predicate_backend",
+                                "RangeNode": "range_node",
+                                "SqlBackend": "sql_backend"
+                              }
+                             )
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from ...lru_cache import LruCache
+from ...operation_not_supported_exception import OperationNotSupportedException
+
+class AbstractBackend(object):
+    """
+"AbstractBackend" provides common methods for backends compiling filter AST
+nodes into a backend specific form. Compiled forms are cached by the node
+structure.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_cache" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, cache_size = 256):
+        """
+Constructor __init__(AbstractBackend)
+
+:param cache_size: Maximum number of compiled forms cached
+
+:since: v1.0.0
+        """
+
+        self._cache = LruCache(max_size = cache_size)
+        """
+Cache of compiled forms
+        """
+    #
+
+    @property
+    def cache(self):
+        """
+Returns the cache of compiled forms.
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return self._cache
+    #
+
+    def compile(self, node):
+        """
+Returns the backend specific form of the given filter AST node.
+
+:param node: Filter AST node
+
+:return: (mixed) Backend specific form
+:since:  v1.0.0
+        """
+
+        _return = self._cache.get(node)
+
+        if (_return is None):
+            _return = self._compile_node(node)
+            self._cache.set(node, _return)
+        #
+
+        return _return
+    #
+
+    def _compile_node(self, node):
+        """
+Compiles the given filter AST node by calling the method
+"_compile_<node type>_node()" of this backend.
+
+:param node: Filter AST node
+
+:return: (mixed) Backend specific form
+:since:  v1.0.0
+        """
+
+        method = getattr(self, "_compile_{0}_node".format(node.NODE_TYPE), None)
+        if (method is None): raise OperationNotSupportedException("Filter node type '{0}' is not supported".format(node.NODE_TYPE))
+
+        return method(node)
+    #
+#
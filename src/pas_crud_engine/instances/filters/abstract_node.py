@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class AbstractNode(object):
+    """
+"AbstractNode" is the base class of all immutable filter AST nodes. Nodes
+are compared and hashed by their structure and may therefore be used as
+cache keys.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    NODE_TYPE = None
+    """
+Filter AST node type name
+    """
+
+    __slots__ = [ "_key" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, key):
+        """
+Constructor __init__(AbstractNode)
+
+:param key: Hashable tuple describing the node structure
+
+:since: v1.0.0
+        """
+
+        self._key = ( self.__class__.NODE_TYPE, ) + key
+        """
+Hashable tuple describing the node structure
+        """
+    #
+
+    def __eq__(self, other):
+        """
+python.org: The correspondence between operator symbols and method names is
+as follows: x==y calls x.__eq__(y)
+
+:param other: Object to compare with
+
+:return: (bool) True if equal
+:since:  v1.0.0
+        """
+
+        return (isinstance(other, AbstractNode) and self._key == other._key)
+    #
+
+    def __hash__(self):
+        """
+python.org: Called by built-in function hash() and for operations on
+members of hashed collections.
+
+:return: (int) Hash value
+:since:  v1.0.0
+        """
+
+        return hash(self._key)
+    #
+
+    def __ne__(self, other):
+        """
+python.org: The correspondence between operator symbols and method names is
+as follows: x!=y calls x.__ne__(y)
+
+:param other: Object to compare with
+
+:return: (bool) True if not equal
+:since:  v1.0.0
+        """
+
+        return (not self.__eq__(other))
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the
+"official" string representation of an object.
+
+:return: (str) String representation
+:since:  v1.0.0
+        """
+
+        return "{0}{1!r}".format(self.__class__.__name__, self._key[1:])
+    #
+
+    @property
+    def key(self):
+        """
+Returns the hashable tuple describing the node structure.
+
+:return: (tuple) Node structure
+:since:  v1.0.0
+        """
+
+        return self._key
+    #
+
+    @staticmethod
+    def _get_value_key(value):
+        """
+Returns a hashable representation of the given scalar value including its
+type. This prevents equal comparing values like "1" and "True" from being
+treated identically.
+
+:param value: Scalar value
+
+:return: (tuple) Type name and value
+:since:  v1.0.0
+        """
+
+        return ( value.__class__.__name__, value )
+    #
+#
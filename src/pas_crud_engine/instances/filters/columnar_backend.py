@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+from operator import and_, eq, ge, gt, le, lt, ne, or_
+
+try: import numpy
+except ImportError: numpy = None
+
+from .abstract_backend import AbstractBackend
+
+class ColumnarBackend(AbstractBackend):
+    """
+"ColumnarBackend" compiles filter AST nodes into Python callables
+calculating a boolean mask for columnar data. The callables are called
+with a mapping of field names to columns and the number of rows. Columns
+may be NumPy arrays, "array" buffers or sequences. Masks are NumPy boolean
+arrays if NumPy is available and lists of booleans otherwise.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    FLOAT64_EXACT_INT_MAX = 2 ** 53
+    """
+Highest integer represented exactly by 64 bit floating point numbers
+    """
+    INT64_MAX = 2 ** 63 - 1
+    """
+Highest 64 bit integer
+    """
+    INT64_MIN = -(2 ** 63)
+    """
+Lowest 64 bit integer
+    """
+    OPERATOR_FUNCTIONS = { "=": eq, "!=": ne, "<": lt, "<=": le, ">": gt, ">=": ge }
+    """
+Python functions for comparison operators
+    """
+    VECTORIZED_DTYPE_KINDS = "biufU"
+    """
+NumPy dtype kinds of columns compared vectorized
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def _compile_and_node(self, node):
+        """
+Compiles the given "and" node.
+
+:param node: Filter AST node
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        return self._get_concatenated_mask_callable(node.children, and_, True)
+    #
+
+    def _compile_comparison_node(self, node):
+        """
+Compiles the given comparison node.
+
+:param node: Filter AST node
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        compare = self.__class__.OPERATOR_FUNCTIONS[node.operator]
+        field = node.field
+        value = node.value
+
+        def get_mask(columns, row_count):
+            column = columns.get(field)
+
+            return (ColumnarBackend._get_constant_mask(False, row_count)
+                    if (column is None) else
+                    ColumnarBackend._get_compared_mask(column, row_count, lambda column_value: compare(column_value, value))
+                   )
+        #
+
+        return get_mask
+    #
+
+    def _compile_in_node(self, node):
+        """
+Compiles the given "in" node. NumPy columns are tested with "isin()" if
+the result is the same as for Python membership tests.
+
+:param node: Filter AST node
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        field = node.field
+        value_set = node.value_set
+        values = list(node.values)
+
+        def get_mask(columns, row_count):
+            column = columns.get(field)
+
+            if (column is None): _return = ColumnarBackend._get_constant_mask(False, row_count)
+            elif (numpy is None): _return = ColumnarBackend._get_row_mask(column, value_set.__contains__)
+            else:
+                _return = None
+                column_array = numpy.asarray(column)
+
+                if (ColumnarBackend._is_isin_exact(column_array.dtype.kind, values)):
+                    try: _return = numpy.isin(column_array, values)
+                    except ( OverflowError, TypeError ): pass
+                #
+
+                if (_return is None): _return = ColumnarBackend._get_row_mask(column, value_set.__contains__)
+            #
+
+            return _return
+        #
+
+        return get_mask
+    #
+
+    def _compile_or_node(self, node):
+        """
+Compiles the given "or" node.
+
+:param node: Filter AST node
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        return self._get_concatenated_mask_callable(node.children, or_, False)
+    #
+
+    def _compile_range_node(self, node):
+        """
+Compiles the given range node.
+
+:param node: Filter AST node
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        compare_lower = (ge if (node.is_lower_inclusive) else gt)
+        compare_upper = (le if (node.is_upper_inclusive) else lt)
+        field = node.field
+        lower = node.lower
+        upper = node.upper
+
+        def get_mask(columns, row_count):
+            column = columns.get(field)
+
+            return (ColumnarBackend._get_constant_mask(False, row_count)
+                    if (column is None) else
+                    ColumnarBackend._get_compared_mask(column,
+                                                       row_count,
+                                                       lambda column_value: and_(compare_lower(column_value, lower), compare_upper(column_value, upper))
+                                                      )
+                   )
+        #
+
+        return get_mask
+    #
+
+    def _get_concatenated_mask_callable(self, nodes, operator, empty_value):
+        """
+Returns a callable concatenating the masks of the given nodes with the
+operator given. Evaluation stops as soon as the result can not change
+anymore.
+
+:param nodes: Filter AST nodes
+:param operator: Python function ("and_" or "or_")
+:param empty_value: Constant mask value if no nodes are given
+
+:return: (object) Mask callable
+:since:  v1.0.0
+        """
+
+        mask_callables = tuple(self._compile_node(node) for node in nodes)
+
+        if (len(mask_callables) == 1): return mask_callables[0]
+
+        def get_mask(columns, row_count):
+            _return = None
+
+            for mask_callable in mask_callables:
+                mask = mask_callable(columns, row_count)
+                _return = (mask if (_return is None) else ColumnarBackend._get_combined_mask(_return, mask, operator))
+
+                if (ColumnarBackend._is_mask_constant(_return, (not empty_value))): break
+            #
+
+            return (ColumnarBackend._get_constant_mask(empty_value, row_count) if (_return is None) else _return)
+        #
+
+        return get_mask
+    #
+
+    @staticmethod
+    def _get_combined_mask(mask, other_mask, operator):
+        """
+Returns the element-wise combination of the given masks.
+
+:param mask: Boolean mask
+:param other_mask: Boolean mask
+:param operator: Python function ("and_" or "or_")
+
+:return: (object) Boolean mask
+:since:  v1.0.0
+        """
+
+        return (operator(mask, other_mask)
+                if (numpy is not None) else
+                [ bool(operator(value, other_value)) for value, other_value in zip(mask, other_mask) ]
+               )
+    #
+
+    @staticmethod
+    def _get_compared_mask(column, row_count, compare):
+        """
+Returns the boolean mask for the given column and comparison function.
+NumPy columns of booleans, numbers and strings are compared vectorized
+while all other columns, e.g. ones containing None, are compared row by
+row. Values not comparable result in false.
+
+:param column: Column data
+:param row_count: Number of rows
+:param compare: Python function comparing a column value
+
+:return: (object) Boolean mask
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (numpy is not None):
+            column_array = numpy.asarray(column)
+
+            if (column_array.dtype.kind in ColumnarBackend.VECTORIZED_DTYPE_KINDS):
+                try:
+                    _return = numpy.asarray(compare(column_array), dtype = bool)
+                    if (_return.ndim == 0): _return = ColumnarBackend._get_constant_mask(bool(_return), row_count)
+                except TypeError: _return = ColumnarBackend._get_constant_mask(False, row_count)
+                except OverflowError: pass
+            #
+        #
+
+        if (_return is None): _return = ColumnarBackend._get_row_mask(column, compare)
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_constant_mask(value, row_count):
+        """
+Returns a boolean mask with all values set to the one given.
+
+:param value: Boolean value
+:param row_count: Number of rows
+
+:return: (object) Boolean mask
+:since:  v1.0.0
+        """
+
+        return ([ value ] * row_count if (numpy is None) else numpy.full(row_count, value, dtype = bool))
+    #
+
+    @staticmethod
+    def _get_row_mask(column, compare):
+        """
+Returns the boolean mask for the given column and comparison function
+compared row by row. Values not comparable result in false.
+
+:param column: Column data
+:param compare: Python function comparing a column value
+
+:return: (object) Boolean mask
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        for column_value in column:
+            try: _return.append(bool(compare(column_value)))
+            except TypeError: _return.append(False)
+        #
+
+        return (_return if (numpy is None) else numpy.array(_return, dtype = bool))
+    #
+
+    @staticmethod
+    def _is_isin_exact(dtype_kind, values):
+        """
+Returns true if "numpy.isin()" returns the same result for a column of the
+given NumPy dtype kind as Python membership tests of the values given.
+NumPy converts mixed values to a common type, e.g. numbers to strings.
+
+:param dtype_kind: NumPy dtype kind of the column
+:param values: Values tested
+
+:return: (bool) True if exact
+:since:  v1.0.0
+        """
+
+        if (dtype_kind == "U"): _return = all(type(value) is str for value in values)
+        elif (dtype_kind in "biu"):
+            _return = all((type(value) is bool or (type(value) is int and ColumnarBackend.INT64_MIN <= value <= ColumnarBackend.INT64_MAX))
+                          for value in values
+                         )
+        elif (dtype_kind == "f"):
+            _return = all((type(value) in ( bool, float ) or (type(value) is int and abs(value) <= ColumnarBackend.FLOAT64_EXACT_INT_MAX))
+                          for value in values
+                         )
+        else: _return = False
+
+        return _return
+    #
+
+    @staticmethod
+    def _is_mask_constant(mask, value):
+        """
+Returns true if all values of the given mask are equal to the one given.
+
+:param mask: Boolean mask
+:param value: Boolean value
+
+:return: (bool) True if constant
+:since:  v1.0.0
+        """
+
+        if (numpy is None): _return = ((False not in mask) if (value) else (True not in mask))
+        else: _return = (bool(mask.all()) if (value) else (not mask.any()))
+
+        return _return
+    #
+#
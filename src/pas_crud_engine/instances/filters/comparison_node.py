@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.value_exception import ValueException
+
+from .abstract_node import AbstractNode
+
+class ComparisonNode(AbstractNode):
+    """
+"ComparisonNode" compares the value of a field with a scalar value.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    NODE_TYPE = "comparison"
+    """
+Filter AST node type name
+    """
+    OPERATORS = ( "=", "!=", "<", "<=", ">", ">=" )
+    """
+Comparison operators supported
+    """
+
+    __slots__ = [ "_field", "_operator", "_value" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, field, operator, value):
+        """
+Constructor __init__(ComparisonNode)
+
+:param field: Field name
+:param operator: Comparison operator
+:param value: Scalar value to compare with
+
+:since: v1.0.0
+        """
+
+        if (operator not in self.__class__.OPERATORS): raise ValueException("Comparison operator given is invalid")
+
+        self._field = field
+        """
+Field name
+        """
+        self._operator = operator
+        """
+Comparison operator
+        """
+        self._value = value
+        """
+Scalar value to compare with
+        """
+
+        AbstractNode.__init__(self, ( field, operator, AbstractNode._get_value_key(value) ))
+    #
+
+    @property
+    def field(self):
+        """
+Returns the field name.
+
+:return: (str) Field name
+:since:  v1.0.0
+        """
+
+        return self._field
+    #
+
+    @property
+    def operator(self):
+        """
+Returns the comparison operator.
+
+:return: (str) Comparison operator
+:since:  v1.0.0
+        """
+
+        return self._operator
+    #
+
+    @property
+    def value(self):
+        """
+Returns the scalar value to compare with.
+
+:return: (mixed) Scalar value
+:since:  v1.0.0
+        """
+
+        return self._value
+    #
+#
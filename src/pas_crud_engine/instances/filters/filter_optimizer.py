@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.type_exception import TypeException
+
+from ...lru_cache import LruCache
+from .and_node import AndNode
+from .comparison_node import ComparisonNode
+from .in_node import InNode
+from .or_node import OrNode
+from .range_node import RangeNode
+
+class FilterOptimizer(object):
+    """
+"FilterOptimizer" rewrites filter AST nodes based on field statistics
+supplied by an entity. Children of "and" nodes are ordered by their
+estimated cost and selectivity so that cheap and restrictive conditions are
+evaluated first. Contradictory conditions are replaced by an empty "or"
+node matching nothing before any backend work is done.
+
+Field statistics are dicts with the optional keys "cardinality" (number of
+distinct values), "is_indexed" (true if an index is available for the
+field) and "cost" (relative evaluation cost overriding the index based
+default).
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    DEFAULT_CARDINALITY = 10
+    """
+Number of distinct values assumed for fields without statistics
+    """
+    DEFAULT_COMPARISON_SELECTIVITY = 0.33
+    """
+Fraction of rows assumed to match a "<", "<=", ">" or ">=" comparison
+    """
+    DEFAULT_RANGE_SELECTIVITY = 0.25
+    """
+Fraction of rows assumed to match a range
+    """
+    FIELD_COST = 1.0
+    """
+Relative cost to evaluate a condition for a field without index
+    """
+    INDEXED_FIELD_COST = 0.1
+    """
+Relative cost to evaluate a condition for an indexed field
+    """
+
+    __slots__ = [ "_cache", "_field_statistics" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, field_statistics = None, cache_size = 256):
+        """
+Constructor __init__(FilterOptimizer)
+
+:param field_statistics: Dict of field names and statistics
+:param cache_size: Maximum number of optimized nodes cached
+
+:since: v1.0.0
+        """
+
+        self._cache = LruCache(max_size = cache_size)
+        """
+Cache of optimized nodes
+        """
+        self._field_statistics = { }
+        """
+Dict of field names and statistics
+        """
+
+        if (field_statistics is not None): self.field_statistics = field_statistics
+    #
+
+    @property
+    def cache(self):
+        """
+Returns the cache of optimized nodes.
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return self._cache
+    #
+
+    @property
+    def field_statistics(self):
+        """
+Returns the dict of field names and statistics.
+
+:return: (dict) Field statistics
+:since:  v1.0.0
+        """
+
+        return self._field_statistics
+    #
+
+    @field_statistics.setter
+    def field_statistics(self, field_statistics):
+        """
+Sets the dict of field names and statistics. Optimized nodes cached are
+discarded.
+
+:param field_statistics: Dict of field names and statistics
+
+:since: v1.0.0
+        """
+
+        if (not isinstance(field_statistics, dict)): raise TypeException("Field statistics given are invalid")
+
+        self._field_statistics = dict(field_statistics)
+        self._cache.clear()
+    #
+
+    def get_estimate(self, node):
+        """
+Returns the estimated relative cost to evaluate the given node for a row
+and the estimated fraction of rows matching it. Children of "and" and "or"
+nodes are assumed to be evaluated in the order given until the result is
+known.
+
+:param node: Filter AST node
+
+:return: (tuple) Estimated cost and selectivity
+:since:  v1.0.0
+        """
+
+        node_type = type(node)
+
+        if (node_type is AndNode or node_type is OrNode):
+            cost = 0.0
+            remaining = 1.0
+
+            for child in node.children:
+                child_cost, child_selectivity = self.get_estimate(child)
+
+                cost += remaining * child_cost
+                remaining *= (child_selectivity if (node_type is AndNode) else 1 - child_selectivity)
+            #
+
+            _return = ( cost, (remaining if (node_type is AndNode) else 1 - remaining) )
+        elif (node_type in ( ComparisonNode, InNode, RangeNode )):
+            statistics = self._field_statistics.get(node.field, { })
+
+            cost = statistics.get("cost",
+                                  (self.__class__.INDEXED_FIELD_COST
+                                   if (statistics.get("is_indexed", False)) else
+                                   self.__class__.FIELD_COST
+                                  )
+                                 )
+
+            cardinality = max(1, statistics.get("cardinality", self.__class__.DEFAULT_CARDINALITY))
+
+            if (node_type is InNode): selectivity = min(1.0, len(node.value_set) / cardinality)
+            elif (node_type is RangeNode): selectivity = self.__class__.DEFAULT_RANGE_SELECTIVITY
+            elif (node.operator == "="): selectivity = 1.0 / cardinality
+            elif (node.operator == "!="): selectivity = 1.0 - 1.0 / cardinality
+            else: selectivity = self.__class__.DEFAULT_COMPARISON_SELECTIVITY
+
+            _return = ( cost, selectivity )
+        else: _return = ( self.__class__.FIELD_COST, 1.0 )
+
+        return _return
+    #
+
+    def _get_optimized_and_node(self, node):
+        """
+Returns the optimized form of the given "and" node.
+
+:param node: Filter AST node
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        children = [ ]
+
+        for child in node.children:
+            child = self._get_optimized_node(child)
+
+            if (self.is_matching_nothing(child)): return OrNode(( ))
+            if (type(child) is AndNode): children += child.children
+            else: children.append(child)
+        #
+
+        if (self._is_contradictory(children)): _return = OrNode(( ))
+        elif (len(children) == 1): _return = children[0]
+        else: _return = AndNode(sorted(children, key = self._get_rank))
+
+        return _return
+    #
+
+    def _get_optimized_node(self, node):
+        """
+Returns the optimized form of the given node.
+
+:param node: Filter AST node
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        node_type = type(node)
+
+        if (node_type is AndNode): _return = self._get_optimized_and_node(node)
+        elif (node_type is OrNode): _return = self._get_optimized_or_node(node)
+        elif (self._is_contradictory(( node, ))): _return = OrNode(( ))
+        else: _return = node
+
+        return _return
+    #
+
+    def _get_optimized_or_node(self, node):
+        """
+Returns the optimized form of the given "or" node. Children matching
+nothing are removed.
+
+:param node: Filter AST node
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        children = [ ]
+
+        for child in node.children:
+            child = self._get_optimized_node(child)
+
+            if (type(child) is AndNode and len(child.children) < 1): return child
+            if (type(child) is OrNode): children += child.children
+            else: children.append(child)
+        #
+
+        return (children[0] if (len(children) == 1) else OrNode(children))
+    #
+
+    def _get_rank(self, node):
+        """
+Returns the rank of the given node used to order the children of an "and"
+node. Conditions with a low cost per row rejected are ranked first.
+
+:param node: Filter AST node
+
+:return: (float) Rank
+:since:  v1.0.0
+        """
+
+        cost, selectivity = self.get_estimate(node)
+        return (float("inf") if (selectivity >= 1) else cost / (1 - selectivity))
+    #
+
+    @classmethod
+    def _is_contradictory(cls, nodes):
+        """
+Returns true if the given "and" concatenated nodes can not match any row.
+Values of different types that can not be compared are never considered
+to be contradictory.
+
+:param cls: Python class
+:param nodes: Filter AST nodes
+
+:return: (bool) True if contradictory
+:since:  v1.0.0
+        """
+
+        field_nodes = { }
+
+        for node in nodes:
+            if (type(node) in ( ComparisonNode, InNode, RangeNode )): field_nodes.setdefault(node.field, [ ]).append(node)
+        #
+
+        _return = False
+
+        for field in field_nodes:
+            try: _return = cls._is_field_contradictory(field_nodes[field])
+            except TypeError: pass
+
+            if (_return): break
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _is_field_contradictory(nodes):
+        """
+Returns true if the given "and" concatenated nodes of the same field can
+not match any value.
+
+:param nodes: Filter AST nodes of the same field
+
+:return: (bool) True if contradictory
+:since:  v1.0.0
+        """
+
+        excluded_values = [ ]
+        lower_bounds = [ ]
+        upper_bounds = [ ]
+        values = None
+
+        for node in nodes:
+            node_type = type(node)
+            value_set = None
+
+            if (node_type is InNode): value_set = node.value_set
+            elif (node_type is RangeNode):
+                lower_bounds.append(( node.lower, node.is_lower_inclusive ))
+                upper_bounds.append(( node.upper, node.is_upper_inclusive ))
+            elif (node.operator == "="): value_set = ( node.value, )
+            elif (node.operator == "!="): excluded_values.append(node.value)
+            elif (node.operator in ( ">", ">=" )): lower_bounds.append(( node.value, (node.operator == ">=") ))
+            else: upper_bounds.append(( node.value, (node.operator == "<=") ))
+
+            if (value_set is not None): values = (list(value_set) if (values is None) else [ value for value in values if value in value_set ])
+        #
+
+        if (values is None):
+            _return = any((lower > upper or (lower == upper and (not (is_lower_inclusive and is_upper_inclusive))))
+                          for lower, is_lower_inclusive in lower_bounds
+                          for upper, is_upper_inclusive in upper_bounds
+                         )
+        else:
+            _return = all((value in excluded_values
+                           or any((value < lower or (value == lower and (not is_inclusive))) for lower, is_inclusive in lower_bounds)
+                           or any((value > upper or (value == upper and (not is_inclusive))) for upper, is_inclusive in upper_bounds)
+                          )
+                          for value in values
+                         )
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def is_matching_nothing(node):
+        """
+Returns true if the given node is known to match no row.
+
+:param node: Filter AST node
+
+:return: (bool) True if matching nothing
+:since:  v1.0.0
+        """
+
+        node_type = type(node)
+
+        return ((node_type is OrNode and len(node.children) < 1)
+                or (node_type is InNode and len(node.values) < 1)
+               )
+    #
+
+    def optimize(self, node):
+        """
+Returns the optimized form of the given filter AST node. Results are
+cached by the node structure.
+
+:param node: Filter AST node
+
+:return: (object) Filter AST node
+:since:  v1.0.0
+        """
+
+        _return = self._cache.get(node)
+
+        if (_return is None):
+            _return = self._get_optimized_node(node)
+            self._cache.set(node, _return)
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .abstract_node import AbstractNode
+
+class InNode(AbstractNode):
+    """
+"InNode" matches if the value of a field is one of the given scalar values.
+The values are kept in the order given while membership is tested against
+a set.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    NODE_TYPE = "in"
+    """
+Filter AST node type name
+    """
+
+    __slots__ = [ "_field", "_value_set", "_values" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, field, values):
+        """
+Constructor __init__(InNode)
+
+:param field: Field name
+:param values: Scalar values
+
+:since: v1.0.0
+        """
+
+        self._field = field
+        """
+Field name
+        """
+        self._values = tuple(values)
+        """
+Scalar values in the order given
+        """
+        self._value_set = frozenset(self._values)
+        """
+Scalar values for membership tests
+        """
+
+        AbstractNode.__init__(self, ( field, tuple(AbstractNode._get_value_key(value) for value in self._values) ))
+    #
+
+    def __contains__(self, value):
+        """
+python.org: Called to implement membership test operators.
+
+:param value: Value to test
+
+:return: (bool) True if the value is one of the node values
+:since:  v1.0.0
+        """
+
+        return (value in self._value_set)
+    #
+
+    @property
+    def field(self):
+        """
+Returns the field name.
+
+:return: (str) Field name
+:since:  v1.0.0
+        """
+
+        return self._field
+    #
+
+    @property
+    def value_set(self):
+        """
+Returns the scalar values as a set.
+
+:return: (frozenset) Scalar values
+:since:  v1.0.0
+        """
+
+        return self._value_set
+    #
+
+    @property
+    def values(self):
+        """
+Returns the scalar values in the order given.
+
+:return: (tuple) Scalar values
+:since:  v1.0.0
+        """
+
+        return self._values
+    #
+#
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .abstract_node import AbstractNode
+
+class OrNode(AbstractNode):
+    """
+"OrNode" matches if at least one of its child nodes matches. An "OrNode"
+without children matches nothing.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    NODE_TYPE = "or"
+    """
+Filter AST node type name
+    """
+
+    __slots__ = [ "_children" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, children):
+        """
+Constructor __init__(OrNode)
+
+:param children: Child nodes
+
+:since: v1.0.0
+        """
+
+        self._children = tuple(children)
+        """
+Child nodes
+        """
+
+        AbstractNode.__init__(self, ( self._children, ))
+    #
+
+    @property
+    def children(self):
+        """
+Returns the child nodes.
+
+:return: (tuple) Child nodes
+:since:  v1.0.0
+        """
+
+        return self._children
+    #
+#
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+from operator import eq, ge, gt, le, lt, ne
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
+from .abstract_backend import AbstractBackend
+
+class PredicateBackend(AbstractBackend):
+    """
+"PredicateBackend" compiles filter AST nodes into Python callables
+returning true for matching rows. Rows are mappings and nested fields are
+separated by ".".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    MISSING = object()
+    """
+Value returned for fields not defined in a row
+    """
+    OPERATOR_FUNCTIONS = { "=": eq, "!=": ne, "<": lt, "<=": le, ">": gt, ">=": ge }
+    """
+Python functions for comparison operators
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def _compile_and_node(self, node):
+        """
+Compiles the given "and" node.
+
+:param node: Filter AST node
+
+:return: (object) Predicate callable
+:since:  v1.0.0
+        """
+
+        predicates = tuple(self._compile_node(child) for child in node.children)
+
+        if (len(predicates) == 1): return predicates[0]
+
+        def predicate(row):
+            for child_predicate in predicates:
+                if (not child_predicate(row)): return False
+            #
+
+            return True
+        #
+
+        return predicate
+    #
+
+    def _compile_comparison_node(self, node):
+        """
+Compiles the given comparison node.
+
+:param node: Filter AST node
+
+:return: (object) Predicate callable
+:since:  v1.0.0
+        """
+
+        compare = self.__class__.OPERATOR_FUNCTIONS[node.operator]
+        get_field_value = self._get_field_value_getter(node.field)
+        value = node.value
+
+        def predicate(row):
+            field_value = get_field_value(row)
+            if (field_value is PredicateBackend.MISSING): return False
+
+            try: return compare(field_value, value)
+            except TypeError: return False
+        #
+
+        return predicate
+    #
+
+    def _compile_in_node(self, node):
+        """
+Compiles the given "in" node.
+
+:param node: Filter AST node
+
+:return: (object) Predicate callable
+:since:  v1.0.0
+        """
+
+        get_field_value = self._get_field_value_getter(node.field)
+        value_set = node.value_set
+
+        def predicate(row):
+            try: return (get_field_value(row) in value_set)
+            except TypeError: return False
+        #
+
+        return predicate
+    #
+
+    def _compile_or_node(self, node):
+        """
+Compiles the given "or" node.
+
+:param node: Filter AST node
+
+:return: (object) Predicate callable
+:since:  v1.0.0
+        """
+
+        predicates = tuple(self._compile_node(child) for child in node.children)
+
+        if (len(predicates) == 1): return predicates[0]
+
+        def predicate(row):
+            for child_predicate in predicates:
+                if (child_predicate(row)): return True
+            #
+
+            return False
+        #
+
+        return predicate
+    #
+
+    def _compile_range_node(self, node):
+        """
+Compiles the given range node.
+
+:param node: Filter AST node
+
+:return: (object) Predicate callable
+:since:  v1.0.0
+        """
+
+        compare_lower = (ge if (node.is_lower_inclusive) else gt)
+        compare_upper = (le if (node.is_upper_inclusive) else lt)
+        get_field_value = self._get_field_value_getter(node.field)
+        lower = node.lower
+        upper = node.upper
+
+        def predicate(row):
+            field_value = get_field_value(row)
+            if (field_value is PredicateBackend.MISSING): return False
+
+            try: return (compare_lower(field_value, lower) and compare_upper(field_value, upper))
+            except TypeError: return False
+        #
+
+        return predicate
+    #
+
+    @staticmethod
+    def _get_field_value_getter(field):
+        """
+Returns a callable returning the value of the given field for a row.
+
+:param field: Field name
+
+:return: (object) Field value callable
+:since:  v1.0.0
+        """
+
+        names = field.split(".")
+
+        if (len(names) == 1):
+            def get_field_value(row): return row.get(field, PredicateBackend.MISSING)
+        else:
+            def get_field_value(row):
+                value = row
+
+                for name in names:
+                    if (not isinstance(value, Mapping)): return PredicateBackend.MISSING
+
+                    value = value.get(name, PredicateBackend.MISSING)
+                    if (value is PredicateBackend.MISSING): break
+                #
+
+                return value
+            #
+        #
+
+        return get_field_value
+    #
+#
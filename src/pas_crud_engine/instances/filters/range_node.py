@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .abstract_node import AbstractNode
+
+class RangeNode(AbstractNode):
+    """
+"RangeNode" matches if the value of a field is within the given lower and
+upper bound.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    NODE_TYPE = "range"
+    """
+Filter AST node type name
+    """
+
+    __slots__ = [ "_field", "_is_lower_inclusive", "_is_upper_inclusive", "_lower", "_upper" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, field, lower, upper, is_lower_inclusive = True, is_upper_inclusive = True):
+        """
+Constructor __init__(RangeNode)
+
+:param field: Field name
+:param lower: Lower bound
+:param upper: Upper bound
+:param is_lower_inclusive: True if the lower bound is part of the range
+:param is_upper_inclusive: True if the upper bound is part of the range
+
+:since: v1.0.0
+        """
+
+        self._field = field
+        """
+Field name
+        """
+        self._is_lower_inclusive = is_lower_inclusive
+        """
+True if the lower bound is part of the range
+        """
+        self._is_upper_inclusive = is_upper_inclusive
+        """
+True if the upper bound is part of the range
+        """
+        self._lower = lower
+        """
+Lower bound
+        """
+        self._upper = upper
+        """
+Upper bound
+        """
+
+        AbstractNode.__init__(self,
+                              ( field,
+                                AbstractNode._get_value_key(lower),
+                                AbstractNode._get_value_key(upper),
+                                is_lower_inclusive,
+                                is_upper_inclusive
+                              )
+                             )
+    #
+
+    @property
+    def field(self):
+        """
+Returns the field name.
+
+:return: (str) Field name
+:since:  v1.0.0
+        """
+
+        return self._field
+    #
+
+    @property
+    def is_lower_inclusive(self):
+        """
+Returns true if the lower bound is part of the range.
+
+:return: (bool) True if inclusive
+:since:  v1.0.0
+        """
+
+        return self._is_lower_inclusive
+    #
+
+    @property
+    def is_upper_inclusive(self):
+        """
+Returns true if the upper bound is part of the range.
+
+:return: (bool) True if inclusive
+:since:  v1.0.0
+        """
+
+        return self._is_upper_inclusive
+    #
+
+    @property
+    def lower(self):
+        """
+Returns the lower bound.
+
+:return: (mixed) Lower bound
+:since:  v1.0.0
+        """
+
+        return self._lower
+    #
+
+    @property
+    def upper(self):
+        """
+Returns the upper bound.
+
+:return: (mixed) Upper bound
+:since:  v1.0.0
+        """
+
+        return self._upper
+    #
+#
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import re
+
+from .abstract_backend import AbstractBackend
+from ...input_validation_exception import InputValidationException
+
+class SqlBackend(AbstractBackend):
+    """
+"SqlBackend" compiles filter AST nodes into a tuple of a SQL WHERE clause
+fragment and the parameters to be bound to its placeholders. Nested fields
+separated by "." are quoted as qualified identifiers.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    OPERATOR_SQL = { "=": "=", "!=": "<>", "<": "<", "<=": "<=", ">": ">", ">=": ">=" }
+    """
+SQL operators for comparison operators
+    """
+    RE_FIELD_NAME = re.compile("^\\w+(\\.\\w+)*$")
+    """
+RegExp to validate field names used as SQL identifiers
+    """
+
+    __slots__ = [ "_identifier_quote", "_placeholder" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, placeholder = "?", identifier_quote = '"', cache_size = 256):
+        """
+Constructor __init__(SqlBackend)
+
+:param placeholder: Placeholder used for bound parameters, e.g. "?" or "%s"
+:param identifier_quote: Character used to quote identifiers
+:param cache_size: Maximum number of compiled forms cached
+
+:since: v1.0.0
+        """
+
+        AbstractBackend.__init__(self, cache_size)
+
+        self._identifier_quote = identifier_quote
+        """
+Character used to quote identifiers
+        """
+        self._placeholder = placeholder
+        """
+Placeholder used for bound parameters
+        """
+    #
+
+    def _compile_and_node(self, node):
+        """
+Compiles the given "and" node.
+
+:param node: Filter AST node
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        return self._get_concatenated_sql(node.children, "AND", "1 = 1")
+    #
+
+    def _compile_comparison_node(self, node):
+        """
+Compiles the given comparison node.
+
+:param node: Filter AST node
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        identifier = self._get_identifier(node.field)
+
+        if (node.value is None):
+            if (node.operator == "="): _return = ( "{0} IS NULL".format(identifier), ( ) )
+            elif (node.operator == "!="): _return = ( "{0} IS NOT NULL".format(identifier), ( ) )
+            else: _return = ( "1 = 0", ( ) )
+        else:
+            _return = ( "{0} {1} {2}".format(identifier, self.__class__.OPERATOR_SQL[node.operator], self._placeholder),
+                        ( node.value, )
+                      )
+        #
+
+        return _return
+    #
+
+    def _compile_in_node(self, node):
+        """
+Compiles the given "in" node.
+
+:param node: Filter AST node
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        identifier = self._get_identifier(node.field)
+        values = tuple(value for value in node.values if value is not None)
+
+        _return = ( "1 = 0", ( ) )
+
+        if (len(values) > 0):
+            _return = ( "{0} IN ({1})".format(identifier, ", ".join([ self._placeholder ] * len(values))), values )
+        #
+
+        if (None in node.value_set):
+            _return = ( "({0} OR {1} IS NULL)".format(_return[0], identifier), _return[1] )
+        #
+
+        return _return
+    #
+
+    def _compile_or_node(self, node):
+        """
+Compiles the given "or" node.
+
+:param node: Filter AST node
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        return self._get_concatenated_sql(node.children, "OR", "1 = 0")
+    #
+
+    def _compile_range_node(self, node):
+        """
+Compiles the given range node.
+
+:param node: Filter AST node
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        identifier = self._get_identifier(node.field)
+
+        if (node.lower is None or node.upper is None): _return = ( "1 = 0", ( ) )
+        elif (node.is_lower_inclusive and node.is_upper_inclusive):
+            _return = ( "{0} BETWEEN {1} AND {1}".format(identifier, self._placeholder), ( node.lower, node.upper ) )
+        else:
+            _return = ( "({0} {1} {2} AND {0} {3} {2})".format(identifier,
+                                                               (">=" if (node.is_lower_inclusive) else ">"),
+                                                               self._placeholder,
+                                                               ("<=" if (node.is_upper_inclusive) else "<")
+                                                              ),
+                        ( node.lower, node.upper )
+                      )
+        #
+
+        return _return
+    #
+
+    def _get_concatenated_sql(self, nodes, sql_operator, empty_sql):
+        """
+Returns the SQL fragments of the given nodes concatenated with the SQL
+operator given.
+
+:param nodes: Filter AST nodes
+:param sql_operator: SQL operator ("AND" or "OR")
+:param empty_sql: SQL fragment used if no nodes are given
+
+:return: (tuple) SQL fragment and parameters
+:since:  v1.0.0
+        """
+
+        fragments = [ ]
+        parameters = ( )
+
+        for node in nodes:
+            fragment, fragment_parameters = self._compile_node(node)
+
+            fragments.append(fragment)
+            parameters += fragment_parameters
+        #
+
+        if (len(fragments) < 1): _return = ( empty_sql, ( ) )
+        elif (len(fragments) == 1): _return = ( fragments[0], parameters )
+        else: _return = ( "({0})".format(" {0} ".format(sql_operator).join(fragments)), parameters )
+
+        return _return
+    #
+
+    def _get_identifier(self, field):
+        """
+Returns the quoted SQL identifier for the given field name.
+
+:param field: Field name
+
+:return: (str) Quoted SQL identifier
+:since:  v1.0.0
+        """
+
+        if (type(field) is not str or self.__class__.RE_FIELD_NAME.match(field) is None):
+            raise InputValidationException("Filter field name given is invalid")
+        #
+
+        return ".".join([ "{0}{1}{0}".format(self._identifier_quote, name) for name in field.split(".") ])
+    #
+#
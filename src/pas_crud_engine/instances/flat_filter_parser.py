@@ -17,12 +17,16 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from array import array
+
 from .abstract_filter_parser import AbstractFilterParser
+from .scalar_or_list import ScalarOrList
 
 class FlatFilterParser(AbstractFilterParser):
     """
 "FlatFilterParser" provides a condition definition based on a flat
-dictionary.
+dictionary. "or" concatenated lists of scalar values of the same type are
+represented as immutable "ScalarOrList" instances.
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -59,6 +63,21 @@ definition.
         return _return
     #
 
+    def _parse_or_concatenation(self, key, filter_list):
+        """
+Parses the given list representing an "or" concatenated filter definition.
+
+:param key: Key of filter level being parsed
+:param filter_list: "or" concatenated list or "array" of numbers
+
+:return: (mixed) Parser specific filter representation
+:since:  v1.0.0
+        """
+
+        if (type(filter_list) is not array): filter_list = [ self._parse(key, value) for value in filter_list ]
+        return (ScalarOrList(filter_list) if (ScalarOrList.is_supported(filter_list)) else filter_list)
+    #
+
     def _set_empty_filter(self):
         """
 Sets an empty parser specific filter representation for an empty filter
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=broad-except
+
+from collections import deque
+from time import monotonic
+
+from dpt_runtime.value_exception import ValueException
+from dpt_threading.thread_lock import ThreadLock
+
+class InstancePool(object):
+    """
+"InstancePool" keeps idle CRUD entity instances of one class for reuse.
+Instances are reset with "reset_pooled_instance()" before they are
+returned to the pool. Checkouts never block: a new instance is created if
+no idle one is available.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_contentions",
+                  "_created",
+                  "_discarded",
+                  "_evictions",
+                  "_idle_instances",
+                  "_idle_timeout",
+                  "_in_use",
+                  "_instance_class",
+                  "_lock",
+                  "_max_size",
+                  "_peak_in_use",
+                  "_reused"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, instance_class, max_size = 8, idle_timeout = None):
+        """
+Constructor __init__(InstancePool)
+
+:param instance_class: CRUD entity class
+:param max_size: Maximum number of idle instances kept
+:param idle_timeout: Seconds after which idle instances are evicted; None
+                     to keep them
+
+:since: v1.0.0
+        """
+
+        if (type(max_size) is not int or max_size < 1): raise ValueException("Maximum pool size given is invalid")
+        if (idle_timeout is not None and (type(idle_timeout) not in ( int, float ) or idle_timeout <= 0)): raise ValueException("Idle timeout given is invalid")
+
+        self._contentions = 0
+        """
+Number of checkouts without an idle instance available
+        """
+        self._created = 0
+        """
+Number of instances created
+        """
+        self._discarded = 0
+        """
+Number of instances not returned to the pool because it was full or the
+reset failed
+        """
+        self._evictions = 0
+        """
+Number of idle instances evicted after the idle timeout
+        """
+        self._idle_instances = deque()
+        """
+Idle instances as tuples of release time and instance
+        """
+        self._idle_timeout = idle_timeout
+        """
+Seconds after which idle instances are evicted
+        """
+        self._in_use = 0
+        """
+Number of instances checked out
+        """
+        self._instance_class = instance_class
+        """
+CRUD entity class
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._max_size = max_size
+        """
+Maximum number of idle instances kept
+        """
+        self._peak_in_use = 0
+        """
+Highest number of instances checked out at the same time
+        """
+        self._reused = 0
+        """
+Number of checkouts served by an idle instance
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of idle instances
+:since:  v1.0.0
+        """
+
+        return len(self._idle_instances)
+    #
+
+    @property
+    def instance_class(self):
+        """
+Returns the CRUD entity class of this pool.
+
+:return: (object) CRUD entity class
+:since:  v1.0.0
+        """
+
+        return self._instance_class
+    #
+
+    @property
+    def statistics(self):
+        """
+Returns the pool statistics.
+
+:return: (dict) Pool statistics
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            return { "size": len(self._idle_instances),
+                     "max_size": self._max_size,
+                     "idle_timeout": self._idle_timeout,
+                     "in_use": self._in_use,
+                     "peak_in_use": self._peak_in_use,
+                     "created": self._created,
+                     "reused": self._reused,
+                     "contentions": self._contentions,
+                     "discarded": self._discarded,
+                     "evictions": self._evictions
+                   }
+        #
+    #
+
+    def checkin(self, instance):
+        """
+Resets the given instance and returns it to the pool.
+
+:param instance: CRUD entity instance checked out before
+
+:since: v1.0.0
+        """
+
+        is_reusable = True
+
+        try: instance.reset_pooled_instance()
+        except Exception: is_reusable = False
+
+        with self._lock:
+            if (self._in_use > 0): self._in_use -= 1
+            self._evict_idle_instances()
+
+            if (is_reusable and len(self._idle_instances) < self._max_size): self._idle_instances.append(( monotonic(), instance ))
+            else: self._discarded += 1
+        #
+    #
+
+    def checkout(self):
+        """
+Returns an idle instance or a new one if none is available.
+
+:return: (object) CRUD entity instance
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        with self._lock:
+            self._evict_idle_instances()
+
+            if (len(self._idle_instances) > 0):
+                _return = self._idle_instances.pop()[1]
+                self._reused += 1
+            else: self._contentions += 1
+
+            self._in_use += 1
+            if (self._in_use > self._peak_in_use): self._peak_in_use = self._in_use
+        #
+
+        if (_return is None):
+            try: _return = self._instance_class()
+            except Exception:
+                with self._lock: self._in_use -= 1
+                raise
+            #
+
+            with self._lock: self._created += 1
+        #
+
+        return _return
+    #
+
+    def clear(self):
+        """
+Removes all idle instances.
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._idle_instances.clear()
+    #
+
+    def _evict_idle_instances(self):
+        """
+Evicts idle instances released before the idle timeout. The lock must be
+held by the caller.
+
+:since: v1.0.0
+        """
+
+        if (self._idle_timeout is not None):
+            expired = monotonic() - self._idle_timeout
+
+            while (len(self._idle_instances) > 0 and self._idle_instances[0][0] <= expired):
+                self._idle_instances.popleft()
+                self._evictions += 1
+            #
+        #
+    #
+#
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from array import array
+from bisect import bisect_left
+
+try: from collections.abc import Sequence
+except ImportError: from collections import Sequence
+
+class ScalarOrList(Sequence):
+    """
+"ScalarOrList" is an immutable representation of an "or" concatenated list
+of scalar values of the same type. Integers and floating point numbers are
+stored in compact "array" instances and tested for membership by binary
+search of a sorted copy. Other hashable values are tested against a set.
+Iteration always returns the values in the order given.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    ARRAY_TYPECODES = { int: "q", float: "d" }
+    """
+"array" type codes of numeric value types stored compactly
+    """
+    SCALAR_TYPES = ( bool, float, int, str )
+    """
+Value types supported
+    """
+
+    __slots__ = [ "_sorted_values", "_value_set", "_values" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, values):
+        """
+Constructor __init__(ScalarOrList)
+
+:param values: List or "array" of scalar values of the same type
+
+:since: v1.0.0
+        """
+
+        self._sorted_values = None
+        """
+Sorted "array" of numeric values; None if not stored compactly
+        """
+        self._value_set = None
+        """
+Values for membership tests; None if stored compactly
+        """
+        self._values = None
+        """
+Values in the order given
+        """
+
+        typecode = (values.typecode
+                    if (isinstance(values, array)) else
+                    self.__class__.ARRAY_TYPECODES.get(self.__class__.get_value_type(values))
+                   )
+
+        if (typecode is not None):
+            try:
+                self._values = array(typecode, values)
+                self._sorted_values = array(typecode, sorted(self._values))
+
+                if (self._sorted_values == self._values): self._sorted_values = self._values
+            except OverflowError: self._values = None
+        #
+
+        if (self._values is None):
+            self._values = tuple(values)
+            self._value_set = frozenset(self._values)
+        #
+    #
+
+    def __contains__(self, value):
+        """
+python.org: Called to implement membership test operators.
+
+:param value: Value to test
+
+:return: (bool) True if the value is one of the list values
+:since:  v1.0.0
+        """
+
+        if (self._value_set is not None): _return = (value in self._value_set)
+        elif (type(value) not in ( bool, float, int )): _return = False
+        else:
+            index = bisect_left(self._sorted_values, value)
+            _return = (index < len(self._sorted_values) and self._sorted_values[index] == value)
+        #
+
+        return _return
+    #
+
+    def __eq__(self, other):
+        """
+python.org: The correspondence between operator symbols and method names is
+as follows: x==y calls x.__eq__(y)
+
+:param other: Object to compare with
+
+:return: (bool) True if equal
+:since:  v1.0.0
+        """
+
+        if (isinstance(other, ScalarOrList)): _return = (tuple(self._values) == tuple(other._values))
+        elif (isinstance(other, ( list, tuple ))): _return = (tuple(self._values) == tuple(other))
+        else: _return = NotImplemented
+
+        return _return
+    #
+
+    def __getitem__(self, index):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param index: Index or slice
+
+:return: (mixed) Value; tuple of values for slices
+:since:  v1.0.0
+        """
+
+        return (tuple(self._values[index]) if (isinstance(index, slice)) else self._values[index])
+    #
+
+    def __hash__(self):
+        """
+python.org: Called by built-in function hash() and for operations on
+members of hashed collections.
+
+:return: (int) Hash value
+:since:  v1.0.0
+        """
+
+        return hash(tuple(self._values))
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator of the values in the order given
+:since:  v1.0.0
+        """
+
+        return iter(self._values)
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of values
+:since:  v1.0.0
+        """
+
+        return len(self._values)
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the
+"official" string representation of an object.
+
+:return: (str) String representation
+:since:  v1.0.0
+        """
+
+        return "{0}({1!r})".format(self.__class__.__name__, list(self._values))
+    #
+
+    @property
+    def is_compact(self):
+        """
+Returns true if the values are stored in a compact "array" instance.
+
+:return: (bool) True if stored compactly
+:since:  v1.0.0
+        """
+
+        return (self._value_set is None)
+    #
+
+    @classmethod
+    def get_value_type(cls, values):
+        """
+Returns the type of the given values if all of them are scalar values of
+the same type.
+
+:param cls: Python class
+:param values: List of values
+
+:return: (type) Value type; None if not supported
+:since:  v1.0.0
+        """
+
+        value_types = set(type(value) for value in values)
+        return (value_types.pop() if (len(value_types) == 1 and value_types <= set(cls.SCALAR_TYPES)) else None)
+    #
+
+    @classmethod
+    def is_supported(cls, values):
+        """
+Returns true if the given list or "array" of values can be represented by
+a "ScalarOrList".
+
+:param cls: Python class
+:param values: List or "array" of values
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (isinstance(values, array) or cls.get_value_type(values) is not None)
+    #
+#
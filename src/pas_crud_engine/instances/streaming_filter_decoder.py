@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from array import array
+from codecs import getincrementaldecoder
+import json
+import re
+
+from ..input_validation_exception import InputValidationException
+
+class StreamingFilterDecoder(object):
+    """
+"StreamingFilterDecoder" decodes a JSON filter definition incrementally
+from chunks of data. Lists of integers or floating point numbers are built
+directly as compact "array" instances instead of lists of Python objects.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    CHUNK_SIZE = 65536
+    """
+Number of bytes or characters read at once from file-like objects
+    """
+    INT64_MAX = 9223372036854775807
+    """
+Largest integer stored in compact integer lists
+    """
+    INT64_MIN = -9223372036854775808
+    """
+Smallest integer stored in compact integer lists
+    """
+    RE_INTEGER_RUN = re.compile("-?(?:0|[1-9]\\d*)(?:[ \\t\\n\\r]*,[ \\t\\n\\r]*-?(?:0|[1-9]\\d*))*(?=[ \\t\\n\\r]*[,\\]])")
+    """
+RegExp to find a run of comma separated, completely received integers
+    """
+    RE_PLAIN_STRING_RUN = re.compile("\"[^\"\\\\]*\"(?:[ \\t\\n\\r]*,[ \\t\\n\\r]*\"[^\"\\\\]*\")*(?=[ \\t\\n\\r]*[,\\]])")
+    """
+RegExp to find a run of comma separated, completely received strings
+without escape sequences
+    """
+    RE_PLAIN_STRING_VALUE = re.compile("\"([^\"]*)\"")
+    """
+RegExp to extract the values of a run of strings without escape sequences
+    """
+    RE_NUMBER = re.compile("-?(?:0|[1-9]\\d*)(\\.\\d+)?([eE][+-]?\\d+)?")
+    """
+RegExp to find a JSON number
+    """
+    RE_STRING = re.compile("\"(?:[^\"\\\\]|\\\\.)*\"", re.DOTALL)
+    """
+RegExp to find a JSON string
+    """
+    RE_WHITESPACE = re.compile("[ \\t\\n\\r]*")
+    """
+RegExp to skip JSON whitespace
+    """
+
+    __slots__ = [ "_buffer", "_data", "_decoder", "_is_data_complete", "_stack", "_state" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(StreamingFilterDecoder)
+
+:since: v1.0.0
+        """
+
+        self._buffer = ""
+        """
+Characters received but not yet decoded
+        """
+        self._data = None
+        """
+Decoded top-level filter definition
+        """
+        self._decoder = getincrementaldecoder("utf-8")()
+        """
+Incremental UTF-8 decoder for binary chunks
+        """
+        self._is_data_complete = False
+        """
+True if the top-level filter definition has been decoded
+        """
+        self._stack = [ ]
+        """
+Stack of lists with the container type, container and pending object key
+        """
+        self._state = "value"
+        """
+Token expected next ("value", "key", "colon" or "separator")
+        """
+    #
+
+    def _add_value(self, value):
+        """
+Adds the given decoded value to the current container. Compact number
+lists are converted to lists if a value of another type is added.
+
+:param value: Decoded value
+
+:since: v1.0.0
+        """
+
+        container = (self._stack[-1] if (len(self._stack) > 0) else None)
+
+        if (container is None):
+            self._data = value
+            self._is_data_complete = True
+        elif (container[0] == "object"):
+            container[1][container[2]] = value
+            container[2] = None
+        else:
+            values = container[1]
+
+            if (type(values) is array):
+                value_type = type(value)
+
+                if (values.typecode == "q" and len(values) < 1 and value_type is float): values = container[1] = array("d")
+
+                if (values.typecode == "q"
+                    and value_type is int
+                    and StreamingFilterDecoder.INT64_MIN <= value <= StreamingFilterDecoder.INT64_MAX
+                   ): values.append(value)
+                elif (values.typecode == "d" and value_type is float): values.append(value)
+                else: container[1] = list(values) + [ value ]
+            else: values.append(value)
+        #
+
+        self._state = "separator"
+    #
+
+    def close(self):
+        """
+Finishes decoding and returns the decoded filter definition.
+
+:return: (mixed) Decoded filter definition; None if no data was received
+:since:  v1.0.0
+        """
+
+        self._buffer += self._decoder.decode(b"", True)
+        self._decode(True)
+
+        if (len(self._stack) > 0 or (len(self._buffer.strip()) > 0 and (not self._is_data_complete))):
+            raise InputValidationException("Failed to parse filter definition given")
+        #
+
+        return self._data
+    #
+
+    def _decode(self, is_final = False):
+        """
+Decodes all complete tokens of the buffer.
+
+:param is_final: True if no more data will be received
+
+:since: v1.0.0
+        """
+
+        buffer = self._buffer
+        position = 0
+        buffer_length = len(buffer)
+
+        while True:
+            position = StreamingFilterDecoder.RE_WHITESPACE.match(buffer, position).end()
+            if (position >= buffer_length): break
+
+            if (self._is_data_complete): raise InputValidationException("Filter definition given contains trailing data")
+
+            character = buffer[position]
+            container = (self._stack[-1] if (len(self._stack) > 0) else None)
+
+            if (self._state == "separator"):
+                if (character == ","):
+                    self._state = ("key" if (container[0] == "object") else "value")
+                    position += 1
+                elif (character == ("}" if (container[0] == "object") else "]")):
+                    self._pop_container()
+                    position += 1
+                else: raise InputValidationException("Filter definition given is invalid")
+            elif (self._state == "colon"):
+                if (character != ":"): raise InputValidationException("Filter definition given is invalid")
+
+                self._state = "value"
+                position += 1
+            elif (self._state == "key"):
+                if (character == "}" and len(container[1]) < 1 and container[2] is None):
+                    self._pop_container()
+                    position += 1
+                elif (character == "\""):
+                    token_end = self._get_string_token_end(buffer, position)
+                    if (token_end is None): break
+
+                    container[2] = self._get_string(buffer[position:token_end])
+                    self._state = "colon"
+                    position = token_end
+                else: raise InputValidationException("Filter definition given is invalid")
+            elif (character == "{"):
+                self._stack.append([ "object", { }, None ])
+                self._state = "key"
+                position += 1
+            elif (character == "["):
+                self._stack.append([ "list", array("q"), None ])
+                self._state = "value"
+                position += 1
+            elif (character == "]" and container is not None and container[0] == "list" and len(container[1]) < 1):
+                self._pop_container()
+                position += 1
+            elif (container is None): raise InputValidationException("Filter definition given is invalid")
+            elif (container[0] == "list" and type(container[1]) is array and container[1].typecode == "q" and character in "-0123456789"):
+                re_result = StreamingFilterDecoder.RE_INTEGER_RUN.match(buffer, position)
+
+                if (re_result is None):
+                    token_end = self._get_scalar_token_end(buffer, position, is_final)
+                    if (token_end is None): break
+
+                    self._add_value(self._get_scalar(buffer[position:token_end]))
+                    position = token_end
+                else:
+                    values = re_result.group(0).split(",")
+
+                    try: container[1].extend(array("q", map(int, values)))
+                    except OverflowError: container[1] = list(container[1]) + [ int(value) for value in values ]
+
+                    self._state = "separator"
+                    position = re_result.end()
+                #
+            elif (character == "\""):
+                re_result = (StreamingFilterDecoder.RE_PLAIN_STRING_RUN.match(buffer, position)
+                             if (container[0] == "list") else
+                             None
+                            )
+
+                if (re_result is None):
+                    token_end = self._get_string_token_end(buffer, position)
+                    if (token_end is None): break
+
+                    self._add_value(self._get_string(buffer[position:token_end]))
+                    position = token_end
+                else:
+                    values = StreamingFilterDecoder.RE_PLAIN_STRING_VALUE.findall(re_result.group(0))
+
+                    if (type(container[1]) is array): container[1] = list(container[1])
+                    container[1].extend(values)
+
+                    self._state = "separator"
+                    position = re_result.end()
+                #
+            else:
+                token_end = self._get_scalar_token_end(buffer, position, is_final)
+                if (token_end is None): break
+
+                self._add_value(self._get_scalar(buffer[position:token_end]))
+                position = token_end
+            #
+        #
+
+        self._buffer = buffer[position:]
+    #
+
+    @staticmethod
+    def decode(source):
+        """
+Decodes the JSON filter definition read from the given source.
+
+:param source: String, bytes, file-like object or iterable of binary or
+               string chunks
+
+:return: (mixed) Decoded filter definition; None if no data was received
+:since:  v1.0.0
+        """
+
+        decoder = StreamingFilterDecoder()
+
+        if (isinstance(source, ( str, bytes, bytearray, memoryview ))):
+            for offset in range(0, len(source), StreamingFilterDecoder.CHUNK_SIZE): decoder.feed(source[offset:offset + StreamingFilterDecoder.CHUNK_SIZE])
+        elif (hasattr(source, "read")):
+            while True:
+                chunk = source.read(StreamingFilterDecoder.CHUNK_SIZE)
+                if (not chunk): break
+
+                decoder.feed(chunk)
+            #
+        else:
+            for chunk in source: decoder.feed(chunk)
+        #
+
+        return decoder.close()
+    #
+
+    def feed(self, chunk):
+        """
+Decodes the given chunk of data as far as possible.
+
+:param chunk: Chunk of binary or string data
+
+:since: v1.0.0
+        """
+
+        self._buffer += (chunk if (isinstance(chunk, str)) else self._decoder.decode(chunk))
+        self._decode()
+    #
+
+    @staticmethod
+    def _get_scalar(token):
+        """
+Returns the decoded JSON number or literal.
+
+:param token: JSON token
+
+:return: (mixed) Decoded value
+:since:  v1.0.0
+        """
+
+        if (token == "true"): _return = True
+        elif (token == "false"): _return = False
+        elif (token == "null"): _return = None
+        else:
+            re_result = StreamingFilterDecoder.RE_NUMBER.fullmatch(token)
+            if (re_result is None): raise InputValidationException("Filter definition given is invalid")
+
+            _return = (int(token) if (re_result.group(1) is None and re_result.group(2) is None) else float(token))
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_scalar_token_end(buffer, position, is_final):
+        """
+Returns the end position of the JSON number or literal starting at the
+given position.
+
+:param buffer: Characters received
+:param position: Token start position
+:param is_final: True if no more data will be received
+
+:return: (int) Token end position; None if more data is required
+:since:  v1.0.0
+        """
+
+        _return = position
+        buffer_length = len(buffer)
+
+        while (_return < buffer_length and buffer[_return] not in ",]}: \t\n\r"): _return += 1
+
+        if (_return == position): raise InputValidationException("Filter definition given is invalid")
+        if (_return >= buffer_length and (not is_final)): _return = None
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_string(token):
+        """
+Returns the decoded JSON string.
+
+:param token: JSON string token including quotes
+
+:return: (str) Decoded string
+:since:  v1.0.0
+        """
+
+        if ("\\" not in token): _return = token[1:-1]
+        else:
+            try: _return = json.loads(token)
+            except ValueError as handled_exception: raise InputValidationException("Filter definition given is invalid", _exception = handled_exception)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_string_token_end(buffer, position):
+        """
+Returns the end position of the JSON string starting at the given
+position.
+
+:param buffer: Characters received
+:param position: Token start position
+
+:return: (int) Token end position; None if more data is required
+:since:  v1.0.0
+        """
+
+        re_result = StreamingFilterDecoder.RE_STRING.match(buffer, position)
+        return (None if (re_result is None) else re_result.end())
+    #
+
+    def _pop_container(self):
+        """
+Closes the current container and adds it to its parent.
+
+:since: v1.0.0
+        """
+
+        container = self._stack.pop()
+
+        values = (list(container[1])
+                  if (type(container[1]) is array and len(container[1]) < 1) else
+                  container[1]
+                 )
+
+        self._add_value(values)
+    #
+#
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+try: from time import perf_counter_ns
+except ImportError:
+    from time import perf_counter
+    def perf_counter_ns(): return int(perf_counter() * 1000000000)
+#
+
+from inspect import isawaitable
+
+from dpt_runtime.value_exception import ValueException
+from dpt_threading.thread_lock import ThreadLock
+
+from .latency_histogram import LatencyHistogram
+
+class Instrumentation(object):
+    """
+"Instrumentation" collects call counts, error counts and latency histograms
+per CRUD module, entity instance, operation and execution step. Collection
+is disabled by default and call sites only check "is_enabled()" in that
+case. Collected metrics are pulled with "get_snapshot()".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _enabled = False
+    """
+True if metrics are collected
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _metrics = { }
+    """
+Dict of metric keys and lists of call count, error count and latency
+histogram
+    """
+    _sub_bucket_bits = 5
+    """
+Number of bits used for sub-buckets of latency histograms
+    """
+
+    @staticmethod
+    async def acall(key, _callable, *args, **kwargs):
+        """
+Calls the given callable, awaits its result if applicable and records its
+latency and a raised exception for the metric key given.
+
+:param key: Metric key tuple of module, instance, operation and step
+:param _callable: Python callable
+
+:return: (mixed) Return value of the callable
+:since:  v1.0.0
+        """
+
+        is_error = False
+        started = perf_counter_ns()
+
+        try:
+            _return = _callable(*args, **kwargs)
+            if (isawaitable(_return)): _return = await _return
+
+            return _return
+        except BaseException:
+            is_error = True
+            raise
+        finally: Instrumentation.record(key, perf_counter_ns() - started, is_error)
+    #
+
+    @staticmethod
+    def call(key, _callable, *args, **kwargs):
+        """
+Calls the given callable and records its latency and a raised exception
+for the metric key given.
+
+:param key: Metric key tuple of module, instance, operation and step
+:param _callable: Python callable
+
+:return: (mixed) Return value of the callable
+:since:  v1.0.0
+        """
+
+        is_error = False
+        started = perf_counter_ns()
+
+        try: return _callable(*args, **kwargs)
+        except BaseException:
+            is_error = True
+            raise
+        finally: Instrumentation.record(key, perf_counter_ns() - started, is_error)
+    #
+
+    @staticmethod
+    def disable():
+        """
+Disables the collection of metrics. Collected metrics are kept.
+
+:since: v1.0.0
+        """
+
+        Instrumentation._enabled = False
+    #
+
+    @staticmethod
+    def enable(sub_bucket_bits = None):
+        """
+Enables the collection of metrics.
+
+:param sub_bucket_bits: Number of bits used for sub-buckets of new latency
+                        histograms; None to keep the current value
+
+:since: v1.0.0
+        """
+
+        if (sub_bucket_bits is not None):
+            if (type(sub_bucket_bits) is not int or sub_bucket_bits < 1 or sub_bucket_bits > 16): raise ValueException("Number of sub-bucket bits given is invalid")
+            Instrumentation._sub_bucket_bits = sub_bucket_bits
+        #
+        Instrumentation._enabled = True
+    #
+
+    @staticmethod
+    def get_class_entity_names(instance_class):
+        """
+Returns the CRUD module and entity instance names for the CRUD entity class
+given.
+
+:param instance_class: CRUD entity class
+
+:return: (tuple) Module and instance name
+:since:  v1.0.0
+        """
+
+        module_elements = instance_class.__module__.rsplit(".", 2)
+
+        return (( module_elements[-2], module_elements[-1] )
+                if (len(module_elements) > 2) else
+                ( instance_class.__module__, instance_class.__name__ )
+               )
+    #
+
+    @staticmethod
+    def get_path_entity_names(path):
+        """
+Returns the CRUD module and entity instance names for the CRUD URL path
+given.
+
+:param path: CRUD URL path
+
+:return: (tuple) Module and instance name
+:since:  v1.0.0
+        """
+
+        path_elements = (path[1:] if (path[:1] == "/") else path).split("/", 2)
+        if (len(path_elements) < 2): path_elements.append(None)
+
+        return ( path_elements[0], (None if (path_elements[1] is None) else path_elements[1].replace("-", "_")) )
+    #
+
+    @staticmethod
+    def get_snapshot(reset = False):
+        """
+Returns a snapshot of all metrics collected.
+
+:param reset: True to remove all metrics after creating the snapshot
+
+:return: (list) List of metric dicts
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        with Instrumentation._lock:
+            for key in sorted(Instrumentation._metrics, key = lambda key: tuple(( "" if (value is None) else str(value) ) for value in key)):
+                count, errors, histogram = Instrumentation._metrics[key]
+
+                _return.append({ "module": key[0],
+                                 "instance": key[1],
+                                 "operation": key[2],
+                                 "step": key[3],
+                                 "count": count,
+                                 "errors": errors,
+                                 "latency_ns": histogram.snapshot
+                               })
+            #
+
+            if (reset): Instrumentation._metrics.clear()
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def is_enabled():
+        """
+Returns true if metrics are collected.
+
+:return: (bool) True if enabled
+:since:  v1.0.0
+        """
+
+        return Instrumentation._enabled
+    #
+
+    @staticmethod
+    def record(key, duration, is_error = False):
+        """
+Records a call for the metric key given.
+
+:param key: Metric key tuple of module, instance, operation and step
+:param duration: Call duration in nanoseconds
+:param is_error: True if the call raised an exception
+
+:since: v1.0.0
+        """
+
+        with Instrumentation._lock:
+            metric = Instrumentation._metrics.get(key)
+
+            if (metric is None):
+                metric = [ 0, 0, LatencyHistogram(Instrumentation._sub_bucket_bits) ]
+                Instrumentation._metrics[key] = metric
+            #
+
+            metric[0] += 1
+            if (is_error): metric[1] += 1
+            metric[2].record(duration)
+        #
+    #
+
+    @staticmethod
+    def reset():
+        """
+Removes all metrics collected.
+
+:since: v1.0.0
+        """
+
+        with Instrumentation._lock: Instrumentation._metrics.clear()
+    #
+#
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.value_exception import ValueException
+
+class LatencyHistogram(object):
+    """
+"LatencyHistogram" records latencies in nanoseconds into log-linear buckets
+similar to HdrHistogram. Values are exact up to twice the number of
+sub-buckets and keep a relative precision of 1 / sub-buckets above.
+
+Instances are not thread-safe. Callers are expected to synchronize access.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    PERCENTILES = ( 50.0, 90.0, 99.0, 99.9 )
+    """
+Percentiles included in snapshots
+    """
+
+    __slots__ = [ "_buckets", "_count", "_max", "_min", "_sub_bucket_bits", "_sub_bucket_count", "_sum" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, sub_bucket_bits = 5):
+        """
+Constructor __init__(LatencyHistogram)
+
+:param sub_bucket_bits: Number of bits used for sub-buckets of each power of
+                        two
+
+:since: v1.0.0
+        """
+
+        if (type(sub_bucket_bits) is not int or sub_bucket_bits < 1 or sub_bucket_bits > 16): raise ValueException("Number of sub-bucket bits given is invalid")
+
+        self._buckets = { }
+        """
+Dict of bucket indices and counts
+        """
+        self._count = 0
+        """
+Number of values recorded
+        """
+        self._max = None
+        """
+Highest value recorded
+        """
+        self._min = None
+        """
+Lowest value recorded
+        """
+        self._sub_bucket_bits = sub_bucket_bits
+        """
+Number of bits used for sub-buckets
+        """
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        """
+Number of sub-buckets of each power of two
+        """
+        self._sum = 0
+        """
+Sum of all values recorded
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of values recorded
+:since:  v1.0.0
+        """
+
+        return self._count
+    #
+
+    @property
+    def count(self):
+        """
+Returns the number of values recorded.
+
+:return: (int) Number of values
+:since:  v1.0.0
+        """
+
+        return self._count
+    #
+
+    @property
+    def max(self):
+        """
+Returns the highest value recorded.
+
+:return: (int) Highest value; None if empty
+:since:  v1.0.0
+        """
+
+        return self._max
+    #
+
+    @property
+    def mean(self):
+        """
+Returns the arithmetic mean of all values recorded.
+
+:return: (float) Mean value; None if empty
+:since:  v1.0.0
+        """
+
+        return (None if (self._count < 1) else self._sum / self._count)
+    #
+
+    @property
+    def min(self):
+        """
+Returns the lowest value recorded.
+
+:return: (int) Lowest value; None if empty
+:since:  v1.0.0
+        """
+
+        return self._min
+    #
+
+    @property
+    def snapshot(self):
+        """
+Returns a dict describing the current state of the histogram.
+
+:return: (dict) Histogram snapshot
+:since:  v1.0.0
+        """
+
+        _return = { "count": self._count,
+                    "min": self._min,
+                    "max": self._max,
+                    "mean": self.mean,
+                    "sum": self._sum
+                  }
+
+        for percentile in self.__class__.PERCENTILES:
+            _return["p{0:g}".format(percentile)] = self.get_percentile(percentile)
+        #
+
+        return _return
+    #
+
+    def clear(self):
+        """
+Removes all values recorded.
+
+:since: v1.0.0
+        """
+
+        self._buckets.clear()
+        self._count = 0
+        self._max = None
+        self._min = None
+        self._sum = 0
+    #
+
+    def _get_bucket_index(self, value):
+        """
+Returns the bucket index for the value given.
+
+:param value: Value to be recorded
+
+:return: (int) Bucket index
+:since:  v1.0.0
+        """
+
+        shift = value.bit_length() - self._sub_bucket_bits - 1
+
+        return (value
+                if (shift < 1) else
+                (shift * self._sub_bucket_count) + (value >> shift)
+               )
+    #
+
+    def _get_bucket_highest_value(self, index):
+        """
+Returns the highest value represented by the bucket index given.
+
+:param index: Bucket index
+
+:return: (int) Highest value
+:since:  v1.0.0
+        """
+
+        shift = (index >> self._sub_bucket_bits) - 1
+
+        return (index
+                if (shift < 1) else
+                (((index - (shift * self._sub_bucket_count)) + 1) << shift) - 1
+               )
+    #
+
+    def get_percentile(self, percentile):
+        """
+Returns the value at the percentile given. The value returned is the
+highest value of the matching bucket limited to the highest value recorded.
+
+:param percentile: Percentile between 0 and 100
+
+:return: (int) Value; None if empty
+:since:  v1.0.0
+        """
+
+        if (type(percentile) not in ( int, float ) or percentile < 0 or percentile > 100): raise ValueException("Percentile given is invalid")
+
+        _return = None
+
+        if (self._count > 0):
+            threshold = max(1, int(round(self._count * percentile / 100.0)))
+            count = 0
+
+            for index in sorted(self._buckets):
+                count += self._buckets[index]
+
+                if (count >= threshold):
+                    _return = min(self._get_bucket_highest_value(index), self._max)
+                    break
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def merge(self, histogram):
+        """
+Adds all values of the given histogram to this one.
+
+:param histogram: LatencyHistogram instance using the same number of
+                  sub-bucket bits
+
+:since: v1.0.0
+        """
+
+        if (not isinstance(histogram, LatencyHistogram) or histogram._sub_bucket_bits != self._sub_bucket_bits): raise ValueException("Histogram given is incompatible")
+
+        for index in histogram._buckets:
+            self._buckets[index] = self._buckets.get(index, 0) + histogram._buckets[index]
+        #
+
+        if (histogram._count > 0):
+            self._count += histogram._count
+            self._sum += histogram._sum
+
+            if (self._max is None or histogram._max > self._max): self._max = histogram._max
+            if (self._min is None or histogram._min < self._min): self._min = histogram._min
+        #
+    #
+
+    def record(self, value):
+        """
+Records the value given.
+
+:param value: Non-negative integer value (e.g. nanoseconds)
+
+:since: v1.0.0
+        """
+
+        if (value < 0): value = 0
+
+        index = self._get_bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+        self._count += 1
+        self._sum += value
+
+        if (self._max is None or value > self._max): self._max = value
+        if (self._min is None or value < self._min): self._min = value
+    #
+#
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+class LazyModuleAttributes(object):
+    """
+"LazyModuleAttributes" provides the module level "__getattr__()" and
+"__dir__()" functions of packages importing their public attributes on
+first access.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_attributes", "_module_globals" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, module_globals, attributes):
+        """
+Constructor __init__(LazyModuleAttributes)
+
+:param module_globals: Global variables of the package module
+:param attributes: Dict of public attribute names and the relative names of
+                   the modules they are imported from
+
+:since: v1.0.0
+        """
+
+        self._attributes = attributes
+        """
+Dict of public attribute names and module names
+        """
+        self._module_globals = module_globals
+        """
+Global variables of the package module
+        """
+    #
+
+    @property
+    def names(self):
+        """
+Returns the sorted public attribute names.
+
+:return: (list) Public attribute names
+:since:  v1.0.0
+        """
+
+        return sorted(self._attributes)
+    #
+
+    def get_attribute(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places. Public attributes are imported from their module on first
+access and cached afterwards.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute value
+:since:  v1.0.0
+        """
+
+        module_name = self._module_globals['__name__']
+
+        if (name not in self._attributes): raise AttributeError("module '{0}' has no attribute '{1}'".format(module_name, name))
+
+        _return = getattr(import_module(".{0}".format(self._attributes[name]), module_name), name)
+        self._module_globals[name] = _return
+
+        return _return
+    #
+
+    def get_names(self):
+        """
+python.org: Called when dir() is called on the module. Private names and
+submodules are not listed.
+
+:return: (list) List of attribute names
+:since:  v1.0.0
+        """
+
+        names = set(self._attributes)
+
+        for name, value in self._module_globals.items():
+            if ((name[:2] == "__" and name[-2:] == "__")
+                or (name[:1] != "_" and (not isinstance(value, ModuleType)))
+               ): names.add(name)
+        #
+
+        return sorted(names)
+    #
+
+    @staticmethod
+    def install(module_globals, attributes):
+        """
+Sets "__all__", "__getattr__()" and "__dir__()" of the package module for
+the given public attributes.
+
+:param module_globals: Global variables of the package module
+:param attributes: Dict of public attribute names and the relative names of
+                   the modules they are imported from
+
+:since: v1.0.0
+        """
+
+        lazy_module_attributes = LazyModuleAttributes(module_globals, attributes)
+
+        module_globals['__all__'] = lazy_module_attributes.names
+        module_globals['__dir__'] = lazy_module_attributes.get_names
+        module_globals['__getattr__'] = lazy_module_attributes.get_attribute
+    #
+#
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from time import monotonic
+
+from dpt_runtime.value_exception import ValueException
+from dpt_threading.thread_lock import ThreadLock
+
+class LruCache(object):
+    """
+"LruCache" provides a thread-safe, size bounded cache evicting least
+recently used entries first. Entries may additionally expire after a
+configurable time to live.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_cache", "_evictions", "_hits", "_lock", "_max_size", "_misses", "_ttl" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_size = 256, ttl = None):
+        """
+Constructor __init__(LruCache)
+
+:param max_size: Maximum number of entries cached
+:param ttl: Time to live in seconds; None if entries should not expire
+
+:since: v1.0.0
+        """
+
+        self._cache = OrderedDict()
+        """
+Cached entries as tuples of expiry time and value
+        """
+        self._evictions = 0
+        """
+Number of entries evicted or expired
+        """
+        self._hits = 0
+        """
+Number of cache hits
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._max_size = None
+        """
+Maximum number of entries cached
+        """
+        self._misses = 0
+        """
+Number of cache misses
+        """
+        self._ttl = None
+        """
+Time to live in seconds
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+    #
+
+    def __contains__(self, key):
+        """
+python.org: Called to implement membership test operators.
+
+:param key: Cache key
+
+:return: (bool) True if a valid entry is cached for the given key
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            entry = self._cache.get(key)
+            return (entry is not None and (entry[0] is None or entry[0] > monotonic()))
+        #
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of entries cached
+:since:  v1.0.0
+        """
+
+        return len(self._cache)
+    #
+
+    @property
+    def max_size(self):
+        """
+Returns the maximum number of entries cached.
+
+:return: (int) Maximum number of entries
+:since:  v1.0.0
+        """
+
+        return self._max_size
+    #
+
+    @max_size.setter
+    def max_size(self, max_size):
+        """
+Sets the maximum number of entries cached. Least recently used entries are
+evicted immediately if the cache exceeds the new limit.
+
+:param max_size: Maximum number of entries
+
+:since: v1.0.0
+        """
+
+        if (type(max_size) is not int or max_size < 1): raise ValueException("Maximum cache size given is invalid")
+
+        with self._lock:
+            self._max_size = max_size
+            self._evict_to_size()
+        #
+    #
+
+    @property
+    def statistics(self):
+        """
+Returns the cache statistics.
+
+:return: (dict) Cache statistics
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            requests = self._hits + self._misses
+
+            return { "size": len(self._cache),
+                     "max_size": self._max_size,
+                     "ttl": self._ttl,
+                     "hits": self._hits,
+                     "misses": self._misses,
+                     "evictions": self._evictions,
+                     "hit_ratio": (0.0 if (requests < 1) else self._hits / requests)
+                   }
+        #
+    #
+
+    @property
+    def ttl(self):
+        """
+Returns the time to live for new entries.
+
+:return: (float) Time to live in seconds; None if entries do not expire
+:since:  v1.0.0
+        """
+
+        return self._ttl
+    #
+
+    @ttl.setter
+    def ttl(self, ttl):
+        """
+Sets the time to live for new entries.
+
+:param ttl: Time to live in seconds; None if entries should not expire
+
+:since: v1.0.0
+        """
+
+        if (ttl is not None and (type(ttl) not in ( int, float ) or ttl <= 0)): raise ValueException("Cache time to live given is invalid")
+        self._ttl = ttl
+    #
+
+    def clear(self):
+        """
+Removes all entries and resets the statistics.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._cache.clear()
+
+            self._evictions = 0
+            self._hits = 0
+            self._misses = 0
+        #
+    #
+
+    def _evict_to_size(self):
+        """
+Evicts least recently used entries until the cache size limit is met. The
+lock must be held by the caller.
+
+:since: v1.0.0
+        """
+
+        while (len(self._cache) > self._max_size):
+            self._cache.popitem(last = False)
+            self._evictions += 1
+        #
+    #
+
+    def get(self, key, default = None):
+        """
+Returns the value cached for the given key.
+
+:param key: Cache key
+:param default: Value returned if no valid entry is cached
+
+:return: (mixed) Cached value; default if not cached or expired
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            entry = self._cache.get(key)
+
+            if (entry is not None and entry[0] is not None and entry[0] <= monotonic()):
+                del(self._cache[key])
+                self._evictions += 1
+
+                entry = None
+            #
+
+            if (entry is None):
+                self._misses += 1
+                return default
+            #
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+
+            return entry[1]
+        #
+    #
+
+    def remove(self, key):
+        """
+Removes the entry cached for the given key.
+
+:param key: Cache key
+
+:return: (bool) True if an entry has been removed
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            _return = (key in self._cache)
+            if (_return): del(self._cache[key])
+
+            return _return
+        #
+    #
+
+    def remove_matching(self, callback):
+        """
+Removes all entries where the given callback returns true for the key.
+
+:param callback: Python callable called with the cache key
+
+:return: (int) Number of entries removed
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            keys = [ key for key in self._cache if callback(key) ]
+            for key in keys: del(self._cache[key])
+
+            return len(keys)
+        #
+    #
+
+    def set(self, key, value):
+        """
+Caches the given value for the key.
+
+:param key: Cache key
+:param value: Value to be cached
+
+:since: v1.0.0
+        """
+
+        expires = (None if (self._ttl is None) else monotonic() + self._ttl)
+
+        with self._lock:
+            self._cache[key] = ( expires, value )
+            self._cache.move_to_end(key)
+
+            self._evict_to_size()
+        #
+    #
+#
@@ -17,5 +17,11 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from .abstract import Abstract
-from .call_context import CallContext
+from ..lazy_module_attributes import LazyModuleAttributes as _LazyModuleAttributes
+
+_LazyModuleAttributes.install(globals(),
+                              { "Abstract": "abstract",
+                                "AsyncCallContext": "async_call_context",
+                                "CallContext": "call_context"
+                              }
+                             )
@@ -17,6 +17,15 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+# pylint: disable=import-error
+
+from contextvars import copy_context
+from functools import partial
+from itertools import islice
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
 from dpt_runtime.supports_mixin import SupportsMixin
 
 class Abstract(SupportsMixin):
@@ -33,17 +42,29 @@ implementations.
              Mozilla Public License, v. 2.0
     """
 
+    ITERATION_CHUNK_SIZE = 64
+    """
+Number of items read ahead in the executor if synchronous iterators are
+iterated asynchronously
+    """
+
     __slots__ = [ "_context_manager_callee_instance" ] + SupportsMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _executor = None
+    """
+Executor used to call synchronous methods for asynchronous requests; None
+to use the default executor of the event loop
+    """
 
-    def __init__(self, crud_url_elements):
+    def __init__(self, crud_url_elements, route = None):
         """
 Constructor __init__(Abstract)
 
 :param crud_url_elements: CRUD URL elements
+:param route: Protocol specific route returned by "compile_route()"
 
 :since: v1.0.0
         """
@@ -80,4 +101,179 @@ Sets the callee instance used for pre and post request methods.
 
         self._context_manager_callee_instance = callee_instance
     #
+
+    @classmethod
+    async def aiterate_result(cls, result):
+        """
+Iterates the given operation result asynchronously. Items of synchronous
+iterables are read in chunks in the configured executor only after the
+previous chunk has been consumed.
+
+:param cls: Python class
+:param result: Operation result
+
+:since: v1.0.0
+        """
+
+        if (hasattr(result, "__aiter__")):
+            try:
+                async for item in result: yield item
+            finally:
+                if (hasattr(result, "aclose")): await result.aclose()
+            #
+        elif (cls.is_result_iterable(result)):
+            iterator = iter(result)
+
+            try:
+                while True:
+                    chunk = await cls.call_in_executor(list, islice(iterator, cls.ITERATION_CHUNK_SIZE))
+                    if (len(chunk) < 1): break
+
+                    for item in chunk: yield item
+                #
+            finally:
+                if (hasattr(iterator, "close")): iterator.close()
+            #
+        elif (result is not None): yield result
+    #
+
+    @staticmethod
+    async def call_in_executor(_callable, *args, **kwargs):
+        """
+Calls the given synchronous callable in the configured executor and awaits
+its result. The callable runs in a copy of the current context so that
+context variables are available to it.
+
+:param _callable: Python callable
+
+:return: (mixed) Return value of the callable
+:since:  v1.0.0
+        """
+
+        from asyncio import get_running_loop
+
+        return await get_running_loop().run_in_executor(Abstract._executor, partial(copy_context().run, _callable, *args, **kwargs))
+    #
+
+    @classmethod
+    def compile_route(cls, crud_url_elements):
+        """
+Returns the protocol specific route for the CRUD URL elements given. The
+route is cached and shared between all instances created for the same CRUD
+URL and must therefore be immutable.
+
+:param cls: Python class
+:param crud_url_elements: CRUD URL elements
+
+:return: (mixed) Protocol specific route; None if not applicable
+:since:  v1.0.0
+        """
+
+        # pylint: disable=unused-argument
+
+        return None
+    #
+
+    @staticmethod
+    def get_executor():
+        """
+Returns the executor used to call synchronous methods for asynchronous
+requests.
+
+:return: (object) Executor instance; None for the default executor of the
+         event loop
+:since:  v1.0.0
+        """
+
+        return Abstract._executor
+    #
+
+    def invalidate_cached_results(self, operation, kwargs):
+        """
+Invalidates cached results after the given operation has been executed
+outside of this protocol instance, e.g. in a worker process.
+
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=unused-argument
+
+        pass
+    #
+
+    @staticmethod
+    def is_result_iterable(result):
+        """
+Returns true if the given operation result should be streamed item by item.
+Strings, bytes and mappings are considered to be single values.
+
+:param result: Operation result
+
+:return: (bool) True if iterable
+:since:  v1.0.0
+        """
+
+        return (hasattr(result, "__iter__") and (not isinstance(result, ( str, bytes, bytearray, memoryview, Mapping ))))
+    #
+
+    @classmethod
+    def iterate_result(cls, result):
+        """
+Iterates the given operation result.
+
+:param cls: Python class
+:param result: Operation result
+
+:since: v1.0.0
+        """
+
+        if (cls.is_result_iterable(result)): yield from result
+        elif (result is not None): yield result
+    #
+
+    @classmethod
+    def is_route_valid(cls, route):
+        """
+Returns true if the cached protocol specific route given is still valid.
+
+:param cls: Python class
+:param route: Protocol specific route returned by "compile_route()"
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        # pylint: disable=unused-argument
+
+        return True
+    #
+
+    def release(self):
+        """
+Releases resources held by this protocol instance. The instance must not be
+used afterwards.
+
+:since: v1.0.0
+        """
+
+        pass
+    #
+
+    @staticmethod
+    def set_executor(executor):
+        """
+Sets the executor used to call synchronous methods for asynchronous
+requests, e.g. a "concurrent.futures.ThreadPoolExecutor" instance.
+
+:param executor: Executor instance; None for the default executor of the
+                 event loop
+
+:since: v1.0.0
+        """
+
+        Abstract._executor = executor
+    #
 #
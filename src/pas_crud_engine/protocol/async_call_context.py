@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasCrudEngineVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from inspect import isawaitable
+
+from dpt_runtime.exception_log_trap import ExceptionLogTrap
+
+from ..instrumentation import Instrumentation
+from .call_context import CallContext
+
+class AsyncCallContext(CallContext):
+    """
+"AsyncCallContext" implements an asynchronous context manager used to call
+pre and post methods for CRUD requests. Coroutine methods of the callee are
+awaited.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def __aenter__(self):
+        """
+python.org: Semantically similar to __enter__(), the only difference being
+that it must return an awaitable.
+
+:since: v1.0.0
+        """
+
+        if (self._pre_callable is not None):
+            with ExceptionLogTrap("pas_crud_engine"): await self._call_callee_method_async(self._pre_callable, "pre")
+        #
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Semantically similar to __exit__(), the only difference being
+that it must return an awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  v1.0.0
+        """
+
+        if (self._post_callable is not None):
+            with ExceptionLogTrap("pas_crud_engine"):
+                await self._call_callee_method_async(self._post_callable, "post", **self._get_post_call_kwargs(exc_type, exc_value, traceback))
+            #
+        #
+
+        return False
+    #
+
+    async def _call_callee_method_async(self, _callable, prefix, **kwargs):
+        """
+Calls the given callee method and awaits its result if applicable. The
+call is recorded if instrumentation is enabled.
+
+:param _callable: Callee method
+:param prefix: Method name prefix ("pre" or "post")
+
+:return: (mixed) Callee method return value
+:since:  v1.0.0
+        """
+
+        if (self.instrumentation_key is None or (not Instrumentation.is_enabled())):
+            _return = _callable(**kwargs)
+            if (isawaitable(_return)): _return = await _return
+        else: _return = await Instrumentation.acall(self._get_instrumentation_step_key(prefix), _callable, **kwargs)
+
+        return _return
+    #
+#
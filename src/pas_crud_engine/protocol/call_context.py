@@ -17,12 +17,18 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from inspect import getattr_static
+
 from dpt_runtime.exception_log_trap import ExceptionLogTrap
 
+from ..instrumentation import Instrumentation
+from ..lru_cache import LruCache
+
 class CallContext(object):
     """
 "CallContext" implements a context manager used to call pre and post methods
-for CRUD requests.
+for CRUD requests. Callee methods are resolved once on construction and the
+context may be entered repeatedly.
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -33,18 +39,25 @@ for CRUD requests.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "call_context_base_name", "callee_instance" ]
+    __slots__ = [ "_post_callable", "_pre_callable", "call_context_base_name", "callee_instance", "instrumentation_key" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _callee_class_methods_cache = LruCache(max_size = 1024)
+    """
+Cache of "pre" and "post" method names and class attributes per callee class
+and method base name
+    """
 
-    def __init__(self, callee_instance, base_name = None):
+    def __init__(self, callee_instance, base_name = None, instrumentation_key = None):
         """
 Constructor __init__(CallContext)
 
 :param callee_instance: Callee instance
 :param base_name: Method base name for "pre_*" and "post_*" calls
+:param instrumentation_key: Metric key tuple of module, instance and
+                            operation used to record callee method calls
 
 :since: v1.0.0
         """
@@ -57,6 +70,25 @@ Method base name
         """
 Callee instance used for pre and post request methods if applicable.
         """
+        self.instrumentation_key = instrumentation_key
+        """
+Metric key tuple of module, instance and operation
+        """
+
+        self._pre_callable = None
+        """
+Callee "pre" method; None if not defined
+        """
+        self._post_callable = None
+        """
+Callee "post" method; None if not defined
+        """
+
+        if (callee_instance is not None):
+            with ExceptionLogTrap("pas_crud_engine"):
+                self._pre_callable, self._post_callable = self.__class__._get_callee_methods(callee_instance, base_name)
+            #
+        #
     #
 
     def __enter__(self):
@@ -66,16 +98,8 @@ python.org: Enter the runtime context related to this object.
 :since: v1.0.0
         """
 
-        if (self.callee_instance is not None):
-            with ExceptionLogTrap("pas_crud_engine"):
-                method_name = ("pre_{0}".format(self.call_context_base_name)
-                               if (self.call_context_base_name is not None) else
-                               "_pre_call"
-                              )
-
-                _callable = getattr(self.callee_instance, method_name, None)
-                if (callable(_callable)): _callable()
-            #
+        if (self._pre_callable is not None):
+            with ExceptionLogTrap("pas_crud_engine"): self._call_callee_method(self._pre_callable, "pre")
         #
     #
 
@@ -87,27 +111,139 @@ python.org: Exit the runtime context related to this object.
 :since:  v1.0.0
         """
 
-        if (self.callee_instance is not None):
+        if (self._post_callable is not None):
             with ExceptionLogTrap("pas_crud_engine"):
-                method_name = ("post_{0}".format(self.call_context_base_name)
-                               if (self.call_context_base_name is not None) else
-                               "_post_call"
-                              )
+                self._call_callee_method(self._post_callable, "post", **self._get_post_call_kwargs(exc_type, exc_value, traceback))
+            #
+        #
+
+        return False
+    #
+
+    def _call_callee_method(self, _callable, prefix, **kwargs):
+        """
+Calls the given callee method. The call is recorded if instrumentation is
+enabled.
+
+:param _callable: Callee method
+:param prefix: Method name prefix ("pre" or "post")
 
-                _callable = getattr(self.callee_instance, method_name, None)
+:return: (mixed) Callee method return value
+:since:  v1.0.0
+        """
 
-                if (callable(_callable)):
-                    kwargs = { }
+        return (_callable(**kwargs)
+                if (self.instrumentation_key is None or (not Instrumentation.is_enabled())) else
+                Instrumentation.call(self._get_instrumentation_step_key(prefix), _callable, **kwargs)
+               )
+    #
+
+    @staticmethod
+    def _get_callee_class_methods(callee_class, base_name):
+        """
+Returns the "pre" and "post" method names and class attributes for the
+given callee class and method base name. Results are cached.
 
-                    if (exc_type is not None or exc_value is not None):
-                        kwargs['exception'] = { "type": exc_type, "value": exc_value, "traceback": traceback }
-                    #
+:param callee_class: Callee class
+:param base_name: Method base name for "pre_*" and "post_*" calls
+
+:return: (tuple) Tuple of method name and class attribute tuples; class
+         attributes are None if not callable
+:since:  v1.0.0
+        """
 
-                    _callable(**kwargs)
-                #
+        cache_key = ( callee_class, base_name )
+        _return = CallContext._callee_class_methods_cache.get(cache_key)
+
+        if (_return is None):
+            method_names = (( "pre_{0}".format(base_name), "post_{0}".format(base_name) )
+                            if (base_name is not None) else
+                            ( "_pre_call", "_post_call" )
+                           )
+
+            _return = tuple(( method_name,
+                              (getattr_static(callee_class, method_name) if (callable(getattr(callee_class, method_name, None))) else None)
+                            )
+                            for method_name in method_names
+                           )
+
+            CallContext._callee_class_methods_cache.set(cache_key, _return)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_callee_methods(callee_instance, base_name):
+        """
+Returns the "pre" and "post" methods bound to the given callee instance.
+Attributes of the instance itself take precedence over class attributes.
+Methods not found statically, e.g. provided by "__getattr__()" or
+"__slots__" attributes, are looked up dynamically.
+
+:param callee_instance: Callee instance
+:param base_name: Method base name for "pre_*" and "post_*" calls
+
+:return: (tuple) Tuple of "pre" and "post" methods; None if not defined
+:since:  v1.0.0
+        """
+
+        callee_class = type(callee_instance)
+        instance_dict = getattr(callee_instance, "__dict__", None)
+
+        _return = [ ]
+
+        for method_name, class_attribute in CallContext._get_callee_class_methods(callee_class, base_name):
+            if (isinstance(instance_dict, dict) and method_name in instance_dict):
+                _callable = instance_dict[method_name]
+                _return.append(_callable if (callable(_callable)) else None)
+            elif (class_attribute is None):
+                _callable = getattr(callee_instance, method_name, None)
+                _return.append(_callable if (callable(_callable)) else None)
+            else:
+                _return.append(class_attribute.__get__(callee_instance, callee_class)
+                               if (hasattr(class_attribute, "__get__")) else
+                               class_attribute
+                              )
             #
         #
 
-        return False
+        return tuple(_return)
+    #
+
+    def _get_instrumentation_step_key(self, prefix):
+        """
+Returns the metric key for the callee method of the given prefix.
+
+:param prefix: Method name prefix ("pre" or "post")
+
+:return: (tuple) Metric key
+:since:  v1.0.0
+        """
+
+        return self.instrumentation_key + ( "{0}_{1}".format(prefix, ("call" if (self.call_context_base_name is None) else self.call_context_base_name)), )
+    #
+
+    @staticmethod
+    def _get_post_call_kwargs(exc_type, exc_value, traceback):
+        """
+Returns the keyword arguments for the "post_*" method call. Closing a
+streamed result early is not reported as an exception.
+
+:param exc_type: Exception type
+:param exc_value: Exception value
+:param traceback: Exception traceback
+
+:return: (dict) Keyword arguments
+:since:  v1.0.0
+        """
+
+        _return = { }
+
+        if ((exc_type is not None or exc_value is not None) and exc_type is not GeneratorExit):
+            _return['exception'] = { "type": exc_type, "value": exc_value, "traceback": traceback }
+        #
+
+        return _return
     #
 #
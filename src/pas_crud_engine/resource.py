@@ -25,9 +25,15 @@ except ImportError: from collections import Mapping
 try: from urllib.parse import urlsplit
 except ImportError: from urlparse import urlsplit
 
-from dpt_module_loader import NamedClassLoader
+from contextvars import copy_context
+from functools import partial
+from time import monotonic, perf_counter
+
 from dpt_runtime.binary import Binary
+from dpt_threading.thread_lock import ThreadLock
 
+from .instrumentation import Instrumentation
+from .lru_cache import LruCache
 from .operation_failed_exception import OperationFailedException
 from .operation_not_supported_exception import OperationNotSupportedException
 from .protocol import Abstract
@@ -49,18 +55,47 @@ class Resource(object):
     """
 List of CRUD operation names
     """
+    SHARED_MEMORY_RESULT_MIN_SIZE = 1048576
+    """
+Minimum size of binary results returned from worker processes in shared
+memory instead of being pickled
+    """
 
     __slots__ = [ "_instance", "_path", "_protocol", "_url" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _fan_out_executor = None
+    """
+Thread pool executor used for fan-out branches if no executor is configured
+for protocols
+    """
+    _fan_out_executor_lock = ThreadLock()
+    """
+Thread safety lock for the fan-out thread pool executor
+    """
+    _process_pool_executor = None
+    """
+Process pool executor used for operations supporting "process_pool_*"
+    """
+    _process_pool_executor_lock = ThreadLock()
+    """
+Thread safety lock for the process pool executor
+    """
+    _route_cache = LruCache(max_size = 1024, ttl = 3600)
+    """
+Cache of compiled routes for CRUD URLs requested
+    """
 
     def __init__(self, crud_url):
         """
 Constructor __init__(Resource)
 
-:param crud_url: CRUD URL to query
+:param crud_url: CRUD URL to query. Protocols supporting
+                 "resource_templates" accept path placeholders like "{id}"
+                 replaced by keyword arguments of the same name for each
+                 call.
 
 :since: v1.0.0
         """
@@ -82,17 +117,21 @@ CRUD URL scheme protocol
 CRUD URL
         """
 
-        if ("://" not in crud_url):
-            if (crud_url[:1] != "/"): crud_url = "/{0}".format(crud_url)
-            crud_url = "x-python-module://{0}".format(crud_url)
-        #
+        route = self.__class__._route_cache.get(crud_url)
 
-        crud_url_elements = urlsplit(crud_url)
+        if (route is None or (not route[2].is_route_valid(route[3]))):
+            route = self.__class__._compile_route(crud_url)
+            self.__class__._route_cache.set(crud_url, route)
+        #
 
+        crud_url_elements, self._protocol, protocol_class, protocol_route = route
         self._path = crud_url_elements.path
-        self._protocol = crud_url_elements.scheme.replace("-", "_")
 
-        self._init_protocol_instance(crud_url_elements)
+        self._init_protocol_instance(protocol_class, crud_url_elements, protocol_route)
+
+        if ("{" in self._path and (not self._instance.is_supported("resource_templates"))):
+            raise OperationNotSupportedException("CRUD protocol '{0}' does not support resource templates".format(self._protocol))
+        #
     #
 
     @property
@@ -147,6 +186,29 @@ Sets the callee instance used for pre and post request methods.
         self._instance.context_manager_callee = callee_instance
     #
 
+    def __enter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:return: (object) Resource instance
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+:since:  v1.0.0
+        """
+
+        self.release()
+        return False
+    #
+
     def __getattr__(self, name):
         """
 python.org: Called when an attribute lookup has not found the attribute in
@@ -163,6 +225,200 @@ class tree for self).
         return proxymethod
     #
 
+    async def acall(self, operation, **kwargs):
+        """
+Executes the given operation asynchronously for the initialized CRUD URL
+entity instance. Protocols not supporting "async_calls" are called in the
+configured executor.
+
+:param operation: CRUD operation
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        operation = self._get_supported_operation(operation)
+
+        if (self._instance.is_supported("process_pool_" + operation)): _callable = self._acall_in_process_pool
+        elif (self._instance.is_supported("async_calls")): _callable = self._instance.acall
+        else: _callable = partial(Abstract.call_in_executor, self.call)
+
+        return await (_callable(operation, **kwargs)
+                      if (not Instrumentation.is_enabled()) else
+                      Instrumentation.acall(Instrumentation.get_path_entity_names(self._path) + ( operation, "acall" ), _callable, operation, **kwargs)
+                     )
+    #
+
+    @staticmethod
+    async def _acall_fan_out_branch(resource, timeout, operation, kwargs):
+        """
+Executes the given operation asynchronously for the fan-out branch resource
+and releases it afterwards.
+
+:param resource: Branch resource
+:param timeout: Timeout in seconds; None for no timeout
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        from asyncio import wait_for, TimeoutError as AsyncTimeoutError
+
+        try:
+            return await (resource.acall(operation, **kwargs)
+                          if (timeout is None) else
+                          wait_for(resource.acall(operation, **kwargs), timeout)
+                         )
+        except AsyncTimeoutError as handled_exception: raise OperationFailedException("Fan-out branch timed out", _exception = handled_exception)
+        finally: resource.release()
+    #
+
+    async def _acall_in_process_pool(self, operation, **kwargs):
+        """
+Executes the given operation asynchronously in a worker process of the
+process pool. Results cached in this process are invalidated afterwards if
+applicable.
+
+:param operation: Supported CRUD operation
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        from asyncio import get_running_loop
+
+        _return = self.__class__._get_process_pool_result(await get_running_loop().run_in_executor(self.__class__.get_process_pool_executor(),
+                                                                                                     self._get_process_pool_call(operation, kwargs)
+                                                                                                    ))
+
+        self._instance.invalidate_cached_results(operation, kwargs)
+
+        return _return
+    #
+
+    async def afan_out(self, operation, branches, timeout = None, **kwargs):
+        """
+Executes the given operation asynchronously and concurrently for each
+fan-out branch. Branches timed out are cancelled.
+
+:param operation: CRUD operation
+:param branches: Dict of branch names and CRUD URL paths relative to this
+                 resource or tuples of relative path and branch timeout
+:param timeout: Default branch timeout in seconds; None for no timeout
+
+:return: (dict) Dict of branch names and dictionaries with the keys
+         "operation", "result" and "exception"
+:since:  v1.0.0
+        """
+
+        from asyncio import gather
+
+        branch_resources = self._get_fan_out_branch_resources(branches, timeout)
+
+        awaitables = [ (self.__class__._acall_fan_out_branch(resource, branch_timeout, operation, kwargs)
+                        if (isinstance(resource, Resource)) else
+                        self.__class__._raise_fan_out_exception(resource)
+                       )
+                       for resource, branch_timeout in branch_resources.values()
+                     ]
+
+        results = await gather(*awaitables, return_exceptions = True)
+
+        return dict(( name, self.__class__._get_fan_out_result(operation, result) )
+                    for name, result in zip(branch_resources, results)
+                   )
+    #
+
+    def aiterate(self, operation, **kwargs):
+        """
+Returns an asynchronous iterator for the items returned or yielded by the
+given operation. Items are only requested from the CRUD entity instance if
+the consumer has processed the previous ones.
+
+:param operation: CRUD operation
+
+:return: (object) Asynchronous iterator
+:since:  v1.0.0
+        """
+
+        operation = self._get_supported_operation(operation)
+
+        return (self._instance.aiterate(operation, **kwargs)
+                if (self._instance.is_supported("streaming_calls")) else
+                self._aiterate_result(operation, kwargs)
+               )
+    #
+
+    async def _aiterate_result(self, operation, kwargs):
+        """
+Executes the given operation asynchronously and iterates its result.
+
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:since: v1.0.0
+        """
+
+        async for item in Abstract.aiterate_result(await self.acall(operation, **kwargs)): yield item
+    #
+
+    def batch(self, operations):
+        """
+Executes the given list of operations for the initialized CRUD URL entity
+instance. Consecutive operations of the same type are executed together
+using "call_many()". Failed operations are reported in the result list and
+do not abort the batch.
+
+:param operations: List of tuples of CRUD operation and keyword arguments
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        batch_operation = None
+        batch_kwargs_list = [ ]
+
+        for operation, kwargs in operations:
+            if (operation != batch_operation and len(batch_kwargs_list) > 0):
+                _return += self._batch_call_many(batch_operation, batch_kwargs_list)
+                batch_kwargs_list = [ ]
+            #
+
+            batch_operation = operation
+            batch_kwargs_list.append(kwargs)
+        #
+
+        if (len(batch_kwargs_list) > 0): _return += self._batch_call_many(batch_operation, batch_kwargs_list)
+
+        return _return
+    #
+
+    def _batch_call_many(self, operation, kwargs_list):
+        """
+Executes the given operation for each keyword arguments dictionary given
+and reports an unsupported operation for each of them.
+
+:param operation: CRUD operation
+:param kwargs_list: List of keyword arguments dictionaries
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        try: _return = self.call_many(operation, kwargs_list)
+        except OperationNotSupportedException as handled_exception:
+            _return = [ { "operation": operation, "result": None, "exception": handled_exception } for _ in kwargs_list ]
+        #
+
+        return _return
+    #
+
     def call(self, operation, **kwargs):
         """
 Executes the given operation for the initialized CRUD URL entity instance.
@@ -173,11 +429,114 @@ Executes the given operation for the initialized CRUD URL entity instance.
 :since:  v1.0.0
         """
 
-        operation = Binary.str(operation)
-        if (type(operation) is not str): raise OperationNotSupportedException()
-        operation = operation.lower()
+        operation = self._get_supported_operation(operation)
 
-        if (operation not in self.__class__.OPERATIONS_SUPPORTED): raise OperationNotSupportedException("Operation '{0}' is not supported".format(operation))
+        if (not Instrumentation.is_enabled()): _return = self._call(operation, kwargs)
+        else: _return = Instrumentation.call(Instrumentation.get_path_entity_names(self._path) + ( operation, "call" ), self._call, operation, kwargs)
+
+        return _return
+    #
+
+    def _call(self, operation, kwargs):
+        """
+Executes the given supported operation for the initialized CRUD URL entity
+instance. Results cached in this process are invalidated after operations
+executed in a worker process if applicable.
+
+:param operation: Supported CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        if (self._instance.is_supported("process_pool_" + operation)):
+            _return = self.__class__._get_process_pool_result(self.__class__.get_process_pool_executor().submit(self._get_process_pool_call(operation, kwargs)).result())
+            self._instance.invalidate_cached_results(operation, kwargs)
+        else: _return = self._call_instance(operation, kwargs)
+
+        return _return
+    #
+
+    @staticmethod
+    def _call_fan_out_branch(resource, operation, kwargs):
+        """
+Executes the given operation for the fan-out branch resource and releases
+it afterwards.
+
+:param resource: Branch resource
+:param operation: CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        try: return resource.call(operation, **kwargs)
+        finally: resource.release()
+    #
+
+    @staticmethod
+    def _call_in_worker(crud_url, operation, kwargs, access_control_validator, callee_instance):
+        """
+Executes the given operation for the CRUD URL in a worker process. Binary
+results of at least "SHARED_MEMORY_RESULT_MIN_SIZE" bytes are returned in
+shared memory owned by the calling process afterwards.
+
+:param crud_url: CRUD URL
+:param operation: Supported CRUD operation
+:param kwargs: Keyword arguments
+:param access_control_validator: Access control validator instance; None
+                                 if not set
+:param callee_instance: Callee instance; None if not set
+
+:return: (tuple) Tuple of shared memory name and a tuple of result size and
+         type; tuple of None and result if not returned in shared memory
+:since:  v1.0.0
+        """
+
+        try: from multiprocessing import resource_tracker, shared_memory
+        except ImportError: shared_memory = None
+
+        with Resource(crud_url) as resource:
+            if (access_control_validator is not None): resource.access_control_validator = access_control_validator
+            if (callee_instance is not None): resource.context_manager_callee = callee_instance
+
+            result = resource._call_instance(operation, kwargs)
+        #
+
+        _return = ( None, result )
+
+        if (shared_memory is not None
+            and isinstance(result, ( bytes, bytearray, memoryview ))
+            and memoryview(result).contiguous
+            and memoryview(result).nbytes >= Resource.SHARED_MEMORY_RESULT_MIN_SIZE
+           ):
+            result_view = memoryview(result).cast("B")
+            result_memory = shared_memory.SharedMemory(create = True, size = result_view.nbytes)
+
+            try:
+                result_memory.buf[:result_view.nbytes] = result_view
+                resource_tracker.unregister(result_memory._name, "shared_memory") # pylint: disable=protected-access
+            finally: result_memory.close()
+
+            _return = ( result_memory.name, ( result_view.nbytes, (bytearray if (isinstance(result, bytearray)) else bytes) ) )
+        #
+
+        return _return
+    #
+
+    def _call_instance(self, operation, kwargs):
+        """
+Executes the given supported operation for the initialized CRUD URL entity
+instance in the current process.
+
+:param operation: Supported CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
 
         try: _callable = getattr(self._instance, operation)
         except AttributeError as handled_exception: raise OperationNotSupportedException("Operation '{0}' is not supported".format(operation), _exception = handled_exception)
@@ -185,22 +544,439 @@ Executes the given operation for the initialized CRUD URL entity instance.
         return _callable(**kwargs)
     #
 
-    def _init_protocol_instance(self, crud_url_elements):
+    def call_many(self, operation, kwargs_list):
+        """
+Executes the given operation for each keyword arguments dictionary given.
+The operation is resolved only once and protocols supporting "batch_calls"
+may pass all items to batch aware CRUD entity methods. Failed items are
+reported in the result list and do not abort the batch.
+
+:param operation: CRUD operation
+:param kwargs_list: List of keyword arguments dictionaries
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        operation = self._get_supported_operation(operation)
+
+        if (not Instrumentation.is_enabled()): _return = self._call_many(operation, kwargs_list)
+        else: _return = Instrumentation.call(Instrumentation.get_path_entity_names(self._path) + ( operation, "call_many" ), self._call_many, operation, kwargs_list)
+
+        return _return
+    #
+
+    def _call_many(self, operation, kwargs_list):
+        """
+Executes the given supported operation for each keyword arguments
+dictionary given. Operations supporting "process_pool_<operation>" are
+executed concurrently in worker processes.
+
+:param operation: Supported CRUD operation
+:param kwargs_list: List of keyword arguments dictionaries
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._instance.is_supported("process_pool_" + operation)): return self._call_many_in_process_pool(operation, kwargs_list)
+        if (self._instance.is_supported("batch_calls")): return self._instance.call_many(operation, kwargs_list)
+
+        try: _callable = getattr(self._instance, operation)
+        except AttributeError as handled_exception: raise OperationNotSupportedException("Operation '{0}' is not supported".format(operation), _exception = handled_exception)
+
+        _return = [ ]
+
+        for kwargs in kwargs_list:
+            try: _return.append({ "operation": operation, "result": _callable(**kwargs), "exception": None })
+            except Exception as handled_exception: _return.append({ "operation": operation, "result": None, "exception": handled_exception })
+        #
+
+        return _return
+    #
+
+    def _call_many_in_process_pool(self, operation, kwargs_list):
+        """
+Executes the given operation for each keyword arguments dictionary given
+concurrently in worker processes of the process pool. Results cached in
+this process are invalidated after each successful item if applicable.
+
+:param operation: Supported CRUD operation
+:param kwargs_list: List of keyword arguments dictionaries
+
+:return: (list) List of dictionaries with the keys "operation", "result"
+         and "exception"
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        executor = self.__class__.get_process_pool_executor()
+        futures = [ executor.submit(self._get_process_pool_call(operation, kwargs)) for kwargs in kwargs_list ]
+
+        _return = [ ]
+
+        for kwargs, future in zip(kwargs_list, futures):
+            try:
+                result = self.__class__._get_process_pool_result(future.result())
+                self._instance.invalidate_cached_results(operation, kwargs)
+
+                _return.append({ "operation": operation, "result": result, "exception": None })
+            except Exception as handled_exception: _return.append({ "operation": operation, "result": None, "exception": handled_exception })
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _compile_route(crud_url):
+        """
+Parses the CRUD URL given and resolves the protocol class responsible for
+it.
+
+:param crud_url: CRUD URL to compile
+
+:return: (tuple) CRUD URL elements, protocol name, protocol class and
+         protocol specific route
+:since:  v1.0.0
+        """
+
+        crud_url_elements, protocol, protocol_class = Resource._get_protocol_class(crud_url)
+        return ( crud_url_elements, protocol, protocol_class, protocol_class.compile_route(crud_url_elements) )
+    #
+
+    def fan_out(self, operation, branches, timeout = None, **kwargs):
+        """
+Executes the given operation concurrently for each fan-out branch in the
+configured executor or a shared thread pool. Results of branches timed out
+are reported as failed; their threads can not be interrupted and finish in
+the background. Fan-out must not be nested in branches executed in the same
+bounded executor.
+
+:param operation: CRUD operation
+:param branches: Dict of branch names and CRUD URL paths relative to this
+                 resource or tuples of relative path and branch timeout
+:param timeout: Default branch timeout in seconds; None for no timeout
+
+:return: (dict) Dict of branch names and dictionaries with the keys
+         "operation", "result" and "exception"
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        _return = { }
+
+        branch_resources = self._get_fan_out_branch_resources(branches, timeout)
+        executor = self.__class__._get_fan_out_executor()
+        started = monotonic()
+
+        futures = dict(( name,
+                         (executor.submit(copy_context().run, self.__class__._call_fan_out_branch, resource, operation, kwargs)
+                          if (isinstance(resource, Resource)) else
+                          resource
+                         )
+                       )
+                       for name, ( resource, _ ) in branch_resources.items()
+                      )
+
+        for name, future in futures.items():
+            branch_timeout = branch_resources[name][1]
+
+            try:
+                if (isinstance(future, Exception)): raise future
+                result = future.result(None if (branch_timeout is None) else max(0, started + branch_timeout - monotonic()))
+            except FutureTimeoutError as handled_exception:
+                future.cancel()
+                result = OperationFailedException("Fan-out branch timed out", _exception = handled_exception)
+            except Exception as handled_exception: result = handled_exception
+
+            _return[name] = self.__class__._get_fan_out_result(operation, result)
+        #
+
+        return _return
+    #
+
+    def _get_fan_out_branch_resources(self, branches, timeout):
+        """
+Returns the resources for the given fan-out branches. The access control
+validator and callee instance of this resource are used for them as well.
+
+:param branches: Dict of branch names and CRUD URL paths relative to this
+                 resource or tuples of relative path and branch timeout
+:param timeout: Default branch timeout in seconds; None for no timeout
+
+:return: (dict) Dict of branch names and tuples of branch resource or
+         exception raised and branch timeout
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (not isinstance(branches, Mapping)): raise OperationFailedException("Fan-out branches given are invalid")
+
+        _return = { }
+
+        access_control_validator = (self._instance.access_control_validator
+                                    if (self._instance.is_supported("access_control_validator")) else
+                                    None
+                                   )
+
+        for name, branch in branches.items():
+            branch_path, branch_timeout = (branch if (isinstance(branch, tuple)) else ( branch, timeout ))
+
+            try:
+                resource = Resource(("{0}/{1}".format(self._url.rstrip("/"), branch_path.strip("/"))
+                                     if (len(branch_path.strip("/")) > 0) else
+                                     self._url
+                                    ))
+
+                if (access_control_validator is not None): resource.access_control_validator = access_control_validator
+                if (self.context_manager_callee is not None): resource.context_manager_callee = self.context_manager_callee
+            except Exception as handled_exception: resource = handled_exception
+
+            _return[name] = ( resource, branch_timeout )
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_fan_out_executor(cls):
+        """
+Returns the executor used for fan-out branches. The executor configured
+for protocols is used if set.
+
+:param cls: Python class
+
+:return: (object) Executor instance
+:since:  v1.0.0
+        """
+
+        _return = Abstract.get_executor()
+
+        if (_return is None):
+            with cls._fan_out_executor_lock:
+                if (cls._fan_out_executor is None):
+                    from concurrent.futures import ThreadPoolExecutor
+                    cls._fan_out_executor = ThreadPoolExecutor(thread_name_prefix = "pas_crud_engine_fan_out")
+                #
+
+                _return = cls._fan_out_executor
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_fan_out_result(operation, result):
+        """
+Returns the fan-out result dictionary for the given branch result.
+
+:param operation: CRUD operation
+:param result: Branch result or exception raised
+
+:return: (dict) Dictionary with the keys "operation", "result" and
+         "exception"
+:since:  v1.0.0
+        """
+
+        return ({ "operation": operation, "result": None, "exception": result }
+                if (isinstance(result, Exception)) else
+                { "operation": operation, "result": result, "exception": None }
+               )
+    #
+
+    def _get_process_pool_call(self, operation, kwargs):
+        """
+Returns the picklable call of "_call_in_worker()" for the given operation.
+Keyword arguments starting with an underscore are not passed to the worker
+process. Binary payload views are copied as they can not be pickled.
+
+:param operation: Supported CRUD operation
+:param kwargs: Keyword arguments
+
+:return: (object) Python callable
+:since:  v1.0.0
+        """
+
+        from mmap import mmap
+
+        return partial(self.__class__._call_in_worker,
+                       self._url,
+                       operation,
+                       dict(( key, (bytes(value) if (isinstance(value, ( memoryview, mmap ))) else value) )
+                            for key, value in kwargs.items()
+                            if key[:1] != "_"
+                           ),
+                       (self._instance.access_control_validator if (self._instance.is_supported("access_control_validator")) else None),
+                       self.context_manager_callee
+                      )
+    #
+
+    @staticmethod
+    def _get_process_pool_result(worker_result):
+        """
+Returns the operation return value for the result of "_call_in_worker()".
+Shared memory used is released afterwards.
+
+:param worker_result: Result of "_call_in_worker()"
+
+:return: (mixed) Operation return value
+:since:  v1.0.0
+        """
+
+        result_memory_name, _return = worker_result
+
+        if (result_memory_name is not None):
+            from multiprocessing import shared_memory
+
+            result_size, result_type = _return
+            result_memory = shared_memory.SharedMemory(name = result_memory_name)
+
+            try: _return = result_type(result_memory.buf[:result_size])
+            finally:
+                result_memory.close()
+                result_memory.unlink()
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_protocol_class(crud_url):
+        """
+Parses the CRUD URL given and imports the protocol class responsible for
+it.
+
+:param crud_url: CRUD URL
+
+:return: (tuple) CRUD URL elements, protocol name and protocol class
+:since:  v1.0.0
+        """
+
+        from dpt_module_loader import NamedClassLoader
+
+        if ("://" not in crud_url):
+            if (crud_url[:1] != "/"): crud_url = "/{0}".format(crud_url)
+            crud_url = "x-python-module://{0}".format(crud_url)
+        #
+
+        crud_url_elements = urlsplit(crud_url)
+        protocol = crud_url_elements.scheme.replace("-", "_")
+
+        protocol_class_name = NamedClassLoader.get_camel_case_class_name(protocol)
+        protocol_class = NamedClassLoader.get_class_in_namespace("crud", "protocol.{0}".format(protocol_class_name))
+
+        if (not (isinstance(protocol_class, type) and issubclass(protocol_class, Abstract))):
+            raise OperationFailedException("CRUD protocol '{0}' is not supported".format(protocol))
+        #
+
+        return ( crud_url_elements, protocol, protocol_class )
+    #
+
+    def _get_supported_operation(self, operation):
+        """
+Returns the normalized operation name if it is supported.
+
+:param operation: CRUD operation
+
+:return: (str) Normalized CRUD operation
+:since:  v1.0.0
+        """
+
+        if (type(operation) is not str):
+            operation = Binary.str(operation)
+            if (type(operation) is not str): raise OperationNotSupportedException()
+        #
+
+        operation = operation.lower()
+
+        if (operation not in self.__class__.OPERATIONS_SUPPORTED): raise OperationNotSupportedException("Operation '{0}' is not supported".format(operation))
+
+        return operation
+    #
+
+    @classmethod
+    def get_process_pool_executor(cls):
+        """
+Returns the process pool executor used for operations of CRUD entity
+instances supporting "process_pool_<operation>". A default process pool is
+created if none has been set.
+
+:param cls: Python class
+
+:return: (object) Process pool executor instance
+:since:  v1.0.0
+        """
+
+        with cls._process_pool_executor_lock:
+            if (cls._process_pool_executor is None):
+                from concurrent.futures import ProcessPoolExecutor
+                cls._process_pool_executor = ProcessPoolExecutor()
+            #
+
+            return cls._process_pool_executor
+        #
+    #
+
+    @classmethod
+    def get_route_cache(cls):
+        """
+Returns the cache of compiled routes. It may be used to read its
+statistics, to change its limits or to clear it after CRUD entity modules
+have been reloaded.
+
+:param cls: Python class
+
+:return: (object) LruCache instance
+:since:  v1.0.0
+        """
+
+        return cls._route_cache
+    #
+
+    def _init_protocol_instance(self, protocol_class, crud_url_elements, route):
         """
 Initializes the protocol instance responsible for routing the CRUD URL
 requests for this instance.
 
+:param protocol_class: CRUD protocol class
 :param crud_url_elements: CRUD URL elements
+:param route: Protocol specific route
 
 :since: v1.0.0
         """
 
-        protocol_class_name = NamedClassLoader.get_camel_case_class_name(self._protocol)
+        self._instance = protocol_class(crud_url_elements = crud_url_elements, route = route)
+    #
 
-        protocol_instance = NamedClassLoader.get_instance_in_namespace("crud", "protocol.{0}".format(protocol_class_name), crud_url_elements = crud_url_elements)
-        if (not isinstance(protocol_instance, Abstract)): raise OperationFailedException("CRUD protocol '{0}' is not supported".format(self._protocol))
+    def iterate(self, operation, **kwargs):
+        """
+Returns an iterator for the items returned or yielded by the given
+operation. Results of generator methods are streamed in constant memory if
+the protocol supports "streaming_calls".
+
+:param operation: CRUD operation
 
-        self._instance = protocol_instance
+:return: (object) Iterator
+:since:  v1.0.0
+        """
+
+        operation = self._get_supported_operation(operation)
+
+        return (self._instance.iterate(operation, **kwargs)
+                if (self._instance.is_supported("streaming_calls")) else
+                Abstract.iterate_result(self.call(operation, **kwargs))
+               )
     #
 
     def is_operation_supported(self, operation):
@@ -213,8 +989,11 @@ Returns true if the operation is defined.
 :since:  v1.0.0
         """
 
-        operation = Binary.str(operation)
-        if (type(operation) is not str): raise OperationNotSupportedException()
+        if (type(operation) is not str):
+            operation = Binary.str(operation)
+            if (type(operation) is not str): raise OperationNotSupportedException()
+        #
+
         operation = operation.lower()
 
         try: _return = (operation in self.__class__.OPERATIONS_SUPPORTED and hasattr(self._instance, operation))
@@ -236,6 +1015,99 @@ Returns true if the feature requested is supported by this instance.
         return self._instance.is_supported(feature)
     #
 
+    @staticmethod
+    def map_file_payload(file_path):
+        """
+Returns a read-only "memoryview" of the given file mapped into memory. It
+may be passed as a binary payload without reading the file into memory.
+Pages are only loaded if accessed.
+
+:param file_path: File path
+
+:return: (object) Read-only memoryview instance
+:since:  v1.0.0
+        """
+
+        from mmap import mmap, ACCESS_READ
+
+        with open(file_path, "rb") as file_obj:
+            _return = (memoryview(b"")
+                       if (file_obj.seek(0, 2) < 1) else
+                       memoryview(mmap(file_obj.fileno(), 0, access = ACCESS_READ))
+                      )
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def preload(cls, crud_urls):
+        """
+Imports and validates the protocol and CRUD entity classes for the given
+CRUD URLs, e.g. "module/instance", ahead of the first request. Compiled
+routes are cached.
+
+:param cls: Python class
+:param crud_urls: List of CRUD URLs
+
+:return: (dict) Dict of Python module names of the protocol and CRUD entity
+         classes (or the CRUD URL if its class could not be imported) and
+         dictionaries with the keys "duration" in seconds spent to import
+         and validate them, "crud_urls" and "exception"
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = { }
+
+        for crud_url in crud_urls:
+            module_name = crud_url
+            started = perf_counter()
+
+            try:
+                crud_url_elements, protocol, protocol_class = cls._get_protocol_class(crud_url)
+                cls._set_preload_timing(_return, protocol_class.__module__, crud_url, perf_counter() - started)
+
+                started = perf_counter()
+                route = protocol_class.compile_route(crud_url_elements)
+
+                route_class = (route[0] if (isinstance(route, tuple) and len(route) > 0) else None)
+                module_name = (route_class.__module__ if (isinstance(route_class, type)) else protocol_class.__module__)
+
+                cls._route_cache.set(crud_url, ( crud_url_elements, protocol, protocol_class, route ))
+                cls._set_preload_timing(_return, module_name, crud_url, perf_counter() - started)
+            except Exception as handled_exception: cls._set_preload_timing(_return, module_name, crud_url, perf_counter() - started, handled_exception)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    async def _raise_fan_out_exception(exception):
+        """
+Raises the given exception of a fan-out branch asynchronously.
+
+:param exception: Exception raised for the branch
+
+:since: v1.0.0
+        """
+
+        raise exception
+    #
+
+    def release(self):
+        """
+Releases resources held by the protocol instance, e.g. pooled CRUD entity
+instances. Resources are released implicitly if this instance is garbage
+collected.
+
+:since: v1.0.0
+        """
+
+        self._instance.release()
+    #
+
     def set_access_control_validator(self, validator):
         """
 Sets the access control validator used for local CRUD entity instances.
@@ -263,4 +1135,43 @@ Sets the callee instance used for pre and post request methods.
         self.context_manager_callee = callee_instance
         return self
     #
+
+    @staticmethod
+    def _set_preload_timing(timings, module_name, crud_url, duration, exception = None):
+        """
+Adds the duration and exception of a CRUD URL preloaded to the timings of
+the given Python module.
+
+:param timings: Dict of Python module names and timings
+:param module_name: Python module name
+:param crud_url: CRUD URL preloaded
+:param duration: Duration in seconds
+:param exception: Exception raised; None on success
+
+:since: v1.0.0
+        """
+
+        timing = timings.setdefault(module_name, { "duration": 0, "crud_urls": [ ], "exception": None })
+
+        timing['duration'] += duration
+        if (crud_url not in timing['crud_urls']): timing['crud_urls'].append(crud_url)
+        if (exception is not None): timing['exception'] = exception
+    #
+
+    @classmethod
+    def set_process_pool_executor(cls, executor):
+        """
+Sets the process pool executor used for operations of CRUD entity instances
+supporting "process_pool_<operation>". Worker processes must be able to
+import the CRUD entity modules.
+
+:param cls: Python class
+:param executor: Process pool executor instance; None to create a default
+                 one on demand
+
+:since: v1.0.0
+        """
+
+        with cls._process_pool_executor_lock: cls._process_pool_executor = executor
+    #
 #
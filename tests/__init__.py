@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/__init__.py
+
+The CRUD entity modules used in tests are provided in the "crud" namespace
+of this package. The module loader resolves "crud" namespace lookups against
+the last matching "sys.path" entry and therefore the engine package and this
+one are linked into a temporary directory appended to it.
+"""
+
+from os import path, symlink
+from tempfile import TemporaryDirectory
+import sys
+
+SRC_PATH = path.join(path.dirname(path.dirname(path.abspath(__file__))), "src")
+"""
+Path of the engine sources tested
+"""
+
+if (SRC_PATH not in sys.path): sys.path.insert(0, SRC_PATH)
+
+import pas_crud_engine # pylint: disable=wrong-import-position
+
+_namespace_directory = TemporaryDirectory()
+"""
+Temporary directory linking the packages providing "crud" namespace modules
+"""
+
+symlink(path.dirname(path.abspath(pas_crud_engine.__file__)), path.join(_namespace_directory.name, "pas_crud_engine"))
+symlink(path.dirname(path.abspath(__file__)), path.join(_namespace_directory.name, __name__))
+sys.path.append(_namespace_directory.name)
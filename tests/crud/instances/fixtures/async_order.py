@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/async_order.py
+"""
+
+from asyncio import sleep
+
+from pas_crud_engine.instances import Abstract
+
+class AsyncOrder(Abstract):
+    """
+"AsyncOrder" provides a native coroutine CRUD method.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    @Abstract.catch_and_wrap_matching_exception
+    async def get(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the order selected asynchronously.
+
+:return: (tuple) Order selector values
+:since:  v1.0.0
+        """
+
+        await sleep(0)
+        if (kwargs.get("fail", False)): raise ValueError("Order failed")
+
+        return ( "async", _select_id, _selected_value )
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the order with the given ID.
+
+:return: (str) Selected ID
+:since:  v1.0.0
+        """
+
+        return _select_id
+    #
+#
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/backend.py
+"""
+
+from time import sleep
+
+from pas_crud_engine.instances import Abstract
+
+class Backend(Abstract):
+    """
+"Backend" returns the backend resource acquired for the call stack.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get(self, _select_id = None, _selected_value = None, duration = 0, **kwargs):
+        """
+Returns the backend resource after blocking for the given duration.
+
+:return: (mixed) Backend resource
+:since:  v1.0.0
+        """
+
+        sleep(duration)
+        return self.backend_resource
+    #
+#
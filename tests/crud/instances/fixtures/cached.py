@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/cached.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+CALLS = [ ]
+"""
+List of tuples of method name and selected ID called
+"""
+
+class Cached(Abstract):
+    """
+"Cached" supports result caching and records the methods executed.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Cached)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.supported_features['result_caching'] = True
+    #
+
+    @Abstract.declare_principal_independent_result
+    def get(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the entry selected.
+
+:return: (dict) Entry data
+:since:  v1.0.0
+        """
+
+        CALLS.append(( "get", _select_id ))
+        return { "id": _select_id, "kwargs": kwargs, "tags": [ "cached" ] }
+    #
+
+    def get_private(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns data of the entry selected not declared to be principal
+independent.
+
+:return: (dict) Entry data
+:since:  v1.0.0
+        """
+
+        CALLS.append(( "get_private", _selected_value ))
+        return { "id": _select_id }
+    #
+
+    @Abstract.declare_principal_independent_result
+    def get_rows(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Yields the rows of the entry selected.
+
+:return: (object) Generator of rows
+:since:  v1.0.0
+        """
+
+        CALLS.append(( "get_rows", _select_id ))
+        for index in range(3): yield index
+    #
+
+    @Abstract.declare_principal_independent_result
+    def get_tags(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the tags of the entry selected.
+
+:return: (list) Entry tags
+:since:  v1.0.0
+        """
+
+        CALLS.append(( "get_tags", _selected_value ))
+        return [ "cached" ]
+    #
+
+    @Abstract.declare_principal_independent_result
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the entry with the given ID.
+
+:return: (str) Selected ID
+:since:  v1.0.0
+        """
+
+        return _select_id
+    #
+
+    def update(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Updates the entry selected.
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        CALLS.append(( "update", _select_id ))
+        return True
+    #
+#
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/dynamic.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+class Dynamic(Abstract):
+    """
+"Dynamic" provides CRUD methods as instance attributes and with
+"__getattr__()" only.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Dynamic)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.get_extra = lambda _select_id = None, _selected_value = None, **kwargs: ( "extra", _selected_value )
+        """
+CRUD method provided by this instance only
+        """
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places (i.e. it is not an instance attribute nor is it found in the
+class tree for self).
+
+:param name: Attribute name
+
+:return: (mixed) Attribute value
+:since:  v1.0.0
+        """
+
+        if (name != "get_magic"): raise AttributeError(name)
+        return lambda _select_id = None, _selected_value = None, **kwargs: ( "magic", _selected_value )
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the given ID.
+
+:return: (str) Selected ID
+:since:  v1.0.0
+        """
+
+        return _select_id
+    #
+#
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/order.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+class Order(Abstract):
+    """
+"Order" returns the selector values and keyword arguments it has been
+called with.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the order selected.
+
+:return: (dict) Order selector values and keyword arguments
+:since:  v1.0.0
+        """
+
+        return { "id": _select_id, "selected_value": _selected_value, "kwargs": kwargs }
+    #
+
+    def get_items(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the order items selected.
+
+:return: (tuple) Order items selector values
+:since:  v1.0.0
+        """
+
+        return ( "items", _select_id, _selected_value )
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the order with the given ID.
+
+:return: (tuple) Selected order
+:since:  v1.0.0
+        """
+
+        return ( "order", _select_id )
+    #
+
+    def select_items(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the items of the order selected.
+
+:return: (list) Selected order items
+:since:  v1.0.0
+        """
+
+        return [ "items", _selected_value, _select_id ]
+    #
+#
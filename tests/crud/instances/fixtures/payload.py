@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/payload.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+class Payload(Abstract):
+    """
+"Payload" receives binary payloads as "memoryview" instances and returns
+them unchanged.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Payload)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.supported_features['zero_copy_payloads'] = True
+    #
+
+    def update(self, _select_id = None, _selected_value = None, data = None, **kwargs):
+        """
+Returns the payload received.
+
+:return: (mixed) Payload received
+:since:  v1.0.0
+        """
+
+        return data
+    #
+#
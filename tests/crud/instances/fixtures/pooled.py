@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/pooled.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+class Pooled(Abstract):
+    """
+"Pooled" is kept in an instance pool and returns the state of the instance
+called.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    INSTANCE_POOL_SIZE = 1
+    """
+Maximum number of idle instances kept for reuse
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Pooled)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.calls = 0
+        """
+Number of calls since the instance has been checked out
+        """
+    #
+
+    def get(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the instance identity and the number of calls since checkout.
+
+:return: (tuple) Instance identity and number of calls
+:since:  v1.0.0
+        """
+
+        self.calls += 1
+        return ( id(self), self.calls )
+    #
+
+    def reset_pooled_instance(self):
+        """
+Resets the state of this instance before it is returned to its instance
+pool.
+
+:since: v1.0.0
+        """
+
+        Abstract.reset_pooled_instance(self)
+        self.calls = 0
+    #
+#
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/report.py
+"""
+
+from pas_crud_engine.instances import Abstract
+
+class Report(Abstract):
+    """
+"Report" yields its rows lazily.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    @Abstract.catch_and_wrap_matching_exception
+    def get(self, _select_id = None, _selected_value = None, count = 3, fail_at = None, **kwargs):
+        """
+Yields the report rows.
+
+:param count: Number of rows
+:param fail_at: Row index raising an exception
+
+:return: (object) Generator of row tuples
+:since:  v1.0.0
+        """
+
+        for index in range(count):
+            if (index == fail_at): raise ValueError("Report row failed")
+            yield ( index, _select_id )
+        #
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the report with the given ID.
+
+:return: (str) Selected ID
+:since:  v1.0.0
+        """
+
+        return _select_id
+    #
+#
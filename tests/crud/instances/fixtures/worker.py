@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/crud/instances/fixtures/worker.py
+"""
+
+from os import getpid
+
+from pas_crud_engine.instances import Abstract
+
+class Worker(Abstract):
+    """
+"Worker" executes "get" operations in a worker process of the process
+pool.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Worker)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.supported_features['process_pool_get'] = True
+    #
+
+    def get(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Returns the process ID of the process executing the call.
+
+:return: (dict) Process ID and keyword arguments
+:since:  v1.0.0
+        """
+
+        return { "pid": getpid(), "kwargs": kwargs }
+    #
+
+    def get_payload(self, _select_id = None, _selected_value = None, size = 0, **kwargs):
+        """
+Returns a binary payload of the given size.
+
+:return: (bytes) Binary payload
+:since:  v1.0.0
+        """
+
+        return bytes(size)
+    #
+
+    def select(self, _select_id = None, _selected_value = None, **kwargs):
+        """
+Selects the entry with the given ID.
+
+:return: (str) Selected ID
+:since:  v1.0.0
+        """
+
+        return _select_id
+    #
+#
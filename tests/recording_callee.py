@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/recording_callee.py
+"""
+
+class RecordingCallee(object):
+    """
+"RecordingCallee" records the "pre_get" and "post_get" calls of
+"CallContext".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(RecordingCallee)
+
+:since: v1.0.0
+        """
+
+        self.calls = [ ]
+        """
+List of tuples of hook names and keyword arguments called with
+        """
+    #
+
+    def get_hook_names(self):
+        """
+Returns the names of the hooks called.
+
+:return: (list) List of hook names
+:since:  v1.0.0
+        """
+
+        return [ call[0] for call in self.calls ]
+    #
+
+    def post_get(self, **kwargs):
+        """
+Records the "post_get" call.
+
+:since: v1.0.0
+        """
+
+        self.calls.append(( "post_get", kwargs ))
+    #
+
+    def pre_get(self):
+        """
+Records the "pre_get" call.
+
+:since: v1.0.0
+        """
+
+        self.calls.append(( "pre_get", { } ))
+    #
+#
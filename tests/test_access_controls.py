@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_access_controls.py
+"""
+
+import unittest
+
+from dpt_runtime.type_exception import TypeException
+
+from pas_crud_engine.access_controls import Abstract, CachingValidator, PermissiveValidator
+from pas_crud_engine.access_denied_exception import AccessDeniedException
+
+class _RecordingValidator(Abstract):
+    """
+Validator denying "delete" operations and recording the operations
+validated.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(_RecordingValidator)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+
+        self.operations = [ ]
+        """
+List of operations validated
+        """
+    #
+
+    def validate(self, crud_instance, operation, **kwargs):
+        """
+Validates the given operation.
+
+:param crud_instance: CRUD entity instance
+:param operation: CRUD operation including module and instance name
+
+:since: v1.0.0
+        """
+
+        self.operations.append(operation)
+        if (operation.endswith(".delete")): raise AccessDeniedException("Operation '{0}' is denied".format(operation))
+    #
+#
+
+class TestAccessControls(unittest.TestCase):
+    """
+Tests the blacklist and decision caching access control validators.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_caching_validator(self):
+        """
+Tests that decisions are cached per principal and can be revoked.
+
+:since: v1.0.0
+        """
+
+        wrapped_validator = _RecordingValidator()
+        validator = CachingValidator(wrapped_validator, lambda crud_instance, **kwargs: kwargs.get("user"))
+        crud_instance = object()
+
+        validator.validate(crud_instance, "fixtures.order.get", user = "a")
+        validator.validate(crud_instance, "fixtures.order.get", user = "a")
+        validator.validate(crud_instance, "fixtures.order.get", user = "b")
+
+        self.assertRaises(AccessDeniedException, validator.validate, crud_instance, "fixtures.order.delete", user = "a")
+        self.assertRaises(AccessDeniedException, validator.validate, crud_instance, "fixtures.order.delete", user = "a")
+
+        self.assertEqual(wrapped_validator.operations, [ "fixtures.order.get", "fixtures.order.get", "fixtures.order.delete" ])
+
+        self.assertEqual(validator.revoke(principal = "a"), 2)
+        validator.validate(crud_instance, "fixtures.order.get", user = "a")
+        self.assertEqual(len(wrapped_validator.operations), 4)
+    #
+
+    def test_caching_validator_principal_required(self):
+        """
+Tests that decisions are not cached without a principal callback.
+
+:since: v1.0.0
+        """
+
+        self.assertRaises(TypeException, CachingValidator, _RecordingValidator(), None)
+        self.assertRaises(TypeException, CachingValidator, object(), lambda crud_instance, **kwargs: None)
+    #
+
+    def test_permissive_validator(self):
+        """
+Tests that exact and wildcard blacklisted operations are denied.
+
+:since: v1.0.0
+        """
+
+        validator = PermissiveValidator()
+        validator.blacklisted_operations = [ "fixtures.order.delete", "fixtures.cached.*" ]
+
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "fixtures.order.delete")
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "fixtures.cached.get")
+
+        validator.validate(object(), "fixtures.order.get")
+        validator.validate(object(), "fixtures.cachedx")
+    #
+
+    def test_permissive_validator_blacklist_immutable(self):
+        """
+Tests that the blacklist can not be changed without recompiling it.
+
+:since: v1.0.0
+        """
+
+        operations = [ "fixtures.order.delete" ]
+
+        validator = PermissiveValidator()
+        validator.blacklisted_operations = operations
+        operations.append("fixtures.order.get")
+
+        self.assertEqual(validator.blacklisted_operations, [ "fixtures.order.delete" ])
+
+        validator.blacklisted_operations.append("fixtures.order.get")
+        self.assertEqual(validator.blacklisted_operations, [ "fixtures.order.delete" ])
+        validator.validate(object(), "fixtures.order.get")
+
+        operations = validator.blacklisted_operations
+        operations.append("fixtures.order.get")
+        validator.blacklisted_operations = operations
+
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "fixtures.order.get")
+        self.assertRaises(TypeException, setattr, validator, "blacklisted_operations", "fixtures.order.get")
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
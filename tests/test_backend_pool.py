@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_backend_pool.py
+"""
+
+from asyncio import ensure_future, gather, sleep, wait_for
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.instances import BackendPool
+from pas_crud_engine.operation_failed_exception import OperationFailedException
+from pas_crud_engine.protocol import Abstract as AbstractProtocol
+
+from .crud.instances.fixtures.backend import Backend
+
+class TestBackendPool(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the checkout of backend resources from "BackendPool".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        self.executor = ThreadPoolExecutor(max_workers = 2)
+        AbstractProtocol.set_executor(self.executor)
+    #
+
+    def tearDown(self):
+        """
+python.org: Method called immediately after the test method has been called
+and the result recorded.
+
+:since: v1.0.0
+        """
+
+        Backend.register_backend_pool(None)
+        AbstractProtocol.set_executor(None)
+
+        self.executor.shutdown()
+    #
+
+    async def test_aacquire_timeout(self):
+        """
+Tests that asynchronous callers give up waiting after the acquire timeout.
+
+:since: v1.0.0
+        """
+
+        pool = BackendPool(object, max_size = 1, acquire_timeout = 0.05)
+        resource = await pool.aacquire()
+
+        with self.assertRaises(OperationFailedException): await pool.aacquire()
+
+        pool.release(resource)
+
+        self.assertIs(await pool.aacquire(), resource)
+        self.assertEqual(pool.statistics['timeouts'], 1)
+    #
+
+    def test_acquire(self):
+        """
+Tests that released resources are reused and broken ones disposed.
+
+:since: v1.0.0
+        """
+
+        disposed = [ ]
+        pool = BackendPool(object, min_size = 1, max_size = 2, health_check = lambda resource: resource not in disposed, dispose = disposed.append)
+
+        resource = pool.acquire()
+        pool.release(resource)
+
+        self.assertIs(pool.acquire(), resource)
+        pool.release(resource, True)
+
+        self.assertEqual(disposed, [ resource ])
+        self.assertIsNot(pool.acquire(), resource)
+
+        statistics = pool.statistics
+
+        self.assertEqual(statistics['created'], 2)
+        self.assertEqual(statistics['disposed'], 1)
+        self.assertEqual(statistics['in_use'], 1)
+    #
+
+    async def test_release_from_thread(self):
+        """
+Tests that asynchronous callers are woken by resources released in other
+threads.
+
+:since: v1.0.0
+        """
+
+        pool = BackendPool(object, max_size = 1)
+        resource = pool.acquire()
+
+        waiter = ensure_future(pool.aacquire())
+        await sleep(0.01)
+
+        Thread(target = pool.release, args = ( resource, )).start()
+        self.assertIs(await wait_for(waiter, 5), resource)
+    #
+
+    async def test_saturated_pool(self):
+        """
+Tests that asynchronous calls waiting for a saturated pool do not hold
+executor threads needed by the calls holding a resource.
+
+:since: v1.0.0
+        """
+
+        pool = BackendPool(object, max_size = 1)
+        Backend.register_backend_pool(pool)
+
+        results = await wait_for(gather(*[ Resource("fixtures/backend/1").acall("get", duration = 0.02) for _ in range(3) ]), 5)
+
+        self.assertEqual(len(set(id(result) for result in results)), 1)
+        self.assertGreaterEqual(pool.statistics['waits'], 1)
+        self.assertEqual(pool.statistics['in_use'], 0)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_call_context.py
+"""
+
+from types import ModuleType
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.protocol import CallContext
+
+from .recording_callee import RecordingCallee
+
+class _DynamicCallee(object):
+    """
+Callee providing its "pre_get" hook with "__getattr__()" only.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(_DynamicCallee)
+
+:since: v1.0.0
+        """
+
+        self.calls = [ ]
+        """
+List of hook names called
+        """
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places (i.e. it is not an instance attribute nor is it found in the
+class tree for self).
+
+:param name: Attribute name
+
+:return: (mixed) Attribute value
+:since:  v1.0.0
+        """
+
+        if (name != "pre_get"): raise AttributeError(name)
+        return lambda: self.calls.append("pre_get")
+    #
+#
+
+class _RaisingCallee(object):
+    """
+Callee raising an exception on any dynamic attribute lookup.
+    """
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places (i.e. it is not an instance attribute nor is it found in the
+class tree for self).
+
+:param name: Attribute name
+
+:return: (mixed) Attribute value
+:since:  v1.0.0
+        """
+
+        raise RuntimeError(name)
+    #
+#
+
+class _SlotsCallee(object):
+    """
+Callee without "__dict__" recording its hook calls.
+    """
+
+    __slots__ = [ "calls" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(_SlotsCallee)
+
+:since: v1.0.0
+        """
+
+        self.calls = [ ]
+        """
+List of hook names called
+        """
+    #
+
+    def post_get(self, **kwargs): self.calls.append("post_get")
+    def pre_get(self): self.calls.append("pre_get")
+#
+
+class TestCallContext(unittest.TestCase):
+    """
+Tests the "pre_*" and "post_*" hook resolution of "CallContext".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_callee_changed(self):
+        """
+Tests that hooks of a callee replacing the previous one are called.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/order/1")
+
+        previous_callee = RecordingCallee()
+        resource.context_manager_callee = previous_callee
+        resource.get()
+
+        callee = RecordingCallee()
+        resource.context_manager_callee = callee
+        resource.get()
+
+        self.assertEqual(previous_callee.get_hook_names(), [ "pre_get", "post_get" ])
+        self.assertEqual(callee.get_hook_names(), [ "pre_get", "post_get" ])
+    #
+
+    def test_exception_passed(self):
+        """
+Tests that exceptions raised are passed to the "post" hook.
+
+:since: v1.0.0
+        """
+
+        callee = RecordingCallee()
+
+        with self.assertRaises(ValueError):
+            with CallContext(callee, "get"): raise ValueError("Call failed")
+        #
+
+        self.assertEqual(callee.calls[-1][1]['exception']['type'], ValueError)
+        self.assertEqual(callee.calls[0][1], { })
+    #
+
+    def test_instance_hooks(self):
+        """
+Tests that hooks provided as instance attributes, with "__getattr__()" and
+by modules are called.
+
+:since: v1.0.0
+        """
+
+        callee = RecordingCallee()
+        callee.pre_get = lambda: callee.calls.append(( "instance_pre_get", { } ))
+
+        with CallContext(callee, "get"): pass
+        self.assertEqual(callee.get_hook_names(), [ "instance_pre_get", "post_get" ])
+
+        dynamic_callee = _DynamicCallee()
+        with CallContext(dynamic_callee, "get"): pass
+        self.assertEqual(dynamic_callee.calls, [ "pre_get" ])
+
+        module_calls = [ ]
+
+        module = ModuleType("callee")
+        module.pre_get = lambda: module_calls.append("pre_get")
+
+        with CallContext(module, "get"): pass
+        self.assertEqual(module_calls, [ "pre_get" ])
+    #
+
+    def test_raising_hook_lookup(self):
+        """
+Tests that exceptions raised while looking up hooks are not passed to the
+caller.
+
+:since: v1.0.0
+        """
+
+        with CallContext(_RaisingCallee(), "get"): pass
+
+        resource = Resource("fixtures/order/1")
+        resource.context_manager_callee = _RaisingCallee()
+
+        self.assertEqual(resource.get()['id'], "1")
+    #
+
+    def test_reused_context(self):
+        """
+Tests that a context may be entered again and without a callee.
+
+:since: v1.0.0
+        """
+
+        callee = _SlotsCallee()
+        call_context = CallContext(callee, "get")
+
+        with call_context:
+            with call_context: pass
+        #
+
+        self.assertEqual(callee.calls, [ "pre_get", "pre_get", "post_get", "post_get" ])
+
+        with CallContext(None, "get"): pass
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
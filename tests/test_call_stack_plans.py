@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_call_stack_plans.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.crud.protocol.x_python_module import XPythonModule
+from pas_crud_engine.operation_not_supported_exception import OperationNotSupportedException
+
+class TestCallStackPlans(unittest.TestCase):
+    """
+Tests the call stack plans compiled by "XPythonModule".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        XPythonModule.get_call_stack_plan_cache().clear()
+    #
+
+    def test_call_stack_plan_cache(self):
+        """
+Tests that call stack plans are shared between resources with different
+selector values.
+
+:since: v1.0.0
+        """
+
+        plan_cache = XPythonModule.get_call_stack_plan_cache()
+
+        for order_id in range(3):
+            self.assertEqual(Resource("fixtures/order/{0:d}/items/7".format(order_id)).get(),
+                             ( "items", "7", ( "order", str(order_id) ) )
+                            )
+        #
+
+        self.assertEqual(len(plan_cache), 1)
+        self.assertEqual(plan_cache.statistics['hits'], 2)
+
+        self.assertEqual(Resource("fixtures/order/1/items").get(), ( "items", None, ( "order", "1" ) ))
+        self.assertEqual(len(plan_cache), 2)
+    #
+
+    def test_call_stack_reused(self):
+        """
+Tests that call stacks are resolved once per resource and operation and
+again after the operation selectors have been changed.
+
+:since: v1.0.0
+        """
+
+        plan_cache = XPythonModule.get_call_stack_plan_cache()
+        resource = Resource("fixtures/order/1/items")
+
+        for _ in range(3): self.assertEqual(resource.get(), ( "items", None, ( "order", "1" ) ))
+        self.assertEqual(plan_cache.statistics['misses'] + plan_cache.statistics['hits'], 1)
+
+        resource._instance.operation_selector_list[0] = "2"
+        self.assertEqual(resource.get(), ( "items", None, ( "order", "2" ) ))
+    #
+
+    def test_call_stack_with_instance_methods(self):
+        """
+Tests that methods provided by the CRUD entity instance only are called and
+not cached as class call stack plans.
+
+:since: v1.0.0
+        """
+
+        self.assertEqual(Resource("fixtures/dynamic/1/extra").get(), ( "extra", "1" ))
+        self.assertEqual(Resource("fixtures/dynamic/1/magic").get(), ( "magic", "1" ))
+        self.assertEqual(len(XPythonModule.get_call_stack_plan_cache()), 0)
+
+        self.assertRaises(OperationNotSupportedException, Resource("fixtures/dynamic/1/unknown").get)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_columnar_backend.py
+"""
+
+from unittest import mock
+import unittest
+
+try: import numpy
+except ImportError: numpy = None
+
+from pas_crud_engine.instances import ColumnarStore, FlatFilterParser
+from pas_crud_engine.instances.filters import PredicateBackend
+from pas_crud_engine.instances.filters import columnar_backend
+
+class TestColumnarBackend(unittest.TestCase):
+    """
+Tests that masks calculated by "ColumnarBackend" match the rows accepted
+by "PredicateBackend".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    COLUMNS = { "mixed": [ "1", "2", "x", 1, None, True ],
+                "number": [ 1, None, 5, 2.5, 7, -3 ],
+                "text": [ "1", "2", "x", "a", "b", "" ]
+              }
+    """
+Columns tested
+    """
+    FILTERS = ( '{"text": [1, "x"]}',
+                '{"text": ["x", "a"]}',
+                '{"text": {">=": "a"}}',
+                '{"text": {">": 1}}',
+                '{"mixed": [1, "x"]}',
+                '{"mixed": {"!=": null}}',
+                '{"number": {">": 2}}',
+                '{"number": {">": 2, "<=": 7}}',
+                '{"number": [1, 7, true]}',
+                '{"number": {"!=": 5}}',
+                '{"number": null}',
+                '{"missing": 1}',
+                '{"|": [{"number": {"<": 0}}, {"text": "x"}]}'
+              )
+    """
+Filters tested
+    """
+
+    def _assert_equivalent(self, columns):
+        """
+Asserts that the masks for the given columns match the rows accepted by
+"PredicateBackend" for all filters tested.
+
+:param columns: Dict of field names and column data
+
+:since: v1.0.0
+        """
+
+        store = ColumnarStore(columns)
+        rows = list(store.iterate_rows())
+
+        for _filter in self.__class__.FILTERS:
+            parser = FlatFilterParser(_filter)
+            predicate = parser.compile(PredicateBackend())
+
+            with self.subTest(_filter = _filter):
+                self.assertEqual([ bool(value) for value in store.filter(parser) ], [ predicate(row) for row in rows ])
+            #
+        #
+    #
+
+    @unittest.skipIf(numpy is None, "NumPy is not available")
+    def test_numpy_arrays(self):
+        """
+Tests masks for columns given as NumPy arrays.
+
+:since: v1.0.0
+        """
+
+        self._assert_equivalent({ "bool": numpy.array([ True, False, True, False, True, False ]),
+                                  "number": numpy.array([ 1.0, 9.0, 5.0, 2.5, 7.0, -3.0 ]),
+                                  "mixed": numpy.array(self.__class__.COLUMNS['mixed'], dtype = object),
+                                  "text": numpy.array(self.__class__.COLUMNS['text'])
+                                })
+
+        store = ColumnarStore({ "bool": numpy.array([ True, False ]), "number": numpy.array([ 1, 2 ]) })
+
+        self.assertEqual(list(store.filter(FlatFilterParser('{"bool": [1]}'))), [ True, False ])
+        self.assertEqual(list(store.filter(FlatFilterParser('{"number": [true, 2.0]}'))), [ True, True ])
+    #
+
+    def test_sequences(self):
+        """
+Tests masks for columns with mixed types and NULL values given as
+sequences.
+
+:since: v1.0.0
+        """
+
+        self._assert_equivalent(self.__class__.COLUMNS)
+    #
+
+    def test_without_numpy(self):
+        """
+Tests masks calculated without NumPy.
+
+:since: v1.0.0
+        """
+
+        with mock.patch.object(columnar_backend, "numpy", None): self._assert_equivalent(self.__class__.COLUMNS)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_filter_normalization.py
+"""
+
+from io import StringIO
+import unittest
+
+from pas_crud_engine.instances import FlatFilterParser
+
+class TestFilterNormalization(unittest.TestCase):
+    """
+Tests the filter normalisation and canonical hashing of "FlatFilterParser".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    EQUIVALENT_FILTERS = ( ( '{"a": 1, "b": 2}', '{"b": 2, "a": 1}' ),
+                           ( '{"a": [1]}', '{"a": 1}' ),
+                           ( '{"a": [3, 1, 3, 2]}', '{"a": [1, 2, 3]}' ),
+                           ( '[{"a": 1}, {"a": 2}, {"b": 1}]', '[{"b": 1}, {"a": [2, 1]}]' ),
+                           ( '{"x": {"y": 1, "z": {"<": 3, ">=": 1}}}', '{"x": {"z": {">=": 1, "<": 3}, "y": 1}}' ),
+                           ( '[{"a": 1, "b": 2}, {"b": 2, "a": 1}]', '{"a": 1, "b": 2}' )
+                         )
+    """
+Pairs of filter definitions matching the same entries
+    """
+
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        FlatFilterParser.invalidate_parsed_filters()
+    #
+
+    def test_blacklisted_keys(self):
+        """
+Tests that blacklisted keys are not part of the normalized hash.
+
+:since: v1.0.0
+        """
+
+        parser = FlatFilterParser('{"a": 1, "secret": 2}')
+        parser.add_blacklisted_key("secret")
+
+        self.assertEqual(parser.normalized_hash, FlatFilterParser('{"a": 1}').normalized_hash)
+        self.assertNotEqual(FlatFilterParser('{"a": 1, "secret": 2}').normalized_hash, parser.normalized_hash)
+    #
+
+    def test_normalized_hash(self):
+        """
+Tests that equivalent filter definitions share their normalized AST and
+hash while value types are distinguished.
+
+:since: v1.0.0
+        """
+
+        for filter_string, equivalent_filter_string in self.__class__.EQUIVALENT_FILTERS:
+            parser = FlatFilterParser(filter_string)
+            equivalent_parser = FlatFilterParser(equivalent_filter_string)
+
+            self.assertEqual(parser.normalized_ast, equivalent_parser.normalized_ast, filter_string)
+            self.assertEqual(parser.normalized_hash, equivalent_parser.normalized_hash, filter_string)
+        #
+
+        self.assertNotEqual(FlatFilterParser('{"a": 1}').normalized_hash, FlatFilterParser('{"a": "1"}').normalized_hash)
+        self.assertNotEqual(FlatFilterParser('{"a": 1}').normalized_hash, FlatFilterParser('{"a": true}').normalized_hash)
+
+        self.assertEqual(FlatFilterParser(StringIO('{"b": [2, 1], "a": 1}')).normalized_hash,
+                         FlatFilterParser('{"a": 1, "b": [1, 2]}').normalized_hash
+                        )
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_filter_optimizer.py
+"""
+
+from itertools import product
+import unittest
+
+from pas_crud_engine.instances import Abstract, FlatFilterParser
+from pas_crud_engine.instances.filters import FilterOptimizer, PredicateBackend, SqlBackend
+
+class TestFilterOptimizer(unittest.TestCase):
+    """
+Tests the selectivity based reordering and contradiction detection of
+"FilterOptimizer".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    FIELD_STATISTICS = { "id": { "cardinality": 100000, "is_indexed": True },
+                         "status": { "cardinality": 3 },
+                         "name": { "cardinality": 50000 }
+                       }
+    """
+Field statistics used for the optimizer tested
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        self.optimizer = FilterOptimizer(self.__class__.FIELD_STATISTICS)
+        """
+Filter optimizer tested
+        """
+    #
+
+    def test_contradictions(self):
+        """
+Tests that filters matching nothing are detected.
+
+:since: v1.0.0
+        """
+
+        for filter_string in ( '[{"a": {">": 5, "<": 3}}, {"a": {">=": 3, "<": 3}}]',
+                               '{"a": {"=": 1, "!=": 1}}',
+                               '{"a": []}',
+                               '{"status": "open", "x": {"a": {">=": 3, "<": 3}}}'
+                             ):
+            self.assertTrue(FilterOptimizer.is_matching_nothing(FlatFilterParser(filter_string).get_optimized_ast(self.optimizer)), filter_string)
+        #
+
+        self.assertFalse(FilterOptimizer.is_matching_nothing(FlatFilterParser('{"a": {"=": 1, ">": "x"}}').get_optimized_ast(self.optimizer)))
+
+        parser = FlatFilterParser('{"status": "open", "x": {"a": {">=": 3, "<": 3}}}')
+
+        self.assertEqual(parser.compile(SqlBackend(), self.optimizer), ( "1 = 0", ( ) ))
+        self.assertFalse(parser.compile(PredicateBackend(), self.optimizer)({ "status": "open" }))
+    #
+
+    def test_equivalence(self):
+        """
+Tests that optimized filters match the same entries as the original ones.
+
+:since: v1.0.0
+        """
+
+        entries = [ { "id": entry_id, "status": status, "name": name, "x": { "a": value } }
+                    for entry_id, status, name, value in product(( 1, 5 ), ( "open", "closed" ), ( "x", "y" ), ( 1, 3, 6 ))
+                  ]
+
+        backend = PredicateBackend()
+
+        for filter_string in ( '{"status": "open", "name": "x", "id": 5}',
+                               '{"id": [1, 5], "x": {"a": {">": 2}}}',
+                               '[{"x": {"a": {">": 5, "<": 3}}}, {"name": "y"}]',
+                               '[{"status": "open"}, {"status": "closed", "id": 1}]',
+                               '{"x": {"a": {">=": 1, "<": 6, "!=": 3}}}',
+                               '{"id": [1, 2, 3], "x": {"a": 1}}'
+                             ):
+            parser = FlatFilterParser(filter_string)
+
+            predicate = backend.compile(parser.ast)
+            optimized_predicate = backend.compile(parser.get_optimized_ast(self.optimizer))
+
+            self.assertEqual([ predicate(entry) for entry in entries ], [ optimized_predicate(entry) for entry in entries ], filter_string)
+        #
+    #
+
+    def test_estimate(self):
+        """
+Tests that estimates are based on the field statistics given.
+
+:since: v1.0.0
+        """
+
+        indexed_estimate = self.optimizer.get_estimate(FlatFilterParser('{"id": 1}').ast)
+        unindexed_estimate = self.optimizer.get_estimate(FlatFilterParser('{"status": "open"}').ast)
+
+        self.assertLess(indexed_estimate[0], unindexed_estimate[0])
+        self.assertLess(indexed_estimate[1], unindexed_estimate[1])
+    #
+
+    def test_registration(self):
+        """
+Tests that optimizers registered are only supported by the CRUD entity
+class given.
+
+:since: v1.0.0
+        """
+
+        optimized_class = type("OptimizedEntity", ( Abstract, ), { })
+        optimized_class.register_filter_optimizer(self.optimizer)
+
+        self.assertTrue(optimized_class().is_supported("filter_optimization"))
+        self.assertFalse(Abstract().is_supported("filter_optimization"))
+    #
+
+    def test_reordering(self):
+        """
+Tests that the most selective conditions are evaluated first.
+
+:since: v1.0.0
+        """
+
+        optimized_ast = FlatFilterParser('{"status": "open", "name": "x", "id": 5}').get_optimized_ast(self.optimizer)
+
+        self.assertEqual([ child.field for child in optimized_ast.children ], [ "id", "name", "status" ])
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
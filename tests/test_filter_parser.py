@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_filter_parser.py
+"""
+
+import unittest
+
+from pas_crud_engine.input_validation_exception import InputValidationException
+from pas_crud_engine.instances import FlatFilterParser
+from pas_crud_engine.instances.filters import PredicateBackend, SqlBackend
+
+class TestFilterParser(unittest.TestCase):
+    """
+Tests the filter AST compilation of "FlatFilterParser".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_backends(self):
+        """
+Tests that the filter AST is compiled to predicates and SQL.
+
+:since: v1.0.0
+        """
+
+        parser = FlatFilterParser('{"a": 1, "b": {"c": [1, 2, null]}, "d": {">=": 2, "<": 5, "!=": 3}}')
+
+        predicate = parser.compile(PredicateBackend())
+
+        self.assertTrue(predicate({ "a": 1, "b": { "c": None }, "d": 4 }))
+        self.assertFalse(predicate({ "a": 1, "b": { "c": 2 }, "d": 3 }))
+        self.assertFalse(predicate({ "a": "1", "b": { "c": 2 }, "d": 4 }))
+
+        self.assertEqual(FlatFilterParser('{"a": 1, "b": {">=": 2}}').compile(SqlBackend()), ( '("a" = ? AND "b" >= ?)', ( 1, 2 ) ))
+    #
+
+    def test_blacklisted_keys(self):
+        """
+Tests that values of blacklisted keys are dropped.
+
+:since: v1.0.0
+        """
+
+        parser = FlatFilterParser('{"a": 1, "secret": 2}')
+        parser.add_blacklisted_key("secret")
+
+        self.assertEqual(parser.filter, { "a": 1, "secret": None })
+        self.assertEqual(FlatFilterParser('{"a": 1, "secret": 2}').filter, { "a": 1, "secret": 2 })
+    #
+
+    def test_invalid_filter(self):
+        """
+Tests that filter definitions without conditions are rejected.
+
+:since: v1.0.0
+        """
+
+        with self.assertRaises(InputValidationException): FlatFilterParser("[1, 2]").ast
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
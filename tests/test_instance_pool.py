@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_instance_pool.py
+"""
+
+from time import sleep
+import unittest
+
+from dpt_runtime.value_exception import ValueException
+
+from pas_crud_engine import Resource
+from pas_crud_engine.instances import InstancePool
+
+from .crud.instances.fixtures.pooled import Pooled
+
+class _FailingResetInstance(object):
+    """
+Instance failing to be reset for reuse.
+    """
+
+    def reset_pooled_instance(self): raise ValueError("Reset failed")
+#
+
+class TestInstancePool(unittest.TestCase):
+    """
+Tests the reuse of CRUD entity instances by "InstancePool".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_checkout(self):
+        """
+Tests that instances checked in are reset and reused.
+
+:since: v1.0.0
+        """
+
+        pool = InstancePool(Pooled, 1)
+
+        instance = pool.checkout()
+        instance.get()
+        second_instance = pool.checkout()
+
+        pool.checkin(instance)
+        pool.checkin(second_instance)
+
+        self.assertEqual(len(pool), 1)
+        self.assertIs(pool.checkout(), instance)
+        self.assertEqual(instance.calls, 0)
+
+        statistics = pool.statistics
+
+        self.assertEqual(statistics['created'], 2)
+        self.assertEqual(statistics['reused'], 1)
+        self.assertEqual(statistics['discarded'], 1)
+        self.assertEqual(statistics['in_use'], 1)
+        self.assertEqual(statistics['peak_in_use'], 2)
+    #
+
+    def test_failing_reset_discarded(self):
+        """
+Tests that instances failing to be reset are not reused.
+
+:since: v1.0.0
+        """
+
+        pool = InstancePool(_FailingResetInstance)
+        pool.checkin(pool.checkout())
+
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.statistics['discarded'], 1)
+    #
+
+    def test_idle_eviction(self):
+        """
+Tests that idle instances are evicted after the idle timeout.
+
+:since: v1.0.0
+        """
+
+        pool = InstancePool(Pooled, idle_timeout = 0.01)
+        instance = pool.checkout()
+
+        pool.checkin(instance)
+        sleep(0.02)
+
+        self.assertIsNot(pool.checkout(), instance)
+        self.assertEqual(pool.statistics['evictions'], 1)
+
+        self.assertRaises(ValueException, InstancePool, Pooled, 0)
+        self.assertRaises(ValueException, InstancePool, Pooled, idle_timeout = 0)
+    #
+
+    def test_resource_release(self):
+        """
+Tests that resources released return their CRUD entity instance to the
+pool of the class.
+
+:since: v1.0.0
+        """
+
+        Pooled.get_instance_pool().clear()
+
+        resource = Resource("fixtures/pooled/1")
+        instance_id, calls = resource.get()
+        resource.release()
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(Resource("fixtures/pooled/2").get(), ( instance_id, 1 ))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_instrumentation.py
+"""
+
+import unittest
+
+from dpt_runtime.value_exception import ValueException
+
+from pas_crud_engine import Resource
+from pas_crud_engine.instrumentation import Instrumentation
+from pas_crud_engine.latency_histogram import LatencyHistogram
+
+class TestInstrumentation(unittest.TestCase):
+    """
+Tests the latency histograms and metrics collected by "Instrumentation".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.reset()
+    #
+
+    def tearDown(self):
+        """
+python.org: Method called immediately after the test method has been called
+and the result recorded.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.disable()
+        Instrumentation.reset()
+    #
+
+    def test_disabled(self):
+        """
+Tests that no metrics are collected if instrumentation is disabled.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.disable()
+        Resource("fixtures/order/1").get()
+
+        self.assertFalse(Instrumentation.is_enabled())
+        self.assertEqual(Instrumentation.get_snapshot(), [ ])
+    #
+
+    def test_histogram(self):
+        """
+Tests the buckets, percentiles and merging of "LatencyHistogram".
+
+:since: v1.0.0
+        """
+
+        histogram = LatencyHistogram(2)
+        for value in range(1, 9): histogram.record(value)
+
+        self.assertEqual(len(histogram), 8)
+        self.assertEqual(histogram.min, 1)
+        self.assertEqual(histogram.max, 8)
+        self.assertEqual(histogram.mean, 4.5)
+        self.assertEqual(histogram.get_percentile(50), 4)
+        self.assertEqual(histogram.get_percentile(100), 8)
+
+        histogram.record(1000)
+        self.assertGreaterEqual(histogram.get_percentile(100), 1000 * 3 // 4)
+        self.assertLessEqual(histogram.get_percentile(100), 1000)
+
+        merged_histogram = LatencyHistogram(2)
+        merged_histogram.merge(histogram)
+
+        self.assertEqual(merged_histogram.snapshot, histogram.snapshot)
+        self.assertRaises(ValueException, merged_histogram.merge, LatencyHistogram(3))
+        self.assertRaises(ValueException, histogram.get_percentile, 101)
+        self.assertIsNone(LatencyHistogram().get_percentile(50))
+    #
+
+    def test_record(self):
+        """
+Tests that calls, errors and latencies are recorded per metric key.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.enable()
+        key = ( "module", "instance", "get", "step" )
+
+        Instrumentation.record(key, 10)
+        Instrumentation.record(key, 30, True)
+        self.assertRaises(ValueError, Instrumentation.call, key, int, "invalid")
+
+        metrics = Instrumentation.get_snapshot(True)
+
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(( metrics[0]['module'], metrics[0]['instance'], metrics[0]['operation'], metrics[0]['step'] ), key)
+        self.assertEqual(metrics[0]['count'], 3)
+        self.assertEqual(metrics[0]['errors'], 2)
+        self.assertEqual(metrics[0]['latency_ns']['count'], 3)
+        self.assertEqual(metrics[0]['latency_ns']['min'], 10)
+
+        self.assertEqual(Instrumentation.get_snapshot(), [ ])
+        self.assertRaises(ValueException, Instrumentation.enable, 17)
+    #
+
+    def test_resource_call(self):
+        """
+Tests that resource calls and entity methods called are recorded.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.enable()
+        Resource("fixtures/order/1").get()
+
+        steps = { metric['step']: metric for metric in Instrumentation.get_snapshot() }
+
+        self.assertIn("call", steps)
+        self.assertIn("get", steps)
+        self.assertEqual(( steps['get']['module'], steps['get']['instance'], steps['get']['operation'] ), ( "fixtures", "order", "get" ))
+        self.assertEqual(steps['call']['count'], 1)
+        self.assertGreaterEqual(steps['call']['latency_ns']['p50'], steps['get']['latency_ns']['p50'])
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
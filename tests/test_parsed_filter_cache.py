@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_parsed_filter_cache.py
+"""
+
+import unittest
+
+from pas_crud_engine.instances import FlatFilterParser
+
+class TestParsedFilterCache(unittest.TestCase):
+    """
+Tests the process-wide cache of parsed filters of "FlatFilterParser".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        FlatFilterParser.invalidate_parsed_filters()
+    #
+
+    def test_parsed_filter_cache(self):
+        """
+Tests that parsed filters are cached and each parser returns its own
+mutable copy.
+
+:since: v1.0.0
+        """
+
+        filter_string = '{"a": {"b": ["x", {"c": null}]}, "d": 1.5}'
+
+        filter_data = FlatFilterParser(filter_string).filter
+        self.assertEqual(filter_data, { "a": { "b": [ "x", { "c": None } ] }, "d": 1.5 })
+
+        filter_data['a']['b'].append("y")
+        filter_data['e'] = 1
+
+        cached_filter_data = FlatFilterParser(filter_string).filter
+
+        self.assertEqual(cached_filter_data, { "a": { "b": [ "x", { "c": None } ] }, "d": 1.5 })
+        self.assertIs(type(cached_filter_data['a']), dict)
+        self.assertIs(type(cached_filter_data['a']['b']), list)
+
+        self.assertEqual(len(FlatFilterParser.get_parsed_filter_cache()), 1)
+        self.assertEqual(FlatFilterParser.invalidate_parsed_filters(filter_string), 1)
+    #
+
+    def test_parsed_filter_cache_with_scalar_lists(self):
+        """
+Tests that parsed filters containing immutable values are copied as well.
+
+:since: v1.0.0
+        """
+
+        filter_string = '{"id": [1, 2], "a": {"b": ["x", 1]}}'
+
+        filter_data = FlatFilterParser(filter_string).filter
+        filter_data['a']['b'].append("y")
+
+        cached_filter_data = FlatFilterParser(filter_string).filter
+
+        self.assertEqual(cached_filter_data['a'], { "b": [ "x", 1 ] })
+        self.assertIs(type(cached_filter_data['a']['b']), list)
+        self.assertEqual(cached_filter_data['id'], [ 1, 2 ])
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
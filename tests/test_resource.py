@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.operation_failed_exception import OperationFailedException
+from pas_crud_engine.operation_not_supported_exception import OperationNotSupportedException
+
+class TestResource(unittest.TestCase):
+    """
+Tests the CRUD URL route compilation of "Resource".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        Resource.get_route_cache().clear()
+    #
+
+    def test_preload(self):
+        """
+Tests that routes are compiled ahead of the first request and timings are
+reported per Python module.
+
+:since: v1.0.0
+        """
+
+        crud_urls = [ "fixtures/order/1", "fixtures/order/2", "fixtures/nothing" ]
+        route_cache = Resource.get_route_cache()
+
+        timings = Resource.preload(crud_urls)
+
+        self.assertEqual(len(route_cache), 2)
+
+        _, _, protocol_class, route = route_cache.get("fixtures/order/1")
+
+        self.assertEqual(timings[protocol_class.__module__]['crud_urls'], crud_urls)
+        self.assertEqual(timings[route[0].__module__]['crud_urls'], crud_urls[:2])
+        self.assertIsNone(timings[route[0].__module__]['exception'])
+        self.assertGreaterEqual(timings[route[0].__module__]['duration'], 0)
+        self.assertIsInstance(timings['fixtures/nothing']['exception'], OperationNotSupportedException)
+    #
+
+    def test_route_cache(self):
+        """
+Tests that compiled routes are cached for identical CRUD URLs.
+
+:since: v1.0.0
+        """
+
+        route_cache = Resource.get_route_cache()
+
+        Resource("fixtures/order/1")
+        resource = Resource("fixtures/order/1")
+
+        self.assertEqual(len(route_cache), 1)
+        self.assertEqual(route_cache.statistics['hits'], 1)
+        self.assertEqual(resource.get(a = 1), { "id": "1", "selected_value": None, "kwargs": { "a": 1 } })
+    #
+
+    def test_route_errors(self):
+        """
+Tests that unsupported protocols, entities and operations are reported.
+
+:since: v1.0.0
+        """
+
+        self.assertRaises(OperationFailedException, Resource, "foo-bar://fixtures/order")
+        self.assertRaises(OperationNotSupportedException, Resource, "fixtures/nothing")
+        self.assertRaises(OperationNotSupportedException, Resource("fixtures/order/1/2/3").get)
+        self.assertRaises(OperationNotSupportedException, Resource("fixtures/order/1").delete)
+
+        self.assertTrue(Resource("fixtures/order/1").is_operation_supported("get"))
+        self.assertFalse(Resource("fixtures/order/1").is_operation_supported("delete"))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_async.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.input_validation_exception import InputValidationException
+
+class TestResourceAsync(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the native asynchronous execution of "Resource".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    async def test_acall(self):
+        """
+Tests that coroutine and synchronous CRUD methods are executed with
+"acall()".
+
+:since: v1.0.0
+        """
+
+        self.assertEqual(await Resource("fixtures/async_order/5").acall("get"), ( "async", "5", None ))
+        self.assertEqual((await Resource("fixtures/order/5").acall("get", a = 1))['kwargs'], { "a": 1 })
+
+        with self.assertRaises(InputValidationException): await Resource("fixtures/async_order/5").acall("get", fail = True)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
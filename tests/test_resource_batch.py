@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_batch.py
+"""
+
+import unittest
+
+from pas_crud_engine import Instrumentation, Resource
+from pas_crud_engine.operation_not_supported_exception import OperationNotSupportedException
+
+class TestResourceBatch(unittest.TestCase):
+    """
+Tests the batch operation API of "Resource".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_batch(self):
+        """
+Tests that failed operations of a batch are reported without aborting it.
+
+:since: v1.0.0
+        """
+
+        results = Resource("fixtures/order/3").batch([ ( "get", { "a": 1 } ), ( "delete", { } ), ( "get", { } ) ])
+
+        self.assertEqual([ result['operation'] for result in results ], [ "get", "delete", "get" ])
+        self.assertEqual(results[0]['result']['kwargs'], { "a": 1 })
+        self.assertIsInstance(results[1]['exception'], OperationNotSupportedException)
+        self.assertIsNone(results[2]['exception'])
+    #
+
+    def test_call_many(self):
+        """
+Tests that "call_many()" executes the operation for each keyword arguments
+dictionary given.
+
+:since: v1.0.0
+        """
+
+        results = Resource("fixtures/order/3").call_many("GET", [ { "a": 1 }, { "a": 2 } ])
+
+        self.assertEqual([ result['result']['kwargs'] for result in results ], [ { "a": 1 }, { "a": 2 } ])
+        self.assertEqual([ result['exception'] for result in results ], [ None, None ])
+    #
+
+    def test_instrumentation(self):
+        """
+Tests that batches and "call_many()" are recorded by the resource
+instrumentation.
+
+:since: v1.0.0
+        """
+
+        Instrumentation.reset()
+        Instrumentation.enable()
+
+        try:
+            resource = Resource("fixtures/order/3")
+
+            resource.call_many("get", [ { "a": 1 }, { "a": 2 } ])
+            resource.batch([ ( "get", { } ), ( "get", { } ) ])
+
+            metrics = Instrumentation.get_snapshot(True)
+        finally: Instrumentation.disable()
+
+        self.assertEqual([ ( metric['instance'], metric['operation'], metric['count'] ) for metric in metrics if metric['step'] == "call_many" ],
+                         [ ( "order", "get", 2 ) ]
+                        )
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
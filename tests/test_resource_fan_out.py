@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_fan_out.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.operation_not_supported_exception import OperationNotSupportedException
+
+class TestResourceFanOut(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the concurrent fan-out execution of sibling resource branches.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    async def test_afan_out(self):
+        """
+Tests that failed branches of "afan_out()" are reported without aborting
+the other ones.
+
+:since: v1.0.0
+        """
+
+        results = await Resource("fixtures/order/1").afan_out("get", { "self": "", "items": "items", "invalid": "unknown/1" })
+
+        self.assertEqual(results['self']['result']['id'], "1")
+        self.assertEqual(results['items']['result'], ( "items", None, ( "order", "1" ) ))
+        self.assertIsInstance(results['invalid']['exception'], OperationNotSupportedException)
+    #
+
+    def test_fan_out(self):
+        """
+Tests that "fan_out()" executes each branch with the keyword arguments given
+and reports failed ones.
+
+:since: v1.0.0
+        """
+
+        results = Resource("fixtures/order/1").fan_out("get", { "self": "", "items": "items", "invalid": "unknown/1" }, a = 1)
+
+        self.assertEqual(results['self']['result']['kwargs'], { "a": 1 })
+        self.assertIsNone(results['self']['exception'])
+        self.assertEqual(results['items']['result'], ( "items", None, ( "order", "1" ) ))
+        self.assertIsNone(results['invalid']['result'])
+        self.assertIsInstance(results['invalid']['exception'], OperationNotSupportedException)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_process_pool.py
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from os import getpid
+import unittest
+
+from pas_crud_engine import Resource
+
+class TestResourceProcessPool(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the execution of operations supporting "process_pool_<operation>" in
+worker processes.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+python.org: A class method called before tests in an individual class are
+run.
+
+:param cls: Python class
+
+:since: v1.0.0
+        """
+
+        Resource.set_process_pool_executor(ProcessPoolExecutor(1))
+    #
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+python.org: A class method called after tests in an individual class have
+run.
+
+:param cls: Python class
+
+:since: v1.0.0
+        """
+
+        Resource.get_process_pool_executor().shutdown()
+        Resource.set_process_pool_executor(None)
+    #
+
+    async def test_acall(self):
+        """
+Tests that asynchronous calls are executed in a worker process.
+
+:since: v1.0.0
+        """
+
+        result = await Resource("fixtures/worker/1").acall("get", a = 1)
+
+        self.assertNotEqual(result['pid'], getpid())
+        self.assertEqual(result['kwargs'], { "a": 1 })
+    #
+
+    def test_call(self):
+        """
+Tests that calls are executed in a worker process and that internal keyword
+arguments and binary views are not passed as is.
+
+:since: v1.0.0
+        """
+
+        result = Resource("fixtures/worker/1").get(a = 1, _internal = 2, data = memoryview(b"data"))
+
+        self.assertNotEqual(result['pid'], getpid())
+        self.assertEqual(result['kwargs'], { "a": 1, "data": b"data" })
+
+        self.assertEqual(Resource("fixtures/order/1").get()['id'], "1")
+    #
+
+    def test_call_many(self):
+        """
+Tests that items of batches are executed in worker processes.
+
+:since: v1.0.0
+        """
+
+        results = Resource("fixtures/worker/1").batch([ ( "get", { "a": 1 } ), ( "get", { "a": 2 } ) ])
+
+        self.assertEqual([ result['exception'] for result in results ], [ None, None ])
+        self.assertEqual([ result['result']['kwargs'] for result in results ], [ { "a": 1 }, { "a": 2 } ])
+        self.assertNotIn(getpid(), [ result['result']['pid'] for result in results ])
+    #
+
+    def test_shared_memory_result(self):
+        """
+Tests that large binary results are returned in shared memory and small
+ones pickled.
+
+:since: v1.0.0
+        """
+
+        size = Resource.SHARED_MEMORY_RESULT_MIN_SIZE
+
+        self.assertEqual(Resource("fixtures/worker/1/payload").get(size = size), bytes(size))
+        self.assertEqual(Resource("fixtures/worker/1/payload").get(size = 4), bytes(4))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
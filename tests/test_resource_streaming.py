@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_streaming.py
+"""
+
+from itertools import islice
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.input_validation_exception import InputValidationException
+
+from .recording_callee import RecordingCallee
+
+class TestResourceStreaming(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the streaming of generator results by "Resource".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    async def test_aiterate(self):
+        """
+Tests that generator and single results are iterated asynchronously.
+
+:since: v1.0.0
+        """
+
+        self.assertEqual([ row async for row in Resource("fixtures/report/2").aiterate("get", count = 3) ],
+                         [ ( 0, "2" ), ( 1, "2" ), ( 2, "2" ) ]
+                        )
+
+        self.assertEqual(len([ result async for result in Resource("fixtures/order/1").aiterate("get") ]), 1)
+    #
+
+    def test_iterate(self):
+        """
+Tests that generator results are consumed lazily and wrapped on failure.
+
+:since: v1.0.0
+        """
+
+        callee = RecordingCallee()
+        resource = Resource("fixtures/report/1").set_context_manager_callee(callee)
+
+        self.assertEqual(list(islice(resource.iterate("get", count = 10 ** 9), 2)), [ ( 0, "1" ), ( 1, "1" ) ])
+
+        self.assertEqual(list(resource.iterate("get", count = 2)), [ ( 0, "1" ), ( 1, "1" ) ])
+        self.assertEqual(callee.get_hook_names()[-2:], [ "pre_get", "post_get" ])
+
+        with self.assertRaises(InputValidationException): list(resource.iterate("get", fail_at = 1))
+        self.assertEqual(list(Resource("fixtures/order/1").iterate("get"))[0]['id'], "1")
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_resource_templates.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+
+class TestResourceTemplates(unittest.TestCase):
+    """
+Tests resource templates with per-call selector IDs.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_template_selector_ids(self):
+        """
+Tests that selector IDs of resource templates are given per call.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/order/{id}")
+
+        self.assertEqual(resource.get(id = 3)['id'], 3)
+        self.assertEqual(resource.get(id = 4)['id'], 4)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
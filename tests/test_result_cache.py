@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_result_cache.py
+"""
+
+import unittest
+
+from pas_crud_engine import Resource
+from pas_crud_engine.access_controls import PermissiveValidator
+from pas_crud_engine.access_denied_exception import AccessDeniedException
+from pas_crud_engine.crud.protocol.x_python_module import XPythonModule
+
+from .crud.instances.fixtures import cached
+from .recording_callee import RecordingCallee
+
+class TestResultCache(unittest.IsolatedAsyncioTestCase):
+    """
+Tests the read-through result cache of CRUD entities supporting
+"result_caching".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+python.org: Method called to prepare the test fixture.
+
+:since: v1.0.0
+        """
+
+        XPythonModule.get_result_cache().clear()
+        del(cached.CALLS[:])
+    #
+
+    async def test_acall_cached(self):
+        """
+Tests that results cached are shared between synchronous and asynchronous
+calls.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1")
+
+        self.assertEqual(resource.get(a = 1), await resource.acall("get", a = 1))
+        self.assertEqual(cached.CALLS, [ ( "get", "1" ) ])
+    #
+
+    def test_cached_result_access_validated(self):
+        """
+Tests that access to results cached is validated again.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1")
+        resource.get(a = 1)
+
+        validator = PermissiveValidator()
+        validator.blacklisted_operations = [ "fixtures.cached.get" ]
+        resource.access_control_validator = validator
+
+        self.assertRaises(AccessDeniedException, resource.get, a = 1)
+    #
+
+    def test_cached_result_copies(self):
+        """
+Tests that results are cached per keyword arguments and returned as copies.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1")
+
+        result = resource.get(a = 1)
+        result['tags'].append("modified")
+
+        self.assertEqual(resource.get(a = 1)['tags'], [ "cached" ])
+        self.assertEqual(len(cached.CALLS), 1)
+
+        resource.get(a = 2)
+        self.assertEqual(len(cached.CALLS), 2)
+    #
+
+    def test_cached_result_hooks(self):
+        """
+Tests that callee hooks are called for results cached.
+
+:since: v1.0.0
+        """
+
+        callee = RecordingCallee()
+        resource = Resource("fixtures/cached/1").set_context_manager_callee(callee)
+
+        resource.get()
+        resource.get()
+
+        self.assertEqual(len(cached.CALLS), 1)
+        self.assertEqual(callee.get_hook_names(), [ "pre_get", "post_get", "pre_get", "post_get" ])
+    #
+
+    def test_generator_results_not_cached(self):
+        """
+Tests that generator results are not cached.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1/rows")
+
+        self.assertEqual(list(resource.get()), [ 0, 1, 2 ])
+        self.assertEqual(list(resource.get()), [ 0, 1, 2 ])
+        self.assertEqual(len(cached.CALLS), 2)
+    #
+
+    def test_principal_dependent_results_not_cached(self):
+        """
+Tests that results of methods not declared to be principal independent are
+not cached.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1/private")
+
+        resource.get()
+        resource.get()
+
+        self.assertEqual(cached.CALLS, [ ( "get_private", "1" ), ( "get_private", "1" ) ])
+    #
+
+    def test_write_invalidation(self):
+        """
+Tests that write operations invalidate results cached for the entity.
+
+:since: v1.0.0
+        """
+
+        resource = Resource("fixtures/cached/1")
+
+        resource.get()
+        resource.update()
+        resource.get()
+
+        self.assertEqual(cached.CALLS, [ ( "get", "1" ), ( "update", "1" ), ( "get", "1" ) ])
+    #
+
+    def test_write_invalidation_paths(self):
+        """
+Tests that write operations invalidate results cached for paths below and
+above the entity path only.
+
+:since: v1.0.0
+        """
+
+        for entity_id in ( "1", "2" ):
+            Resource("fixtures/cached/{0}".format(entity_id)).get()
+            Resource("fixtures/cached/{0}/tags".format(entity_id)).get()
+        #
+
+        Resource("fixtures/cached/1").update()
+        del(cached.CALLS[:])
+
+        for entity_id in ( "1", "2" ):
+            Resource("fixtures/cached/{0}".format(entity_id)).get()
+            Resource("fixtures/cached/{0}/tags".format(entity_id)).get()
+        #
+
+        self.assertEqual(cached.CALLS, [ ( "get", "1" ), ( "get_tags", "1" ) ])
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_rules_validator.py
+"""
+
+import unittest
+
+from dpt_runtime.type_exception import TypeException
+
+from pas_crud_engine.access_controls import RulesValidator
+from pas_crud_engine.access_denied_exception import AccessDeniedException
+
+class TestRulesValidator(unittest.TestCase):
+    """
+Tests the pattern compiled operation rules of "RulesValidator".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_rules_validator(self):
+        """
+Tests that the matching rule with the highest priority decides.
+
+:since: v1.0.0
+        """
+
+        validator = RulesValidator([ { "pattern": "fixtures.**", "effect": "allow" },
+                                     { "pattern": "fixtures.order.*.delete", "effect": "deny", "priority": 10 },
+                                     { "pattern": "fixtures.order.admin.delete", "effect": "allow", "priority": 20 },
+                                     { "pattern": "admin.**.purge", "effect": "deny" }
+                                   ])
+
+        validator.validate(object(), "fixtures.order.get")
+        validator.validate(object(), "fixtures.order.admin.delete")
+
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "fixtures.order.entry.delete")
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "admin.a.b.purge")
+        self.assertRaises(AccessDeniedException, validator.validate, object(), "other.get")
+
+        self.assertEqual(validator.get_matching_rule("fixtures.order.entry.delete")['priority'], 10)
+        self.assertIsNone(validator.get_matching_rule("other.get"))
+    #
+
+    def test_rules_validator_invalid_rules(self):
+        """
+Tests that invalid rules are rejected.
+
+:since: v1.0.0
+        """
+
+        self.assertRaises(TypeException, RulesValidator, [ { "pattern": 1 } ])
+        self.assertRaises(TypeException, RulesValidator, { "pattern": "**" })
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_scalar_or_list.py
+"""
+
+from array import array
+import unittest
+
+from pas_crud_engine.instances import FlatFilterParser, ScalarOrList
+
+class TestScalarOrList(unittest.TestCase):
+    """
+Tests the compact "or" concatenated scalar lists of "ScalarOrList".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_compact_numbers(self):
+        """
+Tests that numbers are stored compactly and iterated in the order given.
+
+:since: v1.0.0
+        """
+
+        values = ScalarOrList([ 5, 1, 3 ])
+
+        self.assertTrue(values.is_compact)
+        self.assertEqual(list(values), [ 5, 1, 3 ])
+        self.assertEqual(values[0], 5)
+        self.assertEqual(values[1:], ( 1, 3 ))
+        self.assertEqual(len(values), 3)
+
+        self.assertIn(3, values)
+        self.assertNotIn(2, values)
+        self.assertNotIn("3", values)
+
+        self.assertTrue(ScalarOrList(array("d", [ 2.5, 1.5 ])).is_compact)
+        self.assertIn(1.5, ScalarOrList([ 2.5, 1.5 ]))
+    #
+
+    def test_equality(self):
+        """
+Tests that values compare equal to lists, tuples and other instances in the
+same order.
+
+:since: v1.0.0
+        """
+
+        self.assertEqual(ScalarOrList([ 1, 2 ]), [ 1, 2 ])
+        self.assertEqual(ScalarOrList([ 1, 2 ]), ( 1, 2 ))
+        self.assertEqual(ScalarOrList([ 1, 2 ]), ScalarOrList(array("q", [ 1, 2 ])))
+        self.assertNotEqual(ScalarOrList([ 1, 2 ]), [ 2, 1 ])
+        self.assertEqual(hash(ScalarOrList([ "a", "b" ])), hash(ScalarOrList([ "a", "b" ])))
+    #
+
+    def test_filter_representation(self):
+        """
+Tests that "FlatFilterParser" represents scalar lists of the same type only
+as "ScalarOrList".
+
+:since: v1.0.0
+        """
+
+        filter_data = FlatFilterParser('{"id": [3, 1, 2], "name": ["a", "b"], "mixed": [1, "a"]}').filter
+
+        self.assertIsInstance(filter_data['id'], ScalarOrList)
+        self.assertIsInstance(filter_data['name'], ScalarOrList)
+        self.assertNotIsInstance(filter_data['mixed'], ScalarOrList)
+        self.assertIn(2, filter_data['id'])
+    #
+
+    def test_set_backed_values(self):
+        """
+Tests that values not stored compactly are tested against a set.
+
+:since: v1.0.0
+        """
+
+        values = ScalarOrList([ "b", "a" ])
+
+        self.assertFalse(values.is_compact)
+        self.assertIn("a", values)
+        self.assertNotIn("c", values)
+
+        self.assertFalse(ScalarOrList([ 1, 2 ** 64 ]).is_compact)
+        self.assertIn(2 ** 64, ScalarOrList([ 1, 2 ** 64 ]))
+
+        self.assertTrue(ScalarOrList.is_supported([ True, False ]))
+        self.assertFalse(ScalarOrList.is_supported([ 1, "a" ]))
+        self.assertFalse(ScalarOrList.is_supported([ None ]))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_streaming_filter_decoder.py
+"""
+
+from array import array
+from io import BytesIO
+import json
+import unittest
+
+from pas_crud_engine.input_validation_exception import InputValidationException
+from pas_crud_engine.instances.streaming_filter_decoder import StreamingFilterDecoder
+
+class TestStreamingFilterDecoder(unittest.TestCase):
+    """
+Tests the incremental JSON filter decoding of "StreamingFilterDecoder".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    JSON_DOCUMENTS = ( '{"a": 1, "b": [1, 2, 3], "c": {"d": [1.5, 2.5], "e": ["x", "y\\n\\u00e4"]}, "f": [true, null], "g": [], "h": {}}',
+                       '[{"a": 1}, {"b": [ -5 , 0, 9223372036854775807, 9223372036854775808 ]}]',
+                       '{"a": [1, 2.5], "b": -1.5e3, "c": "\\"q\\""}',
+                       ' {"x" : [ 1 ,2 ] } '
+                     )
+    """
+JSON documents decoded in chunks of different sizes
+    """
+
+    def test_chunked_decoding(self):
+        """
+Tests that documents fed in chunks of any size are decoded like "json"
+does.
+
+:since: v1.0.0
+        """
+
+        for json_document in self.__class__.JSON_DOCUMENTS:
+            for chunk_size in ( 1, 2, 3, 7, 1000 ):
+                decoder = StreamingFilterDecoder()
+
+                for offset in range(0, len(json_document), chunk_size):
+                    decoder.feed(json_document[offset:offset + chunk_size].encode("utf-8"))
+                #
+
+                self.assertEqual(json.loads(json.dumps(decoder.close(), default = list)),
+                                 json.loads(json_document),
+                                 "{0!r} in chunks of {1:d}".format(json_document, chunk_size)
+                                )
+            #
+        #
+    #
+
+    def test_compact_scalar_lists(self):
+        """
+Tests that numeric lists are decoded as "array" instances unless mixed or
+out of range.
+
+:since: v1.0.0
+        """
+
+        data = StreamingFilterDecoder.decode(BytesIO(b'{"a": [3, 1, 2], "b": [1.5, 2.5], "c": [1, 2.5], "d": ["x"], "e": [1, 9223372036854775808]}'))
+
+        self.assertEqual(data['a'], array("q", [ 3, 1, 2 ]))
+        self.assertEqual(data['b'], array("d", [ 1.5, 2.5 ]))
+        self.assertEqual(data['c'], [ 1, 2.5 ])
+        self.assertEqual(data['d'], [ "x" ])
+        self.assertEqual(data['e'], [ 1, 9223372036854775808 ])
+    #
+
+    def test_invalid_documents(self):
+        """
+Tests that invalid documents are rejected.
+
+:since: v1.0.0
+        """
+
+        for json_document in ( '{"a": 1,}', '[1 2]', '{"a" 1}', '{"a": tru}', '{} x', '[1,]', '{"a": [1}', '"x"', '{"a":', '["a\\u00"]', '{"a\\x": 1}' ):
+            self.assertRaises(InputValidationException, StreamingFilterDecoder.decode, json_document)
+        #
+
+        self.assertIsNone(StreamingFilterDecoder.decode(""))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
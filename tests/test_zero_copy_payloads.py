@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;crud_engine
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_zero_copy_payloads.py
+"""
+
+from tempfile import NamedTemporaryFile
+import unittest
+
+from pas_crud_engine import Resource
+
+class TestZeroCopyPayloads(unittest.TestCase):
+    """
+Tests that binary payloads are passed to CRUD entity instances supporting
+"zero_copy_payloads" as read-only views.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: crud_engine
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_mapped_file_payload(self):
+        """
+Tests that mapped files are passed as read-only views of the file.
+
+:since: v1.0.0
+        """
+
+        with NamedTemporaryFile() as file_obj:
+            file_obj.write(b"payload")
+            file_obj.flush()
+
+            payload = Resource.map_file_payload(file_obj.name)
+            result = Resource("fixtures/payload/1").update(data = payload)
+
+            self.assertIsInstance(result, memoryview)
+            self.assertTrue(result.readonly)
+            self.assertEqual(bytes(result), b"payload")
+
+            result.release()
+            payload.release()
+        #
+
+        with NamedTemporaryFile() as file_obj: self.assertEqual(bytes(Resource.map_file_payload(file_obj.name)), b"")
+    #
+
+    def test_payload_views(self):
+        """
+Tests that binary payloads are passed as views without copies while other
+values and unsupported instances are passed unchanged.
+
+:since: v1.0.0
+        """
+
+        payload = bytearray(b"payload")
+        result = Resource("fixtures/payload/1").update(data = payload)
+
+        self.assertIsInstance(result, memoryview)
+        self.assertTrue(result.readonly)
+
+        payload[0:1] = b"P"
+        self.assertEqual(bytes(result), b"Payload")
+
+        self.assertEqual(Resource("fixtures/payload/1").update(data = "text"), "text")
+        self.assertIs(Resource("fixtures/order/1").get(data = payload)['kwargs']['data'], payload)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()